@@ -0,0 +1,278 @@
+"""Lossless optimization of assets referenced by qrc files before they are compiled.
+
+SVG files are minified by removing comments, editor metadata and formatting whitespace,
+PNG files are recompressed with the highest zlib compression level.
+Both are pure python, so no external tools are needed.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
+from xml.dom import XMLNS_NAMESPACE
+from xml.dom import minidom
+from xml.parsers.expat import ExpatError
+
+from qt_dev_helper.cache import hash_content
+from qt_dev_helper.qrc import QrcEntry
+from qt_dev_helper.qrc import read_qrc
+from qt_dev_helper.qrc import write_qrc
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Changing the optimizations needs a new version, to invalidate cached results
+OPTIMIZER_VERSION = "1"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+EDITOR_NAMESPACES: set[str | None] = {
+    "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+    "http://www.inkscape.org/namespaces/inkscape",
+    "http://www.bohemiancoding.com/sketch/ns",
+    "http://ns.adobe.com/AdobeIllustrator/10.0/",
+    "http://ns.adobe.com/AdobeSVGViewerExtensions/3.0/",
+    "http://ns.adobe.com/Extensibility/1.0/",
+    "http://ns.adobe.com/Flows/1.0/",
+    "http://ns.adobe.com/GenericCustomNamespace/1.0/",
+    "http://ns.adobe.com/Graphs/1.0/",
+    "http://ns.adobe.com/ImageReplacement/1.0/",
+    "http://ns.adobe.com/SaveForWeb/1.0/",
+    "http://ns.adobe.com/Variables/1.0/",
+    "http://ns.adobe.com/XPath/1.0/",
+    "http://purl.org/dc/elements/1.1/",
+    "http://creativecommons.org/ns#",
+    "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+}
+SVG_TEXT_ELEMENTS = {"text", "tspan", "textPath", "title", "desc", "style", "script"}
+
+
+def _minify_svg_node(node: minidom.Document | minidom.Element) -> None:
+    """Remove comments, metadata and formatting whitespace from ``node`` and its children.
+
+    Parameters
+    ----------
+    node : minidom.Document | minidom.Element
+        Node to minify in place.
+    """
+    if isinstance(node, minidom.Element):
+        for (namespace, local_name), value in list(node.attributes.itemsNS()):
+            if namespace in EDITOR_NAMESPACES or (
+                namespace == XMLNS_NAMESPACE and value in EDITOR_NAMESPACES
+            ):
+                node.removeAttributeNS(namespace, local_name)
+    keep_whitespace = node.localName in SVG_TEXT_ELEMENTS
+    children: list[Any] = list(node.childNodes)
+    for child in children:
+        if isinstance(child, minidom.Element):
+            if child.namespaceURI in EDITOR_NAMESPACES or child.localName == "metadata":
+                node.removeChild(child)
+            else:
+                _minify_svg_node(child)
+        elif not isinstance(child, minidom.Text) or (not keep_whitespace and child.data.isspace()):
+            # Comments, processing instructions, doctype and formatting whitespace
+            node.removeChild(child)
+
+
+def minify_svg(data: bytes) -> bytes:
+    """Minify an SVG file without changing how it is rendered.
+
+    Removes comments, processing instructions, the doctype, ``metadata`` elements,
+    elements and attributes of editors (e.g. Inkscape, Illustrator, Sketch) and
+    whitespace between elements, except inside of text elements.
+
+    Parameters
+    ----------
+    data : bytes
+        Content of the SVG file.
+
+    Returns
+    -------
+    bytes
+        Minified content or ``data`` if it can not be parsed or minification does not help.
+    """
+    try:
+        document = minidom.parseString(data)
+    except ExpatError:
+        return data
+    _minify_svg_node(document)
+    minified = cast("minidom.Element", document.documentElement).toxml().encode("utf8")
+    return minified if len(minified) < len(data) else data
+
+
+def _png_chunk(chunk_type: bytes, chunk_data: bytes) -> bytes:
+    """Create a PNG chunk.
+
+    Parameters
+    ----------
+    chunk_type : bytes
+        Four letter chunk type.
+    chunk_data : bytes
+        Data of the chunk.
+
+    Returns
+    -------
+    bytes
+        Chunk with length and checksum.
+    """
+    checksum = zlib.crc32(chunk_type + chunk_data)
+    return (
+        struct.pack(">I", len(chunk_data)) + chunk_type + chunk_data + struct.pack(">I", checksum)
+    )
+
+
+def recompress_png(data: bytes) -> bytes:
+    """Losslessly recompress the image data (IDAT chunks) of a PNG file.
+
+    The image data are compressed with the highest zlib level using the default
+    and the filtered strategy and merged into a single IDAT chunk, if this is smaller.
+    All other chunks are kept unchanged.
+
+    Parameters
+    ----------
+    data : bytes
+        Content of the PNG file.
+
+    Returns
+    -------
+    bytes
+        Recompressed content or ``data`` if it is not a valid PNG or recompression does not help.
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        return data
+    chunks: list[tuple[bytes, bytes]] = []
+    image_data: list[bytes] = []
+    position = len(PNG_SIGNATURE)
+    while position + 8 <= len(data):
+        (length,) = struct.unpack(">I", data[position : position + 4])
+        chunk_type = data[position + 4 : position + 8]
+        chunk_data = data[position + 8 : position + 8 + length]
+        position += length + 12
+        if chunk_type == b"IDAT":
+            if len(image_data) == 0:
+                chunks.append((b"IDAT", b""))
+            image_data.append(chunk_data)
+        else:
+            chunks.append((chunk_type, chunk_data))
+    try:
+        raw_image_data = zlib.decompress(b"".join(image_data))
+    except zlib.error:
+        return data
+    compressed_candidates = []
+    for strategy in (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+        compressed_candidates.append(compressor.compress(raw_image_data) + compressor.flush())
+    compressed = min(compressed_candidates, key=len)
+    recompressed = PNG_SIGNATURE + b"".join(
+        _png_chunk(chunk_type, compressed if chunk_type == b"IDAT" else chunk_data)
+        for chunk_type, chunk_data in chunks
+    )
+    return recompressed if len(recompressed) < len(data) else data
+
+
+ASSET_OPTIMIZERS: dict[str, Callable[[bytes], bytes]] = {
+    ".svg": minify_svg,
+    ".png": recompress_png,
+}
+
+
+@dataclass
+class OptimizedAsset:
+    """Result of optimizing an asset."""
+
+    source: Path
+    optimized: Path
+    original_size: int
+    optimized_size: int
+    cached: bool
+
+    @property
+    def saved_size(self) -> int:
+        """Number of bytes saved by the optimization.
+
+        Returns
+        -------
+        int
+            Saved bytes.
+        """
+        return self.original_size - self.optimized_size
+
+
+class AssetOptimizer:
+    """Optimize assets and cache the results by content hash.
+
+    Parameters
+    ----------
+    cache_folder : Path
+        Folder to save optimized assets to.
+    """
+
+    def __init__(self, cache_folder: Path) -> None:
+        self.cache_folder = Path(cache_folder)
+        self.results: dict[Path, OptimizedAsset] = {}
+
+    def optimize_file(self, source: Path) -> OptimizedAsset | None:
+        """Optimize ``source``, reusing the result of previous optimizations of the same content.
+
+        Parameters
+        ----------
+        source : Path
+            Asset to optimize.
+
+        Returns
+        -------
+        OptimizedAsset | None
+            Optimization result or None if there is no optimizer for the file type.
+        """
+        optimizer = ASSET_OPTIMIZERS.get(source.suffix.lower())
+        if optimizer is None or not source.is_file():
+            return None
+        if source not in self.results:
+            data = source.read_bytes()
+            content_hash = hash_content(OPTIMIZER_VERSION, source.suffix.lower(), data)
+            optimized = self.cache_folder / f"{content_hash}{source.suffix.lower()}"
+            cached = optimized.is_file()
+            if cached is False:
+                self.cache_folder.mkdir(parents=True, exist_ok=True)
+                optimized.write_bytes(optimizer(data))
+            self.results[source] = OptimizedAsset(
+                source, optimized, len(data), optimized.stat().st_size, cached
+            )
+        return self.results[source]
+
+    def optimize_qrc(self, qrc_file: Path, output_qrc_file: Path) -> Path:
+        """Write a qrc file referencing the optimized assets of ``qrc_file``.
+
+        Parameters
+        ----------
+        qrc_file : Path
+            Qrc file referencing the original assets.
+        output_qrc_file : Path
+            Path to write the qrc file referencing the optimized assets to.
+
+        Returns
+        -------
+        Path
+            Path to the written qrc file.
+        """
+        entries = []
+        for entry in read_qrc(qrc_file):
+            result = self.optimize_file(entry.file)
+            if result is not None and result.saved_size > 0:
+                entry = QrcEntry(
+                    entry.prefix, entry.alias, result.optimized, entry.lang, entry.attributes
+                )
+            entries.append(entry)
+        return write_qrc(entries, output_qrc_file)
+
+    def clear_unused(self) -> None:
+        """Remove optimized assets from the cache, which were not used since creation."""
+        used_files = {result.optimized for result in self.results.values()}
+        if not self.cache_folder.is_dir():
+            return
+        for cached_file in self.cache_folder.iterdir():
+            if cached_file.is_file() and cached_file not in used_files:
+                cached_file.unlink()
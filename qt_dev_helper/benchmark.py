@@ -0,0 +1,873 @@
+"""Runtime benchmarks of generated assets using an offscreen Qt application.
+
+The benchmarks require ``PySide6`` to be installed, since the code generated by
+``uic`` and ``rcc`` is imported and executed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import marshal
+import os
+import py_compile
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from contextlib import suppress
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from qt_dev_helper.config import Config
+from qt_dev_helper.config import QtDevHelperConfigError
+from qt_dev_helper.config import load_config
+from qt_dev_helper.qss_minifier import QssRule
+from qt_dev_helper.qss_minifier import parse_qss
+from qt_dev_helper.transpiler import resource_output_paths
+from qt_dev_helper.transpiler import ui_output_paths
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+    from types import ModuleType
+
+GENERATED_PACKAGE_NAME = "_qt_dev_helper_generated"
+# Resource modules register their data with Qt without copying it,
+# so replaced modules need to be kept alive to not free registered data.
+_REPLACED_MODULES: list[ModuleType] = []
+
+
+def _import_qt_widgets() -> ModuleType:
+    """Import ``PySide6.QtWidgets`` with a helpful error message if it is missing.
+
+    Returns
+    -------
+    ModuleType
+        The ``PySide6.QtWidgets`` module.
+
+    Raises
+    ------
+    ImportError
+        If PySide6 is not installed.
+    """
+    try:
+        return importlib.import_module("PySide6.QtWidgets")
+    except ImportError as error:
+        msg = (
+            "Running benchmarks requires PySide6 to be installed.\n"
+            "Install qt-dev-helper with the pyside6 extras e.g.:\n"
+            "`pip install qt-dev-helper[pyside6]`"
+        )
+        raise ImportError(msg) from error
+
+
+def get_qapplication() -> Any:
+    """Get the running ``QApplication`` or create one using the ``offscreen`` platform.
+
+    Returns
+    -------
+    Any
+        ``QApplication`` instance.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    qt_widgets = _import_qt_widgets()
+    return qt_widgets.QApplication.instance() or qt_widgets.QApplication([])
+
+
+@contextmanager
+def _extended_sys_path(paths: Sequence[Path]) -> Iterator[None]:
+    """Temporarily prepend ``paths`` to ``sys.path``.
+
+    Parameters
+    ----------
+    paths : Sequence[Path]
+        Paths to prepend.
+
+    Yields
+    ------
+    None
+        Nothing, ``sys.path`` is restored on exit.
+    """
+    original_sys_path = list(sys.path)
+    sys.path[:0] = [str(path) for path in paths]
+    try:
+        yield
+    finally:
+        sys.path[:] = original_sys_path
+
+
+def _generated_module_name(module_file: Path, search_paths: Sequence[Path]) -> str:
+    """Create the synthetic package spanning ``search_paths`` and name ``module_file`` in it.
+
+    Parameters
+    ----------
+    module_file : Path
+        Path to the generated python file.
+    search_paths : Sequence[Path]
+        Folders containing generated code, ``module_file`` needs to be inside of one of them.
+
+    Returns
+    -------
+    str
+        Full name of the module inside of the synthetic package.
+
+    Raises
+    ------
+    ValueError
+        If ``module_file`` is not inside of any of ``search_paths``.
+    """
+    module_file = Path(module_file).resolve()
+    search_paths = list(dict.fromkeys(Path(path).resolve() for path in search_paths))
+    for search_path in search_paths:
+        if module_file.is_relative_to(search_path):
+            rel_module_path = module_file.relative_to(search_path).with_suffix("")
+            break
+    else:
+        msg = f"{module_file.as_posix()!r} is not inside of any of the search paths."
+        raise ValueError(msg)
+
+    package_spec = importlib.util.spec_from_loader(GENERATED_PACKAGE_NAME, None, is_package=True)
+    package = importlib.util.module_from_spec(package_spec)  # type:ignore[arg-type]
+    package.__path__ = [str(path) for path in search_paths]
+    sys.modules[GENERATED_PACKAGE_NAME] = package
+    return ".".join((GENERATED_PACKAGE_NAME, *rel_module_path.parts))
+
+
+def _drop_generated_modules() -> list[ModuleType]:
+    """Remove the modules of the synthetic package from ``sys.modules``.
+
+    Returns
+    -------
+    list[ModuleType]
+        Removed modules.
+    """
+    return [
+        sys.modules.pop(loaded_name)
+        for loaded_name in list(sys.modules)
+        if loaded_name.startswith(f"{GENERATED_PACKAGE_NAME}.")
+    ]
+
+
+def import_generated_module(module_file: Path, search_paths: Sequence[Path]) -> ModuleType:
+    """Import a module generated by ``uic`` or ``rcc``.
+
+    The module is imported as part of a synthetic package spanning ``search_paths``,
+    so relative imports of generated resource modules (``--from-imports``) and
+    absolute imports (``--no-from-imports``) are both resolved.
+    If the module was already imported it is imported again.
+
+    Parameters
+    ----------
+    module_file : Path
+        Path to the generated python file.
+    search_paths : Sequence[Path]
+        Folders containing generated code, ``module_file`` needs to be inside of one of them.
+
+    Returns
+    -------
+    ModuleType
+        Imported module.
+
+    Raises
+    ------
+    ValueError
+        If ``module_file`` is not inside of any of ``search_paths``.
+    """
+    module_name = _generated_module_name(module_file, search_paths)
+    _REPLACED_MODULES.extend(_drop_generated_modules())
+    with _extended_sys_path(search_paths):
+        return importlib.import_module(module_name)
+
+
+def _root_widget_class_name(ui_file: Path) -> str:
+    """Read the class name of the root widget of a form from its ui file.
+
+    Parameters
+    ----------
+    ui_file : Path
+        Path to the ui file.
+
+    Returns
+    -------
+    str
+        Class name of the root widget, ``QWidget`` if it is not defined.
+    """
+    root_widget = ET.parse(ui_file).getroot().find("widget")
+    if root_widget is None:
+        return "QWidget"
+    return root_widget.get("class", "QWidget")
+
+
+@dataclass
+class UiForm:
+    """Form class generated from a ui file and the class of its root widget."""
+
+    ui_file: Path
+    form_class: type
+    widget_class_name: str
+    import_time: float = 0.0
+
+    def create_root_widget(self) -> Any:
+        """Create an empty root widget the form can be set up on.
+
+        Custom root widget classes, which are not part of ``QtWidgets``,
+        are replaced with ``QWidget``.
+
+        Returns
+        -------
+        Any
+            Root widget of the form.
+        """
+        qt_widgets = _import_qt_widgets()
+        return getattr(qt_widgets, self.widget_class_name, qt_widgets.QWidget)()
+
+    def create(self) -> Any:
+        """Create the root widget and set up the form on it.
+
+        Returns
+        -------
+        Any
+            Root widget of the form.
+        """
+        widget = self.create_root_widget()
+        self.form_class().setupUi(widget)
+        return widget
+
+
+def _find_form_class(module: ModuleType) -> type:
+    """Find the form class defined in a module generated by ``uic``.
+
+    Parameters
+    ----------
+    module : ModuleType
+        Generated module.
+
+    Returns
+    -------
+    type
+        Form class.
+
+    Raises
+    ------
+    ValueError
+        If the module does not define a form class.
+    """
+    for name, value in vars(module).items():
+        if name.startswith("Ui_") and isinstance(value, type) and hasattr(value, "setupUi"):
+            return value
+    msg = f"Module {module.__name__!r} does not define a form class."
+    raise ValueError(msg)
+
+
+def load_ui_forms(config: Config, *, recurse_folder: bool = True) -> list[UiForm]:
+    """Import the form classes generated from all ui files of a project.
+
+    Parameters
+    ----------
+    config : Config
+        Configuration of the project.
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+
+    Returns
+    -------
+    list[UiForm]
+        Generated forms, with the time it took to import their module.
+
+    Raises
+    ------
+    QtDevHelperConfigError
+        If the ui code is not generated as python code.
+    FileNotFoundError
+        If the code for a ui file was not generated.
+    """
+    if config.generator.value != "python":
+        msg = "Benchmarking forms requires the 'python' generator."
+        raise QtDevHelperConfigError(msg)
+    ui_files_folder, generated_ui_code_folder = config.ui_folder_paths()
+    search_paths = [generated_ui_code_folder]
+    with suppress(QtDevHelperConfigError):
+        search_paths.append(config.rc_folder_paths()[1])
+    forms = []
+    for ui_file, module_file in ui_output_paths(
+        ui_files_folder,
+        generated_ui_code_folder,
+        flatten_path=config.flatten_folder_structure,
+        recurse_folder=recurse_folder,
+        collision_policy=config.output_collision_policy.value,
+    ):
+        if not module_file.is_file():
+            msg = (
+                f"Generated code for {ui_file.as_posix()!r} does not exist, "
+                "build the assets before running benchmarks."
+            )
+            raise FileNotFoundError(msg)
+        start = time.perf_counter()
+        module = import_generated_module(module_file, search_paths)
+        import_time = time.perf_counter() - start
+        forms.append(
+            UiForm(
+                ui_file,
+                _find_form_class(module),
+                _root_widget_class_name(ui_file),
+                import_time,
+            )
+        )
+    return forms
+
+
+def _best_time(function: Callable[[], float], repeat: int) -> float:
+    """Run a timing function ``repeat`` times and return the fastest result.
+
+    Parameters
+    ----------
+    function : Callable[[], float]
+        Function returning a duration in seconds.
+    repeat : int
+        Number of repetitions.
+
+    Returns
+    -------
+    float
+        Minimal duration in seconds.
+    """
+    return min(function() for _ in range(max(repeat, 1)))
+
+
+@dataclass
+class QssBenchmarkResult:
+    """Timings of applying a stylesheet in seconds (minimum of all repetitions)."""
+
+    parse_time: float
+    polish_time: float
+    baseline_polish_time: float
+    widget_count: int
+    selector_costs: dict[str, float] = field(default_factory=dict)
+
+    def most_expensive_selectors(self, count: int | None = None) -> list[tuple[str, float]]:
+        """Selectors sorted by their estimated cost, most expensive first.
+
+        Parameters
+        ----------
+        count : int | None
+            Maximal number of selectors to return, all if None. Defaults to None
+
+        Returns
+        -------
+        list[tuple[str, float]]
+            Selectors and their estimated polish cost in seconds.
+        """
+        return sorted(self.selector_costs.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+def benchmark_qss(
+    qss: str,
+    forms: Sequence[UiForm],
+    *,
+    repeat: int = 3,
+    selector_costs: bool = True,
+) -> QssBenchmarkResult:
+    """Measure how long it takes Qt to parse ``qss`` and polish the widgets of ``forms``.
+
+    The parse time is measured by applying the stylesheet to the application and
+    polishing a single widget, which forces Qt to parse the stylesheet.
+    The cost of a selector is estimated by applying its rule on its own and comparing
+    the polish time of all forms to the polish time without stylesheet.
+
+    Parameters
+    ----------
+    qss : str
+        Qss stylesheet to apply to the application.
+    forms : Sequence[UiForm]
+        Forms which are instantiated and polished.
+    repeat : int
+        Number of times each measurement is repeated. Defaults to 3
+    selector_costs : bool
+        Whether or not to estimate the cost of each selector. Defaults to True
+
+    Returns
+    -------
+    QssBenchmarkResult
+        Measured timings.
+    """
+    app = get_qapplication()
+    qt_widgets = _import_qt_widgets()
+    original_stylesheet = app.styleSheet()
+
+    def time_parse() -> float:
+        app.setStyleSheet("")
+        start = time.perf_counter()
+        app.setStyleSheet(qss)
+        qt_widgets.QWidget().ensurePolished()
+        return time.perf_counter() - start
+
+    def time_polish() -> float:
+        widgets = [form.create() for form in forms]
+        start = time.perf_counter()
+        for widget in widgets:
+            widget.ensurePolished()
+            for child in widget.findChildren(qt_widgets.QWidget):
+                child.ensurePolished()
+        return time.perf_counter() - start
+
+    try:
+        parse_time = _best_time(time_parse, repeat)
+        polish_time = _best_time(time_polish, repeat)
+        widgets = [form.create() for form in forms]
+        widget_count = sum(len(widget.findChildren(qt_widgets.QWidget)) + 1 for widget in widgets)
+        app.setStyleSheet("")
+        baseline_polish_time = _best_time(time_polish, repeat)
+        result = QssBenchmarkResult(parse_time, polish_time, baseline_polish_time, widget_count)
+        if selector_costs is True:
+            for item in parse_qss(qss):
+                if not isinstance(item, QssRule):
+                    continue
+                app.setStyleSheet(item.to_qss())
+                cost = _best_time(time_polish, repeat) - baseline_polish_time
+                result.selector_costs[item.selector] = (
+                    result.selector_costs.get(item.selector, 0) + cost
+                )
+    finally:
+        app.setStyleSheet(original_stylesheet)
+    return result
+
+
+def benchmark_config_qss(
+    config: Config | str | Path,
+    qss_file: Path | None = None,
+    *,
+    repeat: int = 3,
+    selector_costs: bool = True,
+    recurse_folder: bool = True,
+) -> QssBenchmarkResult:
+    """Benchmark a compiled stylesheet of a project using its generated forms.
+
+    Parameters
+    ----------
+    config : Config | str | Path
+        Configuration of the project.
+        If a path is passed it will try to find the config.
+    qss_file : Path | None
+        Stylesheet to benchmark, the ``root_qss_file`` of ``config`` if None. Defaults to None
+    repeat : int
+        Number of times each measurement is repeated. Defaults to 3
+    selector_costs : bool
+        Whether or not to estimate the cost of each selector. Defaults to True
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+
+    Returns
+    -------
+    QssBenchmarkResult
+        Measured timings.
+    """
+    if not isinstance(config, Config):
+        config = load_config(config)
+    if qss_file is None:
+        qss_file = config.root_style_paths()[1]
+    get_qapplication()
+    try:
+        forms = load_ui_forms(config, recurse_folder=recurse_folder)
+    except QtDevHelperConfigError:
+        forms = []
+    return benchmark_qss(
+        Path(qss_file).read_text(encoding="utf8"),
+        forms,
+        repeat=repeat,
+        selector_costs=selector_costs,
+    )
+
+
+@dataclass
+class UiBenchmarkResult:
+    """Timings in seconds and memory usage in bytes of importing and setting up a form."""
+
+    import_time: float
+    setup_ui_times: list[float]
+    peak_memory: int
+
+    def to_dict(self) -> dict[str, float]:
+        """Summarize the result as JSON serializable dict.
+
+        Returns
+        -------
+        dict[str, float]
+            Import time, minimal, mean and maximal ``setupUi`` time and peak memory.
+        """
+        return {
+            "import_time": self.import_time,
+            "setup_ui_min": min(self.setup_ui_times),
+            "setup_ui_mean": statistics.mean(self.setup_ui_times),
+            "setup_ui_max": max(self.setup_ui_times),
+            "peak_memory": self.peak_memory,
+        }
+
+
+def benchmark_ui_form(form: UiForm, *, repeat: int = 10) -> UiBenchmarkResult:
+    """Measure how long it takes to run ``setupUi`` of ``form`` on a fresh root widget.
+
+    The peak memory is traced in an additional run, so tracing does not
+    distort the timings. It only contains memory allocated by Python,
+    memory allocated by Qt internally is not traced.
+
+    Parameters
+    ----------
+    form : UiForm
+        Form to benchmark.
+    repeat : int
+        Number of times ``setupUi`` is run. Defaults to 10
+
+    Returns
+    -------
+    UiBenchmarkResult
+        Measured timings and memory usage.
+    """
+    get_qapplication()
+    setup_ui_times = []
+    for _ in range(max(repeat, 1)):
+        widget = form.create_root_widget()
+        start = time.perf_counter()
+        form.form_class().setupUi(widget)
+        setup_ui_times.append(time.perf_counter() - start)
+        widget.deleteLater()
+
+    widget = form.create_root_widget()
+    tracemalloc.start()
+    try:
+        form.form_class().setupUi(widget)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    widget.deleteLater()
+    return UiBenchmarkResult(form.import_time, setup_ui_times, peak_memory)
+
+
+def benchmark_config_uis(
+    config: Config | str | Path,
+    *,
+    repeat: int = 10,
+    recurse_folder: bool = True,
+) -> dict[str, UiBenchmarkResult]:
+    """Benchmark all forms generated from the ui files of a project.
+
+    Parameters
+    ----------
+    config : Config | str | Path
+        Configuration of the project.
+        If a path is passed it will try to find the config.
+    repeat : int
+        Number of times ``setupUi`` is run for each form. Defaults to 10
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+
+    Returns
+    -------
+    dict[str, UiBenchmarkResult]
+        Results by path of the ui file relative to ``ui_files_folder``.
+    """
+    if not isinstance(config, Config):
+        config = load_config(config)
+    ui_files_folder = config.ui_folder_paths()[0]
+    get_qapplication()
+    return {
+        form.ui_file.relative_to(ui_files_folder).as_posix(): benchmark_ui_form(
+            form, repeat=repeat
+        )
+        for form in load_ui_forms(config, recurse_folder=recurse_folder)
+    }
+
+
+def ui_benchmark_report(results: Mapping[str, UiBenchmarkResult]) -> dict[str, Any]:
+    """Create a JSON serializable report of ui benchmark results.
+
+    Parameters
+    ----------
+    results : Mapping[str, UiBenchmarkResult]
+        Results by form name (see :func:`benchmark_config_uis`).
+
+    Returns
+    -------
+    dict[str, Any]
+        Report with the summarized results of each form, sorted by form name.
+    """
+    return {"forms": {name: results[name].to_dict() for name in sorted(results)}}
+
+
+def compare_benchmark_reports(
+    report: Mapping[str, Any], baseline: Mapping[str, Any], section: str = "forms"
+) -> dict[str, dict[str, float]]:
+    """Compare the metrics of a benchmark report to a baseline report.
+
+    Parameters
+    ----------
+    report : Mapping[str, Any]
+        Current report (e.g. :func:`ui_benchmark_report`).
+    baseline : Mapping[str, Any]
+        Report to compare against.
+    section : str
+        Section of the reports containing the entries to compare. Defaults to "forms"
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        Relative change (``current / baseline - 1``) of each metric by entry name,
+        for all entries and metrics present in both reports.
+    """
+    baseline_entries = baseline.get(section, {})
+    changes = {}
+    for name, metrics in report.get(section, {}).items():
+        if name not in baseline_entries:
+            continue
+        changes[name] = {
+            metric: value / baseline_entries[name][metric] - 1
+            for metric, value in metrics.items()
+            if value is not None and baseline_entries[name].get(metric)
+        }
+    return changes
+
+
+def _resident_memory() -> int | None:
+    """Resident memory of the current process in bytes.
+
+    Returns
+    -------
+    int | None
+        Resident memory or None if it can not be determined on this platform.
+    """
+    try:
+        resident_pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _execute_module_code(
+    load_code: Callable[[], Any], module_file: Path, search_paths: Sequence[Path]
+) -> int | None:
+    """Load and execute the code of a generated module in a new module, which is dropped.
+
+    The module is created like an import of ``module_file`` from the synthetic package
+    spanning ``search_paths`` (see :func:`import_generated_module`), so the modules
+    imported by binary loaders, sharded modules, lazy registries and modules using
+    shared resources are resolved. All resources of a lazy registry are requested.
+    The resources registered by the module and the modules it imported are unregistered
+    by calling their ``qCleanupResources`` before they are dropped, so executing a module
+    repeatedly does not accumulate resource data.
+
+    Parameters
+    ----------
+    load_code : Callable[[], Any]
+        Function reading and compiling the code of the module.
+    module_file : Path
+        Path to the generated python file.
+    search_paths : Sequence[Path]
+        Folders containing generated code, ``module_file`` needs to be inside of one of them.
+
+    Returns
+    -------
+    int | None
+        Increase of resident memory in bytes by loading and executing the code,
+        or None if it can not be determined.
+    """
+    module_name = _generated_module_name(module_file, search_paths)
+    _REPLACED_MODULES.extend(_drop_generated_modules())
+    memory_before = _resident_memory()
+    module_spec = importlib.util.spec_from_file_location(module_name, module_file)
+    module = importlib.util.module_from_spec(module_spec)  # type:ignore[arg-type]
+    with _extended_sys_path(search_paths):
+        exec(load_code(), module.__dict__)
+        ensure_registered = module.__dict__.get("ensure_registered")
+        if callable(ensure_registered):
+            ensure_registered()
+    memory_after = _resident_memory()
+    # Unregistering resources a second time has no effect, so modules which are
+    # already cleaned up by the module importing them can be cleaned up again
+    for executed_module in [module, *_drop_generated_modules()]:
+        cleanup_resources = getattr(executed_module, "qCleanupResources", None)
+        if callable(cleanup_resources):
+            cleanup_resources()
+    module.__dict__.clear()
+    if memory_before is None or memory_after is None:
+        return None
+    return memory_after - memory_before
+
+
+@dataclass
+class ResourceBenchmarkResult:
+    """Sizes and memory usage in bytes and timings in seconds of importing a resource module."""
+
+    source_size: int
+    pyc_size: int
+    cold_import_time: float
+    warm_import_time: float
+    resident_memory: int | None
+
+    def to_dict(self) -> dict[str, float | None]:
+        """Summarize the result as JSON serializable dict.
+
+        Returns
+        -------
+        dict[str, float | None]
+            Sizes, import times and resident memory increase.
+        """
+        return {
+            "source_size": self.source_size,
+            "pyc_size": self.pyc_size,
+            "cold_import_time": self.cold_import_time,
+            "warm_import_time": self.warm_import_time,
+            "resident_memory": self.resident_memory,
+        }
+
+
+def benchmark_resource_module(
+    module_file: Path, *, repeat: int = 3, search_paths: Sequence[Path] | None = None
+) -> ResourceBenchmarkResult:
+    """Measure the cost of importing a resource module generated by ``rcc``.
+
+    The cold import time includes parsing and compiling the source, like
+    importing the module without cached bytecode. The warm import time is
+    measured by loading bytecode compiled to a temporary ``.pyc`` file.
+    Both include registering the resource data with ``qRegisterResourceData``.
+    The resident memory is the increase of resident memory of the process
+    when the module is read, compiled and executed the first time, so it includes
+    the embedded resource data. Each execution unregisters its resources again.
+
+    Parameters
+    ----------
+    module_file : Path
+        Path to the generated resource module.
+    repeat : int
+        Number of times each measurement is repeated. Defaults to 3
+    search_paths : Sequence[Path] | None
+        Folders containing generated code, which the modules imported by the resource
+        module are resolved in (see :func:`import_generated_module`).
+        The folder of ``module_file`` if None. Defaults to None
+
+    Returns
+    -------
+    ResourceBenchmarkResult
+        Measured sizes, timings and memory usage.
+    """
+    module_file = Path(module_file)
+    if search_paths is None:
+        search_paths = [module_file.parent]
+    get_qapplication()
+
+    def compile_source() -> Any:
+        return compile(module_file.read_bytes(), str(module_file), "exec")
+
+    resident_memory = _execute_module_code(compile_source, module_file, search_paths)
+
+    def time_cold_import() -> float:
+        start = time.perf_counter()
+        _execute_module_code(compile_source, module_file, search_paths)
+        return time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pyc_file = Path(temp_dir) / f"{module_file.stem}.pyc"
+        py_compile.compile(str(module_file), cfile=str(pyc_file), doraise=True)
+
+        def time_warm_import() -> float:
+            start = time.perf_counter()
+            # The header of pyc files is 16 bytes long (PEP 552)
+            _execute_module_code(
+                lambda: marshal.loads(pyc_file.read_bytes()[16:]), module_file, search_paths
+            )
+            return time.perf_counter() - start
+
+        return ResourceBenchmarkResult(
+            source_size=module_file.stat().st_size,
+            pyc_size=pyc_file.stat().st_size,
+            cold_import_time=_best_time(time_cold_import, repeat),
+            warm_import_time=_best_time(time_warm_import, repeat),
+            resident_memory=resident_memory,
+        )
+
+
+def benchmark_config_resources(
+    config: Config | str | Path,
+    *,
+    repeat: int = 3,
+    recurse_folder: bool = True,
+) -> dict[str, ResourceBenchmarkResult]:
+    """Benchmark all resource modules generated from the qrc files of a project.
+
+    Parameters
+    ----------
+    config : Config | str | Path
+        Configuration of the project.
+        If a path is passed it will try to find the config.
+    repeat : int
+        Number of times each measurement is repeated. Defaults to 3
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+
+    Returns
+    -------
+    dict[str, ResourceBenchmarkResult]
+        Results by path of the qrc file relative to ``resource_folder``.
+
+    Raises
+    ------
+    QtDevHelperConfigError
+        If the resource code is not generated as python code.
+    FileNotFoundError
+        If the code for a qrc file was not generated.
+    """
+    if not isinstance(config, Config):
+        config = load_config(config)
+    if config.generator.value != "python":
+        msg = "Benchmarking resources requires the 'python' generator."
+        raise QtDevHelperConfigError(msg)
+    resource_folder, generated_rc_code_folder = config.rc_folder_paths()
+    results = {}
+    for resource_file, module_file in resource_output_paths(
+        resource_folder,
+        generated_rc_code_folder,
+        flatten_path=config.flatten_folder_structure,
+        recurse_folder=recurse_folder,
+        collision_policy=config.output_collision_policy.value,
+    ):
+        if not module_file.is_file():
+            msg = (
+                f"Generated code for {resource_file.as_posix()!r} does not exist, "
+                "build the assets before running benchmarks."
+            )
+            raise FileNotFoundError(msg)
+        results[resource_file.relative_to(resource_folder).as_posix()] = benchmark_resource_module(
+            module_file, repeat=repeat, search_paths=[generated_rc_code_folder]
+        )
+    return results
+
+
+def resource_benchmark_report(results: Mapping[str, ResourceBenchmarkResult]) -> dict[str, Any]:
+    """Create a JSON serializable report of resource benchmark results.
+
+    Parameters
+    ----------
+    results : Mapping[str, ResourceBenchmarkResult]
+        Results by qrc file name (see :func:`benchmark_config_resources`).
+
+    Returns
+    -------
+    dict[str, Any]
+        Report with the results of each resource module, sorted by cold import time
+        so the worst offenders come first.
+    """
+    return {
+        "resources": {
+            name: results[name].to_dict()
+            for name in sorted(
+                results, key=lambda name: results[name].cold_import_time, reverse=True
+            )
+        }
+    }
@@ -0,0 +1,143 @@
+"""Precompile generated python modules to bytecode, so the first import does not compile them."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import py_compile
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Literal
+
+import rich
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+INVALIDATION_MODES = {
+    "timestamp": py_compile.PycInvalidationMode.TIMESTAMP,
+    "checked-hash": py_compile.PycInvalidationMode.CHECKED_HASH,
+    "unchecked-hash": py_compile.PycInvalidationMode.UNCHECKED_HASH,
+}
+# Flags of the pyc header (see PEP 552)
+HASH_BASED_FLAG = 0b01
+CHECK_SOURCE_FLAG = 0b10
+
+
+def bytecode_up_to_date(
+    module_file: Path,
+    *,
+    invalidation_mode: Literal["timestamp", "checked-hash", "unchecked-hash"] = "checked-hash",
+) -> bool:
+    """Check if the cached bytecode of ``module_file`` matches its source and invalidation mode.
+
+    Parameters
+    ----------
+    module_file : Path
+        Python module to check.
+    invalidation_mode : Literal["timestamp", "checked-hash", "unchecked-hash"]
+        Invalidation mode the bytecode should have been compiled with.
+        Defaults to "checked-hash"
+
+    Returns
+    -------
+    bool
+        Whether or not the '.pyc' file in '__pycache__' is up to date.
+    """
+    pyc_file = Path(importlib.util.cache_from_source(module_file))
+    try:
+        with pyc_file.open("rb") as pyc:
+            header = pyc.read(16)
+    except OSError:
+        return False
+    if len(header) < 16 or header[:4] != importlib.util.MAGIC_NUMBER:
+        return False
+    (flags,) = struct.unpack("<L", header[4:8])
+    if invalidation_mode == "timestamp":
+        source_stat = Path(module_file).stat()
+        return flags == 0 and header[8:16] == struct.pack(
+            "<LL", int(source_stat.st_mtime) & 0xFFFFFFFF, source_stat.st_size & 0xFFFFFFFF
+        )
+    expected_flags = HASH_BASED_FLAG
+    if invalidation_mode == "checked-hash":
+        expected_flags |= CHECK_SOURCE_FLAG
+    return flags == expected_flags and header[8:16] == importlib.util.source_hash(
+        Path(module_file).read_bytes()
+    )
+
+
+def _compile_module(module_file: Path, invalidation_mode: py_compile.PycInvalidationMode) -> Path:
+    """Compile a module to its cached bytecode file.
+
+    Parameters
+    ----------
+    module_file : Path
+        Python module to compile.
+    invalidation_mode : py_compile.PycInvalidationMode
+        Invalidation mode of the bytecode.
+
+    Returns
+    -------
+    Path
+        Path to the '.pyc' file.
+    """
+    py_compile.compile(str(module_file), doraise=True, invalidation_mode=invalidation_mode)
+    return Path(importlib.util.cache_from_source(module_file))
+
+
+def compile_bytecode(
+    module_files: Iterable[Path],
+    *,
+    invalidation_mode: Literal["timestamp", "checked-hash", "unchecked-hash"] = "checked-hash",
+    log_function: Callable[..., None] = rich.print,
+    base_path: Path | None = None,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """Compile changed python modules to bytecode in parallel.
+
+    Like ``compileall`` the bytecode is written to the '__pycache__' folder next to
+    each module, but modules with up to date bytecode (see :func:`bytecode_up_to_date`)
+    are skipped for all invalidation modes.
+
+    Parameters
+    ----------
+    module_files : Iterable[Path]
+        Python modules to compile.
+    invalidation_mode : Literal["timestamp", "checked-hash", "unchecked-hash"]
+        How the interpreter checks if the bytecode is outdated
+        (see ``py_compile.PycInvalidationMode``). Hash based modes do not depend on
+        file modification times, which change when packages are installed.
+        Defaults to "checked-hash"
+    log_function : Callable[..., None]
+        Function used to print log messages. Defaults to rich.print
+    base_path : Path | None
+        Path logged module paths are relative to. Defaults to None
+    max_workers : int | None
+        Maximum number of worker processes. Defaults to None which means
+        the number of changed modules capped by the number of CPUs.
+
+    Returns
+    -------
+    list[Path]
+        Paths to the written '.pyc' files.
+    """
+    pending_modules = []
+    for module_file in module_files:
+        if bytecode_up_to_date(module_file, invalidation_mode=invalidation_mode):
+            continue
+        rel_module_path = (
+            Path(module_file).relative_to(base_path) if base_path is not None else module_file
+        )
+        log_function(f"Compiling bytecode: {Path(rel_module_path).as_posix()}")
+        pending_modules.append(Path(module_file))
+
+    mode = INVALIDATION_MODES[invalidation_mode]
+    if max_workers is None:
+        max_workers = min(len(pending_modules), os.cpu_count() or 1)
+    if len(pending_modules) <= 1 or max_workers <= 1:
+        return [_compile_module(module_file, mode) for module_file in pending_modules]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_compile_module, pending_modules, [mode] * len(pending_modules)))
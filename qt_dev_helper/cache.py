@@ -0,0 +1,304 @@
+"""Module containing the persistent build cache used to skip rebuilding unchanged outputs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+CACHE_FILE_NAME = "build_cache.json"
+STORED_OUTPUTS_FOLDER_NAME = "outputs"
+FINGERPRINT_HEADER_PREFIX = "qt-dev-helper fingerprint: "
+# Comment start and end of the output types, which can carry a fingerprint header
+FINGERPRINT_COMMENTS = {
+    ".py": ("# ", ""),
+    ".h": ("/* ", " */"),
+    ".cpp": ("/* ", " */"),
+    ".qss": ("/* ", " */"),
+}
+
+
+def hash_content(*contents: str | bytes) -> str:
+    """Create a fingerprint of ``contents``.
+
+    Parameters
+    ----------
+    *contents : str | bytes
+        Contents the fingerprint should depend on (e.g. file contents and options).
+
+    Returns
+    -------
+    str
+        Hex digest of the sha256 hash of ``contents``.
+    """
+    content_hash = hashlib.sha256()
+    for content in contents:
+        content_hash.update(content.encode("utf8") if isinstance(content, str) else content)
+        content_hash.update(b"\0")
+    return content_hash.hexdigest()
+
+
+def fingerprint_header(output_file: Path, fingerprint: str) -> str | None:
+    """Create the header comment recording ``fingerprint`` in ``output_file``.
+
+    Parameters
+    ----------
+    output_file : Path
+        Path to the output file, its suffix defines the comment syntax.
+    fingerprint : str
+        Fingerprint of the inputs of ``output_file``.
+
+    Returns
+    -------
+    str | None
+        Header line including the line break or None if the file type has no comments.
+    """
+    comment = FINGERPRINT_COMMENTS.get(Path(output_file).suffix)
+    if comment is None:
+        return None
+    comment_start, comment_end = comment
+    return f"{comment_start}{FINGERPRINT_HEADER_PREFIX}{fingerprint}{comment_end}\n"
+
+
+def read_output_fingerprint(output_file: Path) -> str | None:
+    """Read the fingerprint from the header of ``output_file``.
+
+    Only the first line is read, so checking large generated files is cheap.
+
+    Parameters
+    ----------
+    output_file : Path
+        Path to the output file.
+
+    Returns
+    -------
+    str | None
+        Fingerprint of the inputs ``output_file`` was built from or None if
+        it does not exist or has no fingerprint header.
+    """
+    comment = FINGERPRINT_COMMENTS.get(Path(output_file).suffix)
+    if comment is None:
+        return None
+    try:
+        with Path(output_file).open(encoding="utf8") as output:
+            first_line = output.readline().rstrip("\r\n")
+    except (OSError, UnicodeDecodeError):
+        return None
+    comment_start, comment_end = comment
+    prefix = f"{comment_start}{FINGERPRINT_HEADER_PREFIX}"
+    if not first_line.startswith(prefix) or not first_line.endswith(comment_end):
+        return None
+    return first_line[len(prefix) : len(first_line) - len(comment_end)]
+
+
+def write_output_fingerprint(output_file: Path, fingerprint: str) -> bool:
+    """Add a header comment with ``fingerprint`` to ``output_file``.
+
+    An existing fingerprint header is replaced. Python modules keep a valid
+    encoding declaration, since it is allowed on the second line.
+
+    Parameters
+    ----------
+    output_file : Path
+        Path to the output file.
+    fingerprint : str
+        Fingerprint of the inputs ``output_file`` was built from.
+
+    Returns
+    -------
+    bool
+        Whether or not the header was written, which fails for file types without comments.
+    """
+    header = fingerprint_header(output_file, fingerprint)
+    if header is None:
+        return False
+    output_file = Path(output_file)
+    content = output_file.read_text(encoding="utf8")
+    if read_output_fingerprint(output_file) is not None:
+        content = content.split("\n", 1)[1] if "\n" in content else ""
+    output_file.write_text(f"{header}{content}", encoding="utf8")
+    return True
+
+
+def _hash_file(path: Path) -> str | None:
+    """Create a fingerprint of the content of the file at ``path``.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file.
+
+    Returns
+    -------
+    str | None
+        Fingerprint of the content or None if the file does not exist.
+    """
+    try:
+        return hash_content(Path(path).read_bytes())
+    except OSError:
+        return None
+
+
+class BuildCache:
+    """Persistent record of the input fingerprints each output was built from.
+
+    Together with the fingerprint the content hash of each output is recorded when
+    the cache is saved, so outputs which were overwritten (e.g. by a build with
+    another profile using a different cache folder) are not considered up to date.
+
+    Parameters
+    ----------
+    cache_folder : Path
+        Folder the cache file is stored in.
+    store_outputs : bool
+        Whether or not to store a copy of each output in the cache folder, which is
+        restored if the output was overwritten by a build with different inputs
+        (e.g. of another build profile). Defaults to False
+    """
+
+    def __init__(self, cache_folder: Path, *, store_outputs: bool = False) -> None:
+        self.cache_folder = Path(cache_folder)
+        self.cache_file = self.cache_folder / CACHE_FILE_NAME
+        self.store_outputs = store_outputs
+        self._updated_outputs: dict[str, Path] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._output_hashes: dict[str, str] = {}
+        try:
+            records = json.loads(self.cache_file.read_text(encoding="utf8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            records = {}
+        for key, record in records.items():
+            # Records of older versions without output hash are dropped
+            if isinstance(record, dict) and "fingerprint" in record and "output_hash" in record:
+                self._fingerprints[key] = record["fingerprint"]
+                self._output_hashes[key] = record["output_hash"]
+
+    @staticmethod
+    def _key(output_file: Path) -> str:
+        """Normalize ``output_file`` to be used as key.
+
+        Parameters
+        ----------
+        output_file : Path
+            Path to the output file.
+
+        Returns
+        -------
+        str
+            Absolute posix path of ``output_file``.
+        """
+        return Path(output_file).resolve().as_posix()
+
+    def _stored_output(self, output_file: Path, fingerprint: str) -> Path:
+        """Path of the stored copy of ``output_file`` built from inputs with ``fingerprint``.
+
+        Parameters
+        ----------
+        output_file : Path
+            Path to the output file.
+        fingerprint : str
+            Fingerprint of the inputs of ``output_file``.
+
+        Returns
+        -------
+        Path
+            Path in the ``outputs`` folder of the cache.
+        """
+        return (
+            self.cache_folder
+            / STORED_OUTPUTS_FOLDER_NAME
+            / f"{hash_content(self._key(output_file), fingerprint)}{Path(output_file).suffix}"
+        )
+
+    def is_up_to_date(self, output_file: Path, fingerprint: str) -> bool:
+        """Check if ``output_file`` exists and was built from inputs with ``fingerprint``.
+
+        Parameters
+        ----------
+        output_file : Path
+            Path to the output file.
+        fingerprint : str
+            Fingerprint of the current inputs of ``output_file``.
+
+        Returns
+        -------
+        bool
+            Whether or not ``output_file`` is up to date, which requires its content
+            to match the content recorded when the cache was saved.
+            With :attr:`store_outputs` a differing ``output_file`` is restored from the
+            stored copy instead.
+        """
+        key = self._key(output_file)
+        if self._fingerprints.get(key) != fingerprint:
+            return False
+        if self.store_outputs is False:
+            if key in self._output_hashes:
+                return _hash_file(output_file) == self._output_hashes[key]
+            # Updated since the last save, so the output was just built
+            return Path(output_file).is_file()
+        stored_output = self._stored_output(output_file, fingerprint)
+        if not stored_output.is_file():
+            return False
+        output_file = Path(output_file)
+        if not output_file.is_file() or output_file.read_bytes() != stored_output.read_bytes():
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(stored_output, output_file)
+        return True
+
+    def update(self, output_file: Path, fingerprint: str) -> None:
+        """Record that ``output_file`` was built from inputs with ``fingerprint``.
+
+        Parameters
+        ----------
+        output_file : Path
+            Path to the output file.
+        fingerprint : str
+            Fingerprint of the inputs ``output_file`` was built from.
+        """
+        self._fingerprints[self._key(output_file)] = fingerprint
+        self._output_hashes.pop(self._key(output_file), None)
+        self._updated_outputs[self._key(output_file)] = Path(output_file)
+
+    def save(self) -> None:
+        """Write the cache to ``cache_file`` and store copies of the updated outputs.
+
+        Updated outputs which do not exist are not recorded.
+        """
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+        for key, output_file in self._updated_outputs.items():
+            output_hash = _hash_file(output_file)
+            if output_hash is None:
+                del self._fingerprints[key]
+                continue
+            self._output_hashes[key] = output_hash
+            if self.store_outputs is True:
+                stored_output = self._stored_output(output_file, self._fingerprints[key])
+                stored_output.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(output_file, stored_output)
+        if self.store_outputs is True:
+            self._remove_unused_outputs()
+        self._updated_outputs = {}
+        self.cache_file.write_text(
+            json.dumps(
+                {
+                    key: {"fingerprint": fingerprint, "output_hash": self._output_hashes[key]}
+                    for key, fingerprint in self._fingerprints.items()
+                },
+                indent=2,
+                sort_keys=True,
+            ),
+            encoding="utf8",
+        )
+
+    def _remove_unused_outputs(self) -> None:
+        """Remove stored outputs, which do not belong to the current fingerprints."""
+        stored_outputs_folder = self.cache_folder / STORED_OUTPUTS_FOLDER_NAME
+        if not stored_outputs_folder.is_dir():
+            return
+        used_names = {
+            hash_content(key, fingerprint) for key, fingerprint in self._fingerprints.items()
+        }
+        for stored_output in stored_outputs_folder.iterdir():
+            if stored_output.stem not in used_names:
+                stored_output.unlink()
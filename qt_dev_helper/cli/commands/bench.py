@@ -0,0 +1,277 @@
+"""Module containing the CLI bench command implementations."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import rich
+import typer
+from rich.table import Table
+from typer import Argument
+from typer import Option
+
+from qt_dev_helper.benchmark import benchmark_config_qss
+from qt_dev_helper.benchmark import benchmark_config_resources
+from qt_dev_helper.benchmark import benchmark_config_uis
+from qt_dev_helper.benchmark import compare_benchmark_reports
+from qt_dev_helper.benchmark import resource_benchmark_report
+from qt_dev_helper.benchmark import ui_benchmark_report
+from qt_dev_helper.cli.utils import load_cli_config
+
+bench_app = typer.Typer(
+    name="bench",
+    no_args_is_help=True,
+    help="Benchmark the runtime performance of generated assets in an offscreen Qt application.",
+)
+
+
+def bench_qss(  # noqa: DOC
+    base_path: Optional[Path] = Argument(
+        default=None,
+        help="Base path used to resolve relative paths, by default the path to a found config.",
+    ),
+    config: Optional[Path] = Option(
+        None,
+        "--config",
+        "-c",
+        file_okay=True,
+        help="Path to a config file.",
+    ),
+    qss_file: Optional[Path] = Option(
+        default=None,
+        file_okay=True,
+        help="Qss stylesheet to benchmark, by default 'root_qss_file' from the config.",
+    ),
+    recurse_folder: bool = Option(
+        False,
+        "--recurse-folder",
+        "-r",
+        is_flag=True,
+        help="Recurse directories searching for files.",
+    ),
+    repeat: int = Option(
+        default=3,
+        min=1,
+        help="Number of times each measurement is repeated, the fastest run is reported.",
+    ),
+    selector_costs: bool = Option(
+        default=True,
+        is_flag=True,
+        help="Whether or not to estimate the cost of each selector.",
+    ),
+    top: int = Option(
+        default=10,
+        min=0,
+        help="Number of most expensive selectors to show.",
+    ),
+) -> None:
+    """Benchmark applying the compiled stylesheet to the widgets of all generated forms."""
+    config_obj = load_cli_config(config, base_path)
+    if qss_file is not None:
+        qss_file = config_obj.base_path / qss_file
+
+    result = benchmark_config_qss(
+        config_obj,
+        qss_file,
+        repeat=repeat,
+        selector_costs=selector_costs,
+        recurse_folder=recurse_folder,
+    )
+
+    rich.print(f"Widgets: {result.widget_count}")
+    rich.print(f"Parse time: {result.parse_time * 1000:.3f} ms")
+    rich.print(
+        f"Polish time: {result.polish_time * 1000:.3f} ms "
+        f"(without stylesheet: {result.baseline_polish_time * 1000:.3f} ms)"
+    )
+    if selector_costs is True and top > 0:
+        table = Table("Selector", "Estimated cost [ms]", title="Most expensive selectors")
+        for selector, cost in result.most_expensive_selectors(top):
+            table.add_row(selector, f"{cost * 1000:.3f}")
+        rich.print(table)
+
+
+def _format_change(changes: dict[str, float], metric: str) -> str:
+    """Format the relative change of a metric compared to the baseline.
+
+    Parameters
+    ----------
+    changes : dict[str, float]
+        Relative changes by metric name.
+    metric : str
+        Name of the metric.
+
+    Returns
+    -------
+    str
+        Change in percent or empty string if there is no baseline value.
+    """
+    if metric not in changes:
+        return ""
+    return f" ({changes[metric] * 100:+.1f}%)"
+
+
+def bench_ui(  # noqa: DOC
+    base_path: Optional[Path] = Argument(
+        default=None,
+        help="Base path used to resolve relative paths, by default the path to a found config.",
+    ),
+    config: Optional[Path] = Option(
+        None,
+        "--config",
+        "-c",
+        file_okay=True,
+        help="Path to a config file.",
+    ),
+    recurse_folder: bool = Option(
+        False,
+        "--recurse-folder",
+        "-r",
+        is_flag=True,
+        help="Recurse directories searching for files.",
+    ),
+    repeat: int = Option(
+        default=10,
+        min=1,
+        help="Number of times 'setupUi' is run for each form.",
+    ),
+    output: Optional[Path] = Option(
+        default=None,
+        file_okay=True,
+        help="Path to write the results to as JSON.",
+    ),
+    baseline: Optional[Path] = Option(
+        default=None,
+        exists=True,
+        file_okay=True,
+        help="JSON results of a previous run to compare against.",
+    ),
+) -> None:
+    """Benchmark importing the generated ui modules and running 'setupUi' of their forms."""
+    config_obj = load_cli_config(config, base_path)
+
+    report = ui_benchmark_report(
+        benchmark_config_uis(config_obj, repeat=repeat, recurse_folder=recurse_folder)
+    )
+    changes = {}
+    if baseline is not None:
+        changes = compare_benchmark_reports(
+            report, json.loads(baseline.read_text(encoding="utf8")), "forms"
+        )
+
+    table = Table(
+        "Form",
+        "Import [ms]",
+        "setupUi min [ms]",
+        "setupUi mean [ms]",
+        "Peak memory [KiB]",
+        title="Ui benchmark",
+    )
+    for name, metrics in report["forms"].items():
+        form_changes = changes.get(name, {})
+        table.add_row(
+            name,
+            *(
+                f"{metrics[metric] * 1000:.3f}{_format_change(form_changes, metric)}"
+                for metric in ("import_time", "setup_ui_min", "setup_ui_mean")
+            ),
+            f"{metrics['peak_memory'] / 1024:.1f}{_format_change(form_changes, 'peak_memory')}",
+        )
+    rich.print(table)
+
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2), encoding="utf8")
+
+
+def bench_resources(  # noqa: DOC
+    base_path: Optional[Path] = Argument(
+        default=None,
+        help="Base path used to resolve relative paths, by default the path to a found config.",
+    ),
+    config: Optional[Path] = Option(
+        None,
+        "--config",
+        "-c",
+        file_okay=True,
+        help="Path to a config file.",
+    ),
+    recurse_folder: bool = Option(
+        False,
+        "--recurse-folder",
+        "-r",
+        is_flag=True,
+        help="Recurse directories searching for files.",
+    ),
+    repeat: int = Option(
+        default=3,
+        min=1,
+        help="Number of times each measurement is repeated, the fastest run is reported.",
+    ),
+    top: int = Option(
+        default=3,
+        min=0,
+        help="Number of resource modules with the slowest cold import to highlight.",
+    ),
+    output: Optional[Path] = Option(
+        default=None,
+        file_okay=True,
+        help="Path to write the results to as JSON.",
+    ),
+    baseline: Optional[Path] = Option(
+        default=None,
+        exists=True,
+        file_okay=True,
+        help="JSON results of a previous run to compare against.",
+    ),
+) -> None:
+    """Report the import cost of the generated resource modules."""
+    config_obj = load_cli_config(config, base_path)
+
+    report = resource_benchmark_report(
+        benchmark_config_resources(config_obj, repeat=repeat, recurse_folder=recurse_folder)
+    )
+    changes = {}
+    if baseline is not None:
+        changes = compare_benchmark_reports(
+            report, json.loads(baseline.read_text(encoding="utf8")), "resources"
+        )
+
+    table = Table(
+        "Resource",
+        "Source [KiB]",
+        ".pyc [KiB]",
+        "Cold import [ms]",
+        "Warm import [ms]",
+        "Resident memory [KiB]",
+        title="Resource module import cost",
+    )
+    for index, (name, metrics) in enumerate(report["resources"].items()):
+        resource_changes = changes.get(name, {})
+        cells = [
+            f"{metrics[metric] / 1024:.1f}{_format_change(resource_changes, metric)}"
+            for metric in ("source_size", "pyc_size")
+        ]
+        cells += [
+            f"{metrics[metric] * 1000:.3f}{_format_change(resource_changes, metric)}"
+            for metric in ("cold_import_time", "warm_import_time")
+        ]
+        cells.append(
+            "n/a"
+            if metrics["resident_memory"] is None
+            else f"{metrics['resident_memory'] / 1024:.1f}"
+            f"{_format_change(resource_changes, 'resident_memory')}"
+        )
+        table.add_row(name, *cells, style="bold red" if index < top else None)
+    rich.print(table)
+
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2), encoding="utf8")
+
+
+bench_app.command(name="qss")(bench_qss)
+bench_app.command(name="ui")(bench_ui)
+bench_app.command(name="resources")(bench_resources)
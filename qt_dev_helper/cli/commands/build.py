@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
-import os
 from pathlib import Path
 from typing import Optional
 
 from typer import Argument
+from typer import BadParameter
 from typer import Option
 
+from qt_dev_helper.cli.utils import load_cli_config
 from qt_dev_helper.cli.utils import parse_optional_args_string
+from qt_dev_helper.config import BytecodeInvalidationModes
 from qt_dev_helper.config import CodeGenerators
-from qt_dev_helper.config import Config
-from qt_dev_helper.config import ConfigNotFoundError
-from qt_dev_helper.config import load_config
+from qt_dev_helper.config import OutputCollisionPolicies
+from qt_dev_helper.config import QtDevHelperConfigError
+from qt_dev_helper.config import ResourceCompressionTuning
+from qt_dev_helper.config import ResourceDeduplication
+from qt_dev_helper.config import ResourceShardStrategies
+from qt_dev_helper.config import SassOutputStyles
 from qt_dev_helper.transpiler import build_all_assets
 
 
@@ -29,6 +34,12 @@ def build(  # noqa: DOC
         file_okay=True,
         help="Path to a config file.",
     ),
+    profile: Optional[str] = Option(
+        None,
+        "--profile",
+        "-p",
+        help="Name of the build profile from the config to apply.",
+    ),
     recurse_folder: bool = Option(
         False,
         "--recurse-folder",
@@ -47,6 +58,10 @@ def build(  # noqa: DOC
         is_flag=True,
         help="Whether or not to flatten the folder structure of the ui and resource files.",
     ),
+    output_collision_policy: Optional[OutputCollisionPolicies] = Option(
+        None,
+        help="Handling of files which would be compiled to the same flattened output file.",
+    ),
     ui: bool = Option(
         default=True,
         is_flag=True,
@@ -83,10 +98,79 @@ def build(  # noqa: DOC
         default=None,
         help="Python: generate imports relative to '.'",
     ),
+    ui_registry: Optional[bool] = Option(
+        default=None,
+        is_flag=True,
+        help="Python: generate an '__init__.py' importing form classes lazily.",
+    ),
     rcc_args: Optional[str] = Option(
         default=None,
         help="Additional arguments for the rcc executable, as comma separated list.",
     ),
+    rcc_binary: Optional[bool] = Option(
+        default=None,
+        is_flag=True,
+        help=(
+            "Python: compile resources to binary '*.rcc' files with a loader module "
+            "instead of embedding the data in python code."
+        ),
+    ),
+    rcc_lazy: Optional[bool] = Option(
+        default=None,
+        is_flag=True,
+        help=(
+            "Python: compile resources of each prefix to separate modules, "
+            "which are only registered when requested."
+        ),
+    ),
+    rcc_shards: Optional[int] = Option(
+        default=None,
+        min=1,
+        help="Python: number of modules the resources of each qrc file are split into.",
+    ),
+    rcc_shard_strategy: Optional[ResourceShardStrategies] = Option(
+        None,
+        help="Whether to split resources into shards by prefix or by single files.",
+    ),
+    rcc_deduplication: Optional[ResourceDeduplication] = Option(
+        None,
+        help=(
+            "Whether to ignore, report or share (python only) identical files "
+            "referenced by multiple qrc files."
+        ),
+    ),
+    optimize_assets: Optional[bool] = Option(
+        default=None,
+        is_flag=True,
+        help="Minify SVG and recompress PNG files referenced by qrc files before compiling them.",
+    ),
+    rcc_compression_tuning: Optional[ResourceCompressionTuning] = Option(
+        None,
+        help="Choose the rcc compression per file or per qrc file by sampling the resources.",
+    ),
+    compile_bytecode: Optional[bool] = Option(
+        default=None,
+        is_flag=True,
+        help="Python: compile changed generated modules to bytecode after building.",
+    ),
+    bytecode_invalidation_mode: Optional[BytecodeInvalidationModes] = Option(
+        None,
+        help="Python: how the interpreter checks if precompiled bytecode is outdated.",
+    ),
+    output_fingerprints: Optional[bool] = Option(
+        default=None,
+        is_flag=True,
+        help="Write the fingerprint of the inputs to a header comment of each generated file.",
+    ),
+    depfiles: Optional[bool] = Option(
+        default=None,
+        is_flag=True,
+        help="Write a Makefile style depfile listing the inputs of each generated file.",
+    ),
+    depfile_folder: Optional[str] = Option(
+        default=None,
+        help="Folder to write depfiles to, by default next to the generated files.",
+    ),
     qss: bool = Option(
         default=True,
         is_flag=True,
@@ -104,29 +188,53 @@ def build(  # noqa: DOC
             "generated from 'root_sass_file'."
         ),
     ),
+    qss_minify: Optional[bool] = Option(
+        default=None,
+        is_flag=True,
+        help="Whether or not to minify the generated qss files.",
+    ),
+    sass_output_style: Optional[SassOutputStyles] = Option(
+        None,
+        help="Output style of libsass.",
+    ),
 ) -> None:
     """Build production assets from input files."""
-    try:
-        config_obj = load_config(config)
-    except ConfigNotFoundError:
-        config_obj = Config(base_path=base_path or Path(os.curdir))
-
-    if base_path is not None:
-        config_obj.base_path = base_path
+    config_obj = load_cli_config(config, base_path)
+    if profile is not None:
+        try:
+            config_obj.apply_profile(profile)
+        except QtDevHelperConfigError as error:
+            raise BadParameter(str(error), param_hint="'--profile'") from error
 
     config_obj.update(
         {
             "generator": generator,
             "flatten_folder_structure": flatten_folder_structure,
+            "output_collision_policy": output_collision_policy,
             "ui_files_folder": ui_files_folder,
             "generated_ui_code_folder": generated_ui_code_folder,
             "uic_args": parse_optional_args_string(uic_args),
             "form_import": form_import,
+            "ui_registry": ui_registry,
             "resource_folder": resource_folder,
             "generated_rc_code_folder": generated_rc_code_folder,
             "rcc_args": parse_optional_args_string(rcc_args),
+            "rcc_binary": rcc_binary,
+            "rcc_lazy": rcc_lazy,
+            "rcc_shards": rcc_shards,
+            "rcc_shard_strategy": rcc_shard_strategy,
+            "rcc_deduplication": rcc_deduplication,
+            "optimize_assets": optimize_assets,
+            "rcc_compression_tuning": rcc_compression_tuning,
+            "compile_bytecode": compile_bytecode,
+            "bytecode_invalidation_mode": bytecode_invalidation_mode,
+            "output_fingerprints": output_fingerprints,
+            "depfiles": depfiles,
+            "depfile_folder": depfile_folder,
             "root_sass_file": root_sass_file,
             "root_qss_file": root_qss_file,
+            "qss_minify": qss_minify,
+            "sass_output_style": sass_output_style,
         }
     )
 
@@ -0,0 +1,61 @@
+"""Module containing the CLI export-ninja command implementation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import rich
+from typer import Argument
+from typer import BadParameter
+from typer import Option
+
+from qt_dev_helper.cli.utils import load_cli_config
+from qt_dev_helper.config import QtDevHelperConfigError
+from qt_dev_helper.ninja import export_ninja as export_ninja_file
+
+
+def export_ninja(  # noqa: DOC
+    base_path: Optional[Path] = Argument(
+        default=None,
+        help="Base path used to resolve relative paths, by default the path to a found config.",
+    ),
+    config: Optional[Path] = Option(
+        None,
+        "--config",
+        "-c",
+        file_okay=True,
+        help="Path to a config file.",
+    ),
+    profile: Optional[str] = Option(
+        None,
+        "--profile",
+        "-p",
+        help="Name of the build profile from the config to apply.",
+    ),
+    output: Optional[Path] = Option(
+        None,
+        "--output",
+        "-o",
+        help="Path to write the Ninja file to, by default 'build.ninja' in the base path.",
+    ),
+    recurse_folder: bool = Option(
+        False,
+        "--recurse-folder",
+        "-r",
+        is_flag=True,
+        help="Recurse directories searching for files.",
+    ),
+) -> None:
+    """Export the asset build graph as Ninja file, with one edge per asset."""
+    config_obj = load_cli_config(config, base_path)
+    if profile is not None:
+        try:
+            config_obj.apply_profile(profile)
+        except QtDevHelperConfigError as error:
+            raise BadParameter(str(error), param_hint="'--profile'") from error
+    try:
+        ninja_file = export_ninja_file(config_obj, output, recurse_folder=recurse_folder)
+    except QtDevHelperConfigError as error:
+        raise BadParameter(str(error)) from error
+    rich.print(f"Created: {ninja_file.as_posix()}")
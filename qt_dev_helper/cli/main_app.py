@@ -11,8 +11,10 @@ except ImportError as error:
     )
     raise ImportError(msg) from error
 
+from qt_dev_helper.cli.commands.bench import bench_app
 from qt_dev_helper.cli.commands.build import build
 from qt_dev_helper.cli.commands.designer import designer
+from qt_dev_helper.cli.commands.export_ninja import export_ninja
 
 app = typer.Typer(
     name="qt-dev-helper",
@@ -22,6 +24,8 @@ app = typer.Typer(
 
 app.command()(designer)
 app.command()(build)
+app.command(name="export-ninja")(export_ninja)
+app.add_typer(bench_app)
 
 
 if __name__ == "__main__":
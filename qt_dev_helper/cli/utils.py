@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
+
+from qt_dev_helper.config import Config
+from qt_dev_helper.config import ConfigNotFoundError
+from qt_dev_helper.config import load_config
+
 
 def parse_optional_args_string(optional_args_string: str | None) -> list[str] | None:
     """Parse optional args string as comma separated list.
@@ -22,3 +29,28 @@ def parse_optional_args_string(optional_args_string: str | None) -> list[str] |
     while "" in args:
         args.remove("")
     return args
+
+
+def load_cli_config(config: Path | None, base_path: Path | None) -> Config:
+    """Load the config passed to a CLI command, falling back to the default config.
+
+    Parameters
+    ----------
+    config : Path | None
+        Path to a config file or None to search for one in the current directory.
+    base_path : Path | None
+        Base path used to resolve relative paths, by default the path to a found config.
+
+    Returns
+    -------
+    Config
+        Loaded config.
+    """
+    try:
+        config_obj = load_config(config)
+    except ConfigNotFoundError:
+        config_obj = Config(base_path=base_path or Path(os.curdir))
+
+    if base_path is not None:
+        config_obj.base_path = base_path
+    return config_obj
@@ -10,7 +10,9 @@ from typing import Literal
 from typing import TypedDict
 
 import tomli
+from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
@@ -118,6 +120,39 @@ def _check_input_exists(
     return config_dict
 
 
+def _check_style_files_exist(config_dict: dict[str, Any]) -> dict[str, Any]:
+    """Check that the ``sass_file`` of each entry in ``style_files`` is an existing file.
+
+    Parameters
+    ----------
+    config_dict : dict[str, Any]
+        Dict of the Config.
+
+    Returns
+    -------
+    dict[str, Any]
+        Value of ``config_dict``
+
+    Raises
+    ------
+    ValueError
+        If any ``sass_file`` is not a file.
+    """
+    for style_file in config_dict.get("style_files") or []:
+        sass_file = (
+            style_file.get("sass_file")
+            if isinstance(style_file, dict)
+            else getattr(style_file, "sass_file", None)
+        )
+        if sass_file is not None and not (config_dict.get("base_path") / sass_file).is_file():
+            exception_msg = (
+                "The values of 'sass_file' in 'style_files' need to be valid paths.\n"
+                f"Got:\n\tsass_file={sass_file!r}"
+            )
+            raise ValueError(exception_msg)
+    return config_dict
+
+
 def expand_io_paths(
     config: Config, input_var_name: str, output_var_name: str
 ) -> tuple[Path, Path]:
@@ -161,6 +196,62 @@ class CodeGenerators(str, Enum):
     cpp = "cpp"
 
 
+class OutputCollisionPolicies(str, Enum):
+    """Handling of input files which would be compiled to the same flattened output file."""
+
+    overwrite = "overwrite"
+    error = "error"
+    suffix = "suffix"
+    structure = "structure"
+
+
+class SassConformers(str, Enum):
+    """Valid implementations to conform qss to scss and back."""
+
+    qt_dev_helper = "qt-dev-helper"
+    qtsass = "qtsass"
+
+
+class SassOutputStyles(str, Enum):
+    """Output styles of libsass."""
+
+    nested = "nested"
+    expanded = "expanded"
+    compact = "compact"
+    compressed = "compressed"
+
+
+class ResourceShardStrategies(str, Enum):
+    """Strategies to split resources into shards."""
+
+    prefix = "prefix"
+    size = "size"
+
+
+class ResourceDeduplication(str, Enum):
+    """Handling of identical files referenced by multiple qrc files."""
+
+    off = "off"
+    report = "report"
+    share = "share"
+
+
+class ResourceCompressionTuning(str, Enum):
+    """Granularity of choosing the rcc compression by sampling resource files."""
+
+    off = "off"
+    file = "file"
+    qrc = "qrc"
+
+
+class BytecodeInvalidationModes(str, Enum):
+    """Invalidation modes of precompiled bytecode (see ``py_compile.PycInvalidationMode``)."""
+
+    timestamp = "timestamp"
+    checked_hash = "checked-hash"
+    unchecked_hash = "unchecked-hash"
+
+
 class UicKwargs(TypedDict, total=False):
     """Keyword arguments to be used with ``compile_ui_file``."""
 
@@ -174,6 +265,46 @@ class RccKwargs(TypedDict, total=False):
 
     generator: Literal["python", "cpp"]
     rcc_args: list[str]
+    binary: bool
+    lazy: bool
+    shards: int | None
+    shard_strategy: Literal["prefix", "size"]
+
+
+class StyleFileMapping(BaseModel, extra="forbid"):
+    """Mapping of a scss entry point to the qss file it is compiled to."""
+
+    sass_file: str = Field(description="Scss stylesheet entry point.")
+    qss_file: str = Field(description="Qss stylesheet generated from 'sass_file'.")
+
+
+class BuildProfile(BaseModel, extra="forbid"):
+    """Build options overridden by a named build profile."""
+
+    uic_args: list[str] | None = Field(
+        default=None, description="Additional arguments for the uic executable."
+    )
+    rcc_args: list[str] | None = Field(
+        default=None, description="Additional arguments for the rcc executable."
+    )
+    sass_output_style: SassOutputStyles | None = Field(
+        default=None, description="Output style of libsass."
+    )
+    qss_minify: bool | None = Field(
+        default=None, description="Whether or not to minify the generated qss files."
+    )
+    optimize_assets: bool | None = Field(
+        default=None,
+        description="Whether or not to minify SVG and recompress PNG files of qrc files.",
+    )
+    rcc_compression_tuning: ResourceCompressionTuning | None = Field(
+        default=None,
+        description="Granularity of choosing the rcc compression by sampling resource files.",
+    )
+    compile_bytecode: bool | None = Field(
+        default=None,
+        description="Whether or not to precompile the generated python modules to bytecode.",
+    )
 
 
 class Config(BaseSettings, extra="forbid"):  # type:ignore[call-arg]
@@ -193,6 +324,45 @@ class Config(BaseSettings, extra="forbid"):  # type:ignore[call-arg]
             "generated from 'root_sass_file'."
         ),
     )
+    style_files: list[StyleFileMapping] = Field(
+        default_factory=list,
+        description=(
+            "Additional scss entry points (e.g. per module stylesheets or themes) "
+            "and the qss files they are compiled to."
+        ),
+    )
+    style_variants: dict[str, dict[str, str]] = Field(
+        default_factory=dict,
+        description=(
+            "Variants each stylesheet is additionally compiled to, mapping the variant name "
+            "to overrides of scss variables (e.g. {dark = {bg-color = '#1b1e23'}})."
+        ),
+    )
+    style_variant_file_name: str = Field(
+        default="{file_stem}_{variant}.qss",
+        description=(
+            "Format of the qss file name of a style variant, with the instructions 'file_stem' "
+            "(stem of the qss file) and 'variant' (name of the variant)."
+        ),
+    )
+    sass_conformer: SassConformers = Field(
+        default=SassConformers.qt_dev_helper,
+        description=(
+            "Implementation used to conform qss to scss and back, 'qt-dev-helper' is a linear "
+            "time drop-in replacement of the 'qtsass' conformers."
+        ),
+    )
+    qss_minify: bool = Field(
+        default=False,
+        description=(
+            "Whether or not to minify the generated qss files (remove comments, whitespace "
+            "and empty rules and merge duplicate selectors), to reduce parsing time at startup."
+        ),
+    )
+    sass_output_style: SassOutputStyles = Field(
+        default=SassOutputStyles.nested,
+        description="Output style of libsass ('nested', 'expanded', 'compact' or 'compressed').",
+    )
     # General Qt code generator options
     generator: CodeGenerators = Field(
         default=CodeGenerators.python,
@@ -201,6 +371,15 @@ class Config(BaseSettings, extra="forbid"):  # type:ignore[call-arg]
     flatten_folder_structure: bool = Field(
         default=True, description="Whether to keep the original folder structure or flatten it."
     )
+    output_collision_policy: OutputCollisionPolicies = Field(
+        default=OutputCollisionPolicies.overwrite,
+        description=(
+            "Handling of files with the same name in different folders, which would be "
+            "compiled to the same flattened output file. 'overwrite' warns and only compiles "
+            "the last of them, 'error' aborts the build, 'suffix' appends their relative "
+            "folder to the output names and 'structure' keeps their folder structure."
+        ),
+    )
     # Qt ui code generator options
     ui_files_folder: str | None = Field(
         default=None, description="Root folder containing *.ui files."
@@ -213,6 +392,14 @@ class Config(BaseSettings, extra="forbid"):  # type:ignore[call-arg]
         description="Additional arguments for the uic executable.",
     )
     form_import: bool = Field(default=True, description="Python: generate imports relative to '.'")
+    ui_registry: bool = Field(
+        default=False,
+        description=(
+            "Python: generate an '__init__.py' in 'generated_ui_code_folder' mapping form "
+            "class names to their modules, which are only imported when the form class is "
+            "accessed."
+        ),
+    )
     # Qt rc code generator options
     resource_folder: str | None = Field(
         default=None, description="Root folder containing *.qrc files."
@@ -224,6 +411,127 @@ class Config(BaseSettings, extra="forbid"):  # type:ignore[call-arg]
         default_factory=_str_list_factory,
         description="Additional arguments for the rcc executable.",
     )
+    rcc_binary: bool = Field(
+        default=False,
+        description=(
+            "Python: compile resources to binary '*.rcc' files and generate a loader module, "
+            "which registers them with Qt, instead of embedding the data in python code."
+        ),
+    )
+    rcc_lazy: bool = Field(
+        default=False,
+        description=(
+            "Python: compile the resources of each prefix to a separate module, which is only "
+            "registered when requested with 'ensure_registered(prefix)' or by accessing the "
+            "prefix attribute of the generated resource module."
+        ),
+    )
+    rcc_shards: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Python: split the resources of each qrc file into this many modules, which are "
+            "compiled in parallel and cached independently. The generated resource module "
+            "imports all of them."
+        ),
+    )
+    rcc_shard_strategy: ResourceShardStrategies = Field(
+        default=ResourceShardStrategies.prefix,
+        description=(
+            "Whether to keep all resources of a prefix in the same shard ('prefix') "
+            "or to split by single files ('size')."
+        ),
+    )
+    rcc_deduplication: ResourceDeduplication = Field(
+        default=ResourceDeduplication.off,
+        description=(
+            "Handling of identical files referenced by multiple qrc files. 'off' does not look "
+            "for duplicates, 'report' logs them and 'share' additionally compiles them to one "
+            "shared resource module, which is imported by the generated resource modules "
+            "(python only)."
+        ),
+    )
+    optimize_assets: bool = Field(
+        default=False,
+        description=(
+            "Whether or not to minify SVG and losslessly recompress PNG files referenced "
+            "by qrc files before compiling them. Optimized files are cached by content."
+        ),
+    )
+    rcc_compression_tuning: ResourceCompressionTuning = Field(
+        default=ResourceCompressionTuning.off,
+        description=(
+            "Choose the rcc compression for each 'file' or for all files of a 'qrc' file by "
+            "sampling the referenced files, instead of only using 'rcc_args'. Poorly "
+            "compressible files are stored uncompressed to avoid decompression at runtime. "
+            "Choices are recorded in the cache folder so they stay stable between builds."
+        ),
+    )
+    compile_bytecode: bool = Field(
+        default=False,
+        description=(
+            "Python: compile changed generated modules to bytecode in parallel after "
+            "building, so the first import (or every import from read-only locations) "
+            "does not need to compile them."
+        ),
+    )
+    bytecode_invalidation_mode: BytecodeInvalidationModes = Field(
+        default=BytecodeInvalidationModes.checked_hash,
+        description=(
+            "Python: how the interpreter checks if precompiled bytecode is outdated "
+            "('timestamp', 'checked-hash' or 'unchecked-hash')."
+        ),
+    )
+    # Build cache options
+    cache_folder: str | None = Field(
+        default=None,
+        description=(
+            "Folder to store the build cache in, which is used to skip rebuilding unchanged "
+            "outputs. Caching is disabled if not defined."
+        ),
+    )
+    output_fingerprints: bool = Field(
+        default=False,
+        description=(
+            "Write a header comment with the fingerprint of the inputs, tool and arguments "
+            "to each generated code and qss file. Outputs whose header matches are skipped, "
+            "so unchanged outputs are not rebuilt even without a build cache (e.g. in a "
+            "fresh clone with committed outputs)."
+        ),
+    )
+    # Dependency file options
+    depfiles: bool = Field(
+        default=False,
+        description=(
+            "Write a Makefile style depfile ('<output>.d') for each generated file, listing "
+            "all scss partials, qrc referenced files and ui includes it depends on, for "
+            "incremental build systems like Make or Ninja."
+        ),
+    )
+    depfile_folder: str | None = Field(
+        default=None,
+        description=(
+            "Folder to write depfiles to, mirroring the paths of the outputs relative to "
+            "the project. Depfiles are written next to the outputs if not defined."
+        ),
+    )
+    # Build profile options
+    profiles: dict[str, BuildProfile] = Field(
+        default_factory=dict,
+        description=(
+            "Named build profiles overriding build options (e.g. {dev = {rcc_args = "
+            "['--no-compress']}, release = {qss_minify = true, optimize_assets = true}})."
+        ),
+    )
+    profile: str | None = Field(
+        default=None,
+        description=(
+            "Name of the build profile in 'profiles' to apply. Each profile uses its own "
+            "build cache, which stores the outputs so switching profiles restores them "
+            "instead of rebuilding."
+        ),
+    )
+    _profile_base_values: dict[str, Any] | None = PrivateAttr(default=None)
 
     @model_validator(mode="before")
     def _validate_style_input_path(  # noqa: DOC
@@ -232,6 +540,13 @@ class Config(BaseSettings, extra="forbid"):  # type:ignore[call-arg]
         """Validate that ``root_sass_file`` is a valid path if defined."""
         return _check_input_exists(data, "root_sass_file", is_file=True)
 
+    @model_validator(mode="before")
+    def _validate_style_files_input_paths(  # noqa: DOC
+        cls: type[Config], data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Validate that the ``sass_file`` of each entry in ``style_files`` is a valid path."""
+        return _check_style_files_exist(data)
+
     @model_validator(mode="before")
     def _validate_ui_input_path(  # noqa: DOC
         cls: type[Config], data: dict[str, Any]
@@ -271,6 +586,58 @@ class Config(BaseSettings, extra="forbid"):  # type:ignore[call-arg]
         """
         return expand_io_paths(self, "root_sass_file", "root_qss_file")
 
+    def style_paths(self) -> list[tuple[Path, Path]]:
+        """Resolve paths of all style entry points and their outputs.
+
+        This combines ``root_sass_file``/``root_qss_file`` and ``style_files``.
+
+        Returns
+        -------
+        list[tuple[Path, Path]]
+            Pairs of paths to a scss entry point and the qss file it is compiled to.
+
+        Raises
+        ------
+        QtDevHelperConfigError
+            If no style files are defined.
+        """
+        paths = [
+            (self.base_path / style_file.sass_file, self.base_path / style_file.qss_file)
+            for style_file in self.style_files
+        ]
+        if self.root_sass_file is not None and self.root_qss_file is not None:
+            paths.insert(0, self.root_style_paths())
+        if len(paths) == 0:
+            msg = "Neither 'root_sass_file' nor 'style_files' are defined."
+            raise QtDevHelperConfigError(msg)
+        return paths
+
+    def cache_path(self) -> Path | None:
+        """Resolve path to the build cache folder.
+
+        Returns
+        -------
+        Path | None
+            Path to ``cache_folder`` or None if caching is disabled.
+        """
+        if self.cache_folder is None:
+            return None
+        if self.profile is not None:
+            return self.base_path / self.cache_folder / "profiles" / self.profile
+        return self.base_path / self.cache_folder
+
+    def depfile_folder_path(self) -> Path | None:
+        """Resolve path to the depfile folder.
+
+        Returns
+        -------
+        Path | None
+            Path to ``depfile_folder`` or None if depfiles are written next to the outputs.
+        """
+        if self.depfile_folder is None:
+            return None
+        return self.base_path / self.depfile_folder
+
     def ui_folder_paths(self) -> tuple[Path, Path]:
         """Resolve paths to root style files.
 
@@ -316,12 +683,17 @@ class Config(BaseSettings, extra="forbid"):  # type:ignore[call-arg]
         return {
             "generator": self.generator.value,
             "rcc_args": self.rcc_args,
+            "binary": self.rcc_binary,
+            "lazy": self.rcc_lazy,
+            "shards": self.rcc_shards,
+            "shard_strategy": self.rcc_shard_strategy.value,
         }
 
     def deactivate_style_build(self) -> None:
         """Deactivate style building with :func:`build_all_assets`."""
         self.root_sass_file = None
         self.root_qss_file = None
+        self.style_files = []
 
     def deactivate_ui_build(self) -> None:
         """Deactivate ui building with :func:`build_all_assets`."""
@@ -349,8 +721,37 @@ class Config(BaseSettings, extra="forbid"):  # type:ignore[call-arg]
         # This ensures validation of the updated values
         updated_config = self.__class__.model_validate({**self.model_dump(), **update_dict})
 
-        for key, val in updated_config.model_dump().items():
-            setattr(self, key, val)
+        for key in type(self).model_fields:
+            setattr(self, key, getattr(updated_config, key))
+
+    def apply_profile(self, name: str) -> None:
+        """Apply the overrides of a build profile.
+
+        Values overridden by a previously applied profile are reset first,
+        so profiles can be switched.
+
+        Parameters
+        ----------
+        name : str
+            Name of the profile in :attr:`profiles`.
+
+        Raises
+        ------
+        QtDevHelperConfigError
+            If there is no profile with ``name``.
+        """
+        if name not in self.profiles:
+            msg = (
+                f"Unknown build profile {name!r}, "
+                f"available profiles: {', '.join(sorted(self.profiles)) or 'none'}"
+            )
+            raise QtDevHelperConfigError(msg)
+        if self._profile_base_values is None:
+            self._profile_base_values = {
+                key: getattr(self, key) for key in BuildProfile.model_fields
+            }
+        overrides = self.profiles[name].model_dump(exclude_none=True)
+        self.update({**self._profile_base_values, **overrides, "profile": name})
 
 
 def load_toml_config(path: Path) -> Config:
@@ -374,7 +775,10 @@ def load_toml_config(path: Path) -> Config:
     toml_config = tomli.loads(path.read_text())
     qt_dev_helper_config = toml_config.get("tool", {}).get("qt-dev-helper", {})
     if len(qt_dev_helper_config) > 0:
-        return Config.model_validate({**qt_dev_helper_config, "base_path": path.parent})
+        config = Config.model_validate({**qt_dev_helper_config, "base_path": path.parent})
+        if config.profile is not None:
+            config.apply_profile(config.profile)
+        return config
     msg = f"Could not find 'qt-dev-helper' config in {path.as_posix()}"
     raise ConfigNotFoundError(msg)
 
@@ -0,0 +1,162 @@
+r"""Write Makefile style dependency files (depfiles) for generated outputs.
+
+Depfiles list every input a generated file depends on, so external build systems
+(e.g. Make with ``-include`` or Ninja with ``depfile = $out.d``) can skip running
+the build when none of the inputs changed::
+
+    outputs/theme.qss: \
+      assets/styles/theme.scss \
+      assets/styles/_consts.scss
+
+    assets/styles/theme.scss:
+
+    assets/styles/_consts.scss:
+
+Each input additionally gets an empty rule (like ``gcc -MP``), so removing an
+input does not break the build.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEPFILE_SUFFIX = ".d"
+
+
+def escape_make_path(path: str) -> str:
+    """Escape characters of ``path`` which have a special meaning in Makefile rules.
+
+    Parameters
+    ----------
+    path : str
+        Path to escape.
+
+    Returns
+    -------
+    str
+        Escaped path.
+    """
+    return path.replace("$", "$$").replace("#", "\\#").replace(" ", "\\ ")
+
+
+def _format_path(path: Path, base_path: Path | None) -> str:
+    """Format ``path`` relative to ``base_path`` if possible.
+
+    Parameters
+    ----------
+    path : Path
+        Path to format.
+    base_path : Path | None
+        Path the paths are relative to, None means absolute paths.
+
+    Returns
+    -------
+    str
+        Escaped posix path.
+    """
+    path = Path(path).resolve()
+    if base_path is None:
+        return escape_make_path(path.as_posix())
+    try:
+        return escape_make_path(Path(os.path.relpath(path, Path(base_path).resolve())).as_posix())
+    except ValueError:
+        # Paths on different drives on windows
+        return escape_make_path(path.as_posix())
+
+
+def format_depfile(
+    target: Path, dependencies: Iterable[Path], *, base_path: Path | None = None
+) -> str:
+    """Create the content of the depfile of ``target``.
+
+    Parameters
+    ----------
+    target : Path
+        Generated file.
+    dependencies : Iterable[Path]
+        Files ``target`` depends on.
+    base_path : Path | None
+        Path the paths in the depfile are relative to, which should be the folder
+        the build system runs in. Defaults to None which means absolute paths.
+
+    Returns
+    -------
+    str
+        Rule of ``target`` followed by an empty rule for each dependency.
+    """
+    dependency_paths = list(dict.fromkeys(_format_path(path, base_path) for path in dependencies))
+    lines = [f"{_format_path(target, base_path)}:"]
+    lines += [f" \\\n  {path}" for path in dependency_paths]
+    lines += [f"\n\n{path}:" for path in dependency_paths]
+    return "".join([*lines, "\n"])
+
+
+def depfile_path(
+    target: Path, *, depfile_folder: Path | None = None, base_path: Path | None = None
+) -> Path:
+    """Path of the depfile of ``target``.
+
+    Parameters
+    ----------
+    target : Path
+        Generated file.
+    depfile_folder : Path | None
+        Folder to save depfiles in, mirroring the path of ``target`` relative to
+        ``base_path``. Defaults to None which means next to ``target``.
+    base_path : Path | None
+        Path the locations in ``depfile_folder`` are relative to. Defaults to None
+
+    Returns
+    -------
+    Path
+        Path of the depfile (e.g. 'Ui_form.py.d').
+    """
+    target = Path(target)
+    if depfile_folder is None:
+        return target.with_name(f"{target.name}{DEPFILE_SUFFIX}")
+    rel_target = Path(target.name)
+    if base_path is not None and target.resolve().is_relative_to(Path(base_path).resolve()):
+        rel_target = target.resolve().relative_to(Path(base_path).resolve())
+    return Path(depfile_folder) / rel_target.with_name(f"{rel_target.name}{DEPFILE_SUFFIX}")
+
+
+def write_depfile(
+    target: Path,
+    dependencies: Iterable[Path],
+    *,
+    depfile_folder: Path | None = None,
+    base_path: Path | None = None,
+) -> Path | None:
+    """Write the depfile of ``target`` if its content changed.
+
+    Unchanged depfiles are not written, so their modification time stays the same.
+
+    Parameters
+    ----------
+    target : Path
+        Generated file.
+    dependencies : Iterable[Path]
+        Files ``target`` depends on.
+    depfile_folder : Path | None
+        Folder to save the depfile in (see :func:`depfile_path`). Defaults to None
+    base_path : Path | None
+        Path the paths in the depfile and the locations in ``depfile_folder``
+        are relative to. Defaults to None
+
+    Returns
+    -------
+    Path | None
+        Path of the written depfile or None if it was up to date.
+    """
+    output_path = depfile_path(target, depfile_folder=depfile_folder, base_path=base_path)
+    content = format_depfile(target, dependencies, base_path=base_path)
+    if output_path.is_file() and output_path.read_text(encoding="utf8") == content:
+        return None
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(content, encoding="utf8")
+    return output_path
@@ -0,0 +1,351 @@
+"""Import hook compiling ui and qrc files on demand, so no build step is needed during development.
+
+Example
+-------
+Install the hook before importing any generated modules (e.g. in the entry point
+of the application)::
+
+    from qt_dev_helper.import_hook import install_import_hook
+
+    install_import_hook()
+
+    from Ui_main_window import Ui_MainWindow
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from qt_dev_helper.cache import hash_content
+from qt_dev_helper.config import Config
+from qt_dev_helper.config import QtDevHelperConfigError
+from qt_dev_helper.config import load_config
+from qt_dev_helper.qrc import read_qrc
+from qt_dev_helper.resources import compile_resource_file
+from qt_dev_helper.transpiler import compile_ui_file
+from qt_dev_helper.transpiler import resource_output_paths
+from qt_dev_helper.transpiler import ui_output_paths
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import ModuleType
+
+IMPORT_HOOK_FOLDER_NAME = "import_hook"
+DEFAULT_CACHE_FOLDER = ".qt-dev-helper-cache"
+
+
+def _file_signature(path: Path) -> list[int] | None:
+    """Modification time and size of a file, which change if the file is changed.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file.
+
+    Returns
+    -------
+    list[int] | None
+        Modification time in nanoseconds and size, or None if the file does not exist.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class QtAssetFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder compiling ui and qrc files of a project when their module is imported.
+
+    Modules are named like the outputs of :func:`.build_uis` and :func:`.build_resources`
+    with flattened folder structure (e.g. 'Ui_main_window' or 'icons_rc').
+    Generated modules are written to ``cache_folder`` together with the modification
+    times and sizes of their inputs, so unchanged modules only cost a ``stat`` call
+    per input and forms which are never imported are never compiled.
+
+    Parameters
+    ----------
+    config : Config
+        Project configuration defining the ui and resource folders and tool arguments.
+    cache_folder : Path | None
+        Folder to write generated modules to. Defaults to None which means the
+        'import_hook' folder inside of the build cache folder of ``config``
+        (or '.qt-dev-helper-cache' in the project folder if caching is disabled).
+    package : str | None
+        Package the generated modules are provided in (e.g. 'my_app.generated').
+        The package is created as namespace package if it does not exist.
+        Defaults to None which means top-level modules.
+    """
+
+    def __init__(
+        self, config: Config, *, cache_folder: Path | None = None, package: str | None = None
+    ) -> None:
+        self.config = config
+        if cache_folder is None:
+            cache_folder = (
+                config.cache_path() or config.base_path / DEFAULT_CACHE_FOLDER
+            ) / IMPORT_HOOK_FOLDER_NAME
+        self.cache_folder = Path(cache_folder)
+        self.package = package
+        self._sources: dict[str, tuple[str, Path]] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def sources(self) -> dict[str, tuple[str, Path]]:
+        """Kind ('ui' or 'qrc') and source file by module name, found on first access.
+
+        Returns
+        -------
+        dict[str, tuple[str, Path]]
+            Sources of the modules provided by the finder.
+        """
+        if self._sources is None:
+            sources: dict[str, tuple[str, Path]] = {}
+            for kind, folder_paths, output_paths in (
+                ("ui", self.config.ui_folder_paths, ui_output_paths),
+                ("qrc", self.config.rc_folder_paths, resource_output_paths),
+            ):
+                try:
+                    input_folder, _ = folder_paths()
+                except QtDevHelperConfigError:
+                    continue
+                for source_file, module_file in output_paths(
+                    input_folder,
+                    self.cache_folder,
+                    collision_policy=self.config.output_collision_policy.value,
+                ):
+                    sources[module_file.stem] = (kind, source_file)
+            self._sources = sources
+        return self._sources
+
+    def invalidate_caches(self) -> None:
+        """Find the ui and qrc files again on next import (see ``importlib.invalidate_caches``)."""
+        self._sources = None
+
+    def _options_fingerprint(self, kind: str) -> str:
+        """Fingerprint of the options a module of ``kind`` is compiled with.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of the source file ('ui' or 'qrc').
+
+        Returns
+        -------
+        str
+            Fingerprint of the options.
+        """
+        if kind == "ui":
+            return hash_content(kind, str(self._form_import()), *self.config.uic_args)
+        return hash_content(kind, json.dumps(self.config.rcc_kwargs(), sort_keys=True))
+
+    def _form_import(self) -> bool:
+        """Whether or not generated forms import resource modules relative to their package.
+
+        Returns
+        -------
+        bool
+            True if the modules are provided in a package and ``form_import`` is enabled.
+        """
+        return self.package is not None and self.config.form_import
+
+    def _record_file(self, module_name: str) -> Path:
+        """Path to the record of the inputs a module was compiled from.
+
+        Parameters
+        ----------
+        module_name : str
+            Name of the generated module.
+
+        Returns
+        -------
+        Path
+            Path to the JSON record.
+        """
+        return self.cache_folder / f"{module_name}.inputs.json"
+
+    def is_stale(self, module_name: str) -> bool:
+        """Check if a generated module needs to be compiled.
+
+        Parameters
+        ----------
+        module_name : str
+            Name of the generated module.
+
+        Returns
+        -------
+        bool
+            Whether the module is missing or any of its inputs or options changed.
+        """
+        kind, _ = self.sources[module_name]
+        module_file = self.cache_folder / f"{module_name}.py"
+        try:
+            record = json.loads(self._record_file(module_name).read_text(encoding="utf8"))
+        except (OSError, json.JSONDecodeError):
+            return True
+        return (
+            not module_file.is_file()
+            or record.get("options") != self._options_fingerprint(kind)
+            or any(
+                _file_signature(Path(input_file)) != signature
+                for input_file, signature in record.get("inputs", {}).items()
+            )
+        )
+
+    def compile_module(self, module_name: str) -> Path:
+        """Compile the source of a module and record its inputs.
+
+        Parameters
+        ----------
+        module_name : str
+            Name of the generated module.
+
+        Returns
+        -------
+        Path
+            Path to the generated module.
+        """
+        kind, source_file = self.sources[module_name]
+        module_file = self.cache_folder / f"{module_name}.py"
+        input_files = [source_file]
+        if kind == "ui":
+            compile_ui_file(
+                source_file,
+                module_file,
+                form_import=self._form_import(),
+                uic_args=self.config.uic_args,
+            )
+        else:
+            input_files += [entry.file for entry in read_qrc(source_file)]
+            rcc_kwargs = self.config.rcc_kwargs()
+            rcc_kwargs["generator"] = "python"
+            compile_resource_file(source_file, module_file, **rcc_kwargs)
+        self._record_file(module_name).write_text(
+            json.dumps(
+                {
+                    "options": self._options_fingerprint(kind),
+                    "inputs": {
+                        input_file.as_posix(): _file_signature(input_file)
+                        for input_file in input_files
+                    },
+                },
+                indent=2,
+            ),
+            encoding="utf8",
+        )
+        return module_file
+
+    def _module_name(self, fullname: str) -> str | None:
+        """Name of the generated module requested by an import.
+
+        Parameters
+        ----------
+        fullname : str
+            Fully qualified name of the imported module.
+
+        Returns
+        -------
+        str | None
+            Module name without :attr:`package` or None if the module is not in the package.
+        """
+        if self.package is None:
+            return fullname if "." not in fullname else None
+        package, _, module_name = fullname.rpartition(".")
+        return module_name if package == self.package else None
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,  # noqa: ARG002
+        target: ModuleType | None = None,  # noqa: ARG002
+    ) -> importlib.machinery.ModuleSpec | None:
+        """Compile the requested module if it is stale and create its spec.
+
+        Additional modules generated alongside a resource module (e.g. shards or
+        prefix modules) are provided as well.
+
+        Parameters
+        ----------
+        fullname : str
+            Fully qualified name of the imported module.
+        path : Sequence[str] | None
+            Search locations of the parent package (unused).
+        target : ModuleType | None
+            Module to reload (unused). Defaults to None
+
+        Returns
+        -------
+        importlib.machinery.ModuleSpec | None
+            Spec loading the generated module or None if it is not provided by the finder.
+        """
+        if self.package is not None and fullname == self.package:
+            if importlib.machinery.PathFinder.find_spec(fullname) is not None:
+                return None
+            return importlib.machinery.ModuleSpec(fullname, None, is_package=True)
+        module_name = self._module_name(fullname)
+        if module_name is None:
+            return None
+        module_file = self.cache_folder / f"{module_name}.py"
+        if module_name in self.sources:
+            with self._lock:
+                if self.is_stale(module_name):
+                    self.compile_module(module_name)
+        elif not (
+            any(
+                module_name.startswith(f"{source_module}_")
+                for source_module, (kind, _) in self.sources.items()
+                if kind == "qrc"
+            )
+            and module_file.is_file()
+        ):
+            return None
+        return importlib.util.spec_from_file_location(fullname, module_file)
+
+
+def install_import_hook(
+    config: Config | str | Path | None = None,
+    *,
+    cache_folder: Path | None = None,
+    package: str | None = None,
+) -> QtAssetFinder:
+    """Install a :class:`QtAssetFinder` as first entry of ``sys.meta_path``.
+
+    Parameters
+    ----------
+    config : Config | str | Path | None
+        Configuration of the project or path to start looking for the config file.
+        Defaults to None which means the current dir will be used
+    cache_folder : Path | None
+        Folder to write generated modules to (see :class:`QtAssetFinder`). Defaults to None
+    package : str | None
+        Package the generated modules are provided in. Defaults to None
+
+    Returns
+    -------
+    QtAssetFinder
+        Installed finder, which can be passed to :func:`uninstall_import_hook`.
+    """
+    if not isinstance(config, Config):
+        config = load_config(config)
+    finder = QtAssetFinder(config, cache_folder=cache_folder, package=package)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def uninstall_import_hook(finder: QtAssetFinder) -> None:
+    """Remove a finder installed by :func:`install_import_hook` from ``sys.meta_path``.
+
+    Parameters
+    ----------
+    finder : QtAssetFinder
+        Installed finder.
+    """
+    if finder in sys.meta_path:
+        sys.meta_path.remove(finder)
@@ -0,0 +1,408 @@
+"""Export the asset build graph as Ninja build file, so Ninja can rebuild single assets.
+
+The edges call 'uic' and 'rcc' with the same arguments as :func:`.compile_ui_file` and
+:func:`.compile_resource_file`. Stylesheets are transpiled by running this module::
+
+    python -m qt_dev_helper.ninja theme.scss theme.qss --output-style compressed
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from qt_dev_helper.config import Config
+from qt_dev_helper.config import QtDevHelperConfigError
+from qt_dev_helper.config import load_config
+from qt_dev_helper.qrc import read_qrc
+from qt_dev_helper.qt_tools import find_qt_tool
+from qt_dev_helper.resources import rcc_arguments
+from qt_dev_helper.transpiler import collect_sass_partials
+from qt_dev_helper.transpiler import expand_style_variants
+from qt_dev_helper.transpiler import resource_output_paths
+from qt_dev_helper.transpiler import transpile_sass
+from qt_dev_helper.transpiler import ui_output_paths
+from qt_dev_helper.transpiler import uic_arguments
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+
+NINJA_FILE_NAME = "build.ninja"
+NINJA_HEADER = "# Asset build graph generated by 'qt-dev-helper export-ninja', do not edit.\n"
+
+
+def _quote_command(args: Sequence[str]) -> str:
+    """Join command line arguments to be run by the shell of the platform.
+
+    Parameters
+    ----------
+    args : Sequence[str]
+        Command line arguments.
+
+    Returns
+    -------
+    str
+        Quoted command line.
+    """
+    if os.name == "nt":
+        return subprocess.list2cmdline(args)
+    return shlex.join(args)
+
+
+def ninja_escape(value: str, *, path: bool = False) -> str:
+    """Escape special characters of Ninja.
+
+    Parameters
+    ----------
+    value : str
+        Value to escape.
+    path : bool
+        Whether or not ``value`` is used as path in a build statement, where spaces
+        and colons need to be escaped as well. Defaults to False
+
+    Returns
+    -------
+    str
+        Escaped value.
+    """
+    value = value.replace("$", "$$").replace("\n", "$\n")
+    if path is True:
+        value = value.replace(" ", "$ ").replace(":", "$:")
+    return value
+
+
+class NinjaWriter:
+    """Collect rules and build edges of a Ninja build file.
+
+    Paths are written relative to ``build_folder``, which Ninja is run in.
+
+    Parameters
+    ----------
+    build_folder : Path
+        Folder the Ninja file is written to.
+    """
+
+    def __init__(self, build_folder: Path) -> None:
+        self.build_folder = Path(build_folder).resolve()
+        self.lines: list[str] = [NINJA_HEADER]
+        self.outputs: list[str] = []
+
+    def path(self, path: str | Path) -> str:
+        """Format ``path`` relative to :attr:`build_folder` if possible.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to format.
+
+        Returns
+        -------
+        str
+            Posix path as used in the Ninja file.
+        """
+        path = Path(path).resolve()
+        try:
+            return Path(os.path.relpath(path, self.build_folder)).as_posix()
+        except ValueError:
+            # Paths on different drives on windows
+            return path.as_posix()
+
+    def rule(self, name: str, description: str) -> None:
+        """Add a rule running the command of each edge.
+
+        Parameters
+        ----------
+        name : str
+            Name of the rule.
+        description : str
+            Description printed by Ninja, which can use the variables of the edge.
+        """
+        self.lines += [f"rule {name}", "  command = $cmd", f"  description = {description}", ""]
+
+    def build(
+        self,
+        rule: str,
+        outputs: Sequence[Path],
+        inputs: Sequence[Path],
+        command: Sequence[str],
+        *,
+        implicit: Iterable[Path] = (),
+    ) -> None:
+        """Add a build edge.
+
+        Parameters
+        ----------
+        rule : str
+            Rule of the edge.
+        outputs : Sequence[Path]
+            Files generated by the edge.
+        inputs : Sequence[Path]
+            Explicit inputs of the edge.
+        command : Sequence[str]
+            Command line arguments of the edge.
+        implicit : Iterable[Path]
+            Additional files the outputs depend on. Defaults to ()
+        """
+        output_paths = [self.path(output) for output in outputs]
+        statement = " ".join(
+            [
+                f"build {' '.join(ninja_escape(path, path=True) for path in output_paths)}:",
+                rule,
+                *(ninja_escape(self.path(path), path=True) for path in inputs),
+            ]
+        )
+        implicit_paths = sorted({ninja_escape(self.path(path), path=True) for path in implicit})
+        if len(implicit_paths) > 0:
+            statement += " | " + " ".join(implicit_paths)
+        self.lines += [statement, f"  cmd = {ninja_escape(_quote_command(command))}", ""]
+        self.outputs += output_paths
+
+    def text(self) -> str:
+        """Create the content of the Ninja file with a phony 'qt_assets' target.
+
+        Returns
+        -------
+        str
+            Content of the Ninja file.
+        """
+        all_outputs = " ".join(ninja_escape(path, path=True) for path in self.outputs)
+        return "\n".join(
+            [*self.lines, f"build qt_assets: phony {all_outputs}", "default qt_assets", ""]
+        )
+
+
+def _check_supported(config: Config) -> None:
+    """Raise an error for options, which need more than a single tool call per asset.
+
+    Parameters
+    ----------
+    config : Config
+        Configuration to export.
+
+    Raises
+    ------
+    QtDevHelperConfigError
+        If an unsupported option is enabled.
+    """
+    unsupported = {
+        "rcc_lazy": config.rcc_lazy,
+        "rcc_shards": config.rcc_shards is not None and config.rcc_shards > 1,
+        "rcc_binary": config.rcc_binary and config.generator.value == "python",
+        "rcc_deduplication": config.rcc_deduplication.value == "share",
+        "optimize_assets": config.optimize_assets,
+        "rcc_compression_tuning": config.rcc_compression_tuning.value != "off",
+        "ui_registry": config.ui_registry and config.generator.value == "python",
+    }
+    enabled = [option for option, is_enabled in unsupported.items() if is_enabled]
+    if len(enabled) > 0:
+        msg = (
+            "The following options can't be exported to Ninja, use 'qt-dev-helper build' "
+            f"instead: {', '.join(enabled)}"
+        )
+        raise QtDevHelperConfigError(msg)
+
+
+def _add_style_edges(writer: NinjaWriter, config: Config) -> None:
+    """Add an edge for each stylesheet and its variants.
+
+    Parameters
+    ----------
+    writer : NinjaWriter
+        Writer to add the edges to.
+    config : Config
+        Configuration defining the stylesheets.
+    """
+    try:
+        style_paths = config.style_paths()
+    except QtDevHelperConfigError:
+        return
+    writer.rule("sass", "Transpiling $out")
+    for sass_file, qss_file, variables in expand_style_variants(
+        style_paths, config.style_variants, variant_file_name=config.style_variant_file_name
+    ):
+        command = [
+            sys.executable,
+            "-m",
+            "qt_dev_helper.ninja",
+            writer.path(sass_file),
+            writer.path(qss_file),
+            "--conformer",
+            config.sass_conformer.value,
+            "--output-style",
+            config.sass_output_style.value,
+        ]
+        if config.qss_minify is True:
+            command.append("--minify")
+        for name, value in sorted(variables.items()):
+            command += ["--variable", f"{name}={value}"]
+        writer.build(
+            "sass",
+            [qss_file],
+            [sass_file],
+            command,
+            implicit=(
+                Path(partial)
+                for partial in collect_sass_partials(
+                    sass_file, conformer=config.sass_conformer.value
+                )
+            ),
+        )
+
+
+def _add_ui_edges(writer: NinjaWriter, config: Config, *, recurse_folder: bool) -> None:
+    """Add an edge for each ui file.
+
+    Parameters
+    ----------
+    writer : NinjaWriter
+        Writer to add the edges to.
+    config : Config
+        Configuration defining the ui files.
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files.
+    """
+    try:
+        ui_files_folder, generated_ui_code_folder = config.ui_folder_paths()
+    except QtDevHelperConfigError:
+        return
+    writer.rule("uic", "Compiling $out")
+    uic = find_qt_tool("uic")
+    for ui_file, out_file in ui_output_paths(
+        ui_files_folder,
+        generated_ui_code_folder,
+        flatten_path=config.flatten_folder_structure,
+        generator=config.generator.value,
+        recurse_folder=recurse_folder,
+        collision_policy=config.output_collision_policy.value,
+    ):
+        args = uic_arguments(
+            writer.path(ui_file),
+            writer.path(out_file),
+            generator=config.generator.value,
+            form_import=config.form_import,
+            uic_args=config.uic_args,
+        )
+        writer.build("uic", [out_file], [ui_file], [uic, *args])
+
+
+def _add_resource_edges(writer: NinjaWriter, config: Config, *, recurse_folder: bool) -> None:
+    """Add an edge for each qrc file, depending on all files it references.
+
+    Parameters
+    ----------
+    writer : NinjaWriter
+        Writer to add the edges to.
+    config : Config
+        Configuration defining the qrc files.
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files.
+    """
+    try:
+        resource_folder, generated_rc_code_folder = config.rc_folder_paths()
+    except QtDevHelperConfigError:
+        return
+    writer.rule("rcc", "Compiling $out")
+    rcc = find_qt_tool("rcc")
+    for qrc_file, out_file in resource_output_paths(
+        resource_folder,
+        generated_rc_code_folder,
+        flatten_path=config.flatten_folder_structure,
+        generator=config.generator.value,
+        recurse_folder=recurse_folder,
+        collision_policy=config.output_collision_policy.value,
+    ):
+        output_file = out_file.with_suffix(".rcc") if config.rcc_binary is True else out_file
+        args = rcc_arguments(
+            writer.path(qrc_file),
+            writer.path(output_file),
+            generator=config.generator.value,
+            rcc_args=config.rcc_args,
+            binary=config.rcc_binary,
+        )
+        writer.build(
+            "rcc",
+            [output_file],
+            [qrc_file],
+            [rcc, *args],
+            implicit=(entry.file for entry in read_qrc(qrc_file)),
+        )
+
+
+def export_ninja(
+    config: Config | str | Path,
+    output_path: str | Path | None = None,
+    *,
+    recurse_folder: bool = True,
+) -> Path:
+    """Write a Ninja file with one edge per stylesheet, ui file and qrc file.
+
+    Parameters
+    ----------
+    config : Config | str | Path
+        Configuration to export. If a path is passed it will try to find the config.
+    output_path : str | Path | None
+        Path to write the Ninja file to. Defaults to None which means
+        'build.ninja' in the base path of the config.
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+
+    Returns
+    -------
+    Path
+        Path to the written Ninja file.
+    """
+    if not isinstance(config, Config):
+        config = load_config(config)
+    _check_supported(config)
+    output_path = Path(
+        config.base_path / NINJA_FILE_NAME if output_path is None else output_path
+    ).resolve()
+    writer = NinjaWriter(output_path.parent)
+    _add_style_edges(writer, config)
+    _add_resource_edges(writer, config, recurse_folder=recurse_folder)
+    _add_ui_edges(writer, config, recurse_folder=recurse_folder)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(writer.text(), encoding="utf8")
+    return output_path
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Transpile a single stylesheet, used by the edges of exported Ninja files.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None
+        Command line arguments. Defaults to None which means ``sys.argv[1:]``
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m qt_dev_helper.ninja", description=main.__doc__
+    )
+    parser.add_argument("sass_file")
+    parser.add_argument("qss_file")
+    parser.add_argument(
+        "--conformer", choices=["qt-dev-helper", "qtsass"], default="qt-dev-helper"
+    )
+    parser.add_argument(
+        "--output-style", choices=["nested", "expanded", "compact", "compressed"], default="nested"
+    )
+    parser.add_argument("--minify", action="store_true")
+    parser.add_argument("--variable", action="append", default=[], metavar="NAME=VALUE")
+    args = parser.parse_args(argv)
+    transpile_sass(
+        args.sass_file,
+        args.qss_file,
+        variables=dict(variable.split("=", 1) for variable in args.variable),
+        conformer=args.conformer,
+        minify=args.minify,
+        output_style=args.output_style,
+    )
+
+
+if __name__ == "__main__":
+    main()
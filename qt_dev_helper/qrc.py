@@ -0,0 +1,298 @@
+"""Module to read, split and write Qt resource collection (qrc) files."""
+
+from __future__ import annotations
+
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Literal
+
+from qt_dev_helper.cache import hash_content
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+
+_NON_IDENTIFIER_PATTERN = re.compile(r"\W+")
+
+
+@dataclass
+class QrcEntry:
+    """File entry of a qrc file."""
+
+    prefix: str
+    alias: str
+    file: Path
+    lang: str | None = None
+    attributes: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def resource_path(self) -> str:
+        """Path used to access the file from Qt (e.g. ':/icons/circle.svg').
+
+        Returns
+        -------
+        str
+            Resource path of the file.
+        """
+        return f":{self.prefix.rstrip('/')}/{self.alias}"
+
+
+def normalize_prefix(prefix: str | None) -> str:
+    """Normalize a resource prefix to start with exactly one slash.
+
+    Parameters
+    ----------
+    prefix : str | None
+        Prefix as given in a qrc file.
+
+    Returns
+    -------
+    str
+        Normalized prefix (e.g. 'icons' => '/icons').
+    """
+    return "/" + (prefix or "").strip("/")
+
+
+def read_qrc(qrc_file: Path) -> list[QrcEntry]:
+    """Read the file entries of a qrc file.
+
+    Parameters
+    ----------
+    qrc_file : Path
+        Path to the qrc file.
+
+    Returns
+    -------
+    list[QrcEntry]
+        Entries in order of definition, with file paths resolved relative to ``qrc_file``.
+    """
+    qrc_file = Path(qrc_file)
+    entries = []
+    for qresource in ET.parse(qrc_file).getroot().iter("qresource"):
+        prefix = normalize_prefix(qresource.get("prefix"))
+        for file_element in qresource.iter("file"):
+            file_name = (file_element.text or "").strip()
+            attributes = dict(file_element.attrib)
+            alias = attributes.pop("alias", file_name)
+            entries.append(
+                QrcEntry(
+                    prefix=prefix,
+                    alias=alias,
+                    file=(qrc_file.parent / file_name).resolve(),
+                    lang=qresource.get("lang"),
+                    attributes=attributes,
+                )
+            )
+    return entries
+
+
+def write_qrc(entries: Iterable[QrcEntry], qrc_file: Path) -> Path:
+    """Write entries to a qrc file, which can be saved independent of the referenced files.
+
+    Files are referenced by absolute path and the original path is kept as alias.
+
+    Parameters
+    ----------
+    entries : Iterable[QrcEntry]
+        Entries to write.
+    qrc_file : Path
+        Path the qrc file should be saved to.
+
+    Returns
+    -------
+    Path
+        Path to the written qrc file.
+    """
+    rcc = ET.Element("RCC")
+    qresources: dict[tuple[str, str | None], ET.Element] = {}
+    for entry in entries:
+        key = (entry.prefix, entry.lang)
+        if key not in qresources:
+            qresource_attributes = {"prefix": entry.prefix}
+            if entry.lang is not None:
+                qresource_attributes["lang"] = entry.lang
+            qresources[key] = ET.SubElement(rcc, "qresource", qresource_attributes)
+        file_element = ET.SubElement(
+            qresources[key], "file", {"alias": entry.alias, **entry.attributes}
+        )
+        file_element.text = entry.file.as_posix()
+    qrc_file = Path(qrc_file)
+    qrc_file.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(rcc).write(qrc_file, encoding="utf-8", xml_declaration=False)
+    return qrc_file
+
+
+def group_by_prefix(entries: Iterable[QrcEntry]) -> dict[str, list[QrcEntry]]:
+    """Group entries by their prefix.
+
+    Parameters
+    ----------
+    entries : Iterable[QrcEntry]
+        Entries to group.
+
+    Returns
+    -------
+    dict[str, list[QrcEntry]]
+        Entries by prefix in order of first definition.
+    """
+    groups: dict[str, list[QrcEntry]] = {}
+    for entry in entries:
+        groups.setdefault(entry.prefix, []).append(entry)
+    return groups
+
+
+def prefix_identifier(prefix: str, used_identifiers: Iterable[str] = ()) -> str:
+    """Create a python identifier for a prefix, which is not in ``used_identifiers``.
+
+    Parameters
+    ----------
+    prefix : str
+        Resource prefix.
+    used_identifiers : Iterable[str]
+        Identifiers which are already used. Defaults to ()
+
+    Returns
+    -------
+    str
+        Identifier (e.g. '/icons/dark' => 'icons_dark', '/' => 'root').
+    """
+    identifier = _NON_IDENTIFIER_PATTERN.sub("_", prefix.strip("/")).strip("_") or "root"
+    if identifier[0].isdigit():
+        identifier = f"_{identifier}"
+    used_identifiers = set(used_identifiers)
+    unique_identifier = identifier
+    index = 1
+    while unique_identifier in used_identifiers:
+        unique_identifier = f"{identifier}_{index}"
+        index += 1
+    return unique_identifier
+
+
+def _file_size(entry: QrcEntry) -> int:
+    """Size of the file of an entry.
+
+    Parameters
+    ----------
+    entry : QrcEntry
+        Entry to get the file size of.
+
+    Returns
+    -------
+    int
+        File size in bytes or 0 if the file does not exist.
+    """
+    try:
+        return entry.file.stat().st_size
+    except OSError:
+        return 0
+
+
+def split_entries(
+    entries: Sequence[QrcEntry],
+    shard_count: int,
+    *,
+    strategy: Literal["prefix", "size"] = "prefix",
+) -> list[list[QrcEntry]]:
+    """Split entries into at most ``shard_count`` contiguous shards of similar file size.
+
+    Parts (whole prefixes or single files) are assigned to shards in order of definition
+    by the position of their center in the cumulative file size. Changing a file only
+    moves parts close to shard boundaries, so most shards keep their content and
+    can be reused from the build cache.
+
+    Parameters
+    ----------
+    entries : Sequence[QrcEntry]
+        Entries to split.
+    shard_count : int
+        Maximal number of shards.
+    strategy : Literal["prefix", "size"]
+        Whether to keep all entries of a prefix in the same shard ('prefix')
+        or to split by single files ('size'). Defaults to "prefix"
+
+    Returns
+    -------
+    list[list[QrcEntry]]
+        Non empty shards.
+    """
+    if strategy == "prefix":
+        parts = list(group_by_prefix(entries).values())
+    else:
+        parts = [[entry] for entry in entries]
+    # Every part counts at least one byte so empty files are split as well
+    part_sizes = [max(sum(_file_size(entry) for entry in part), 1) for part in parts]
+    total_size = sum(part_sizes)
+    shard_count = max(shard_count, 1)
+
+    shards: list[list[QrcEntry]] = [[] for _ in range(shard_count)]
+    cumulative_size = 0
+    for part, part_size in zip(parts, part_sizes):
+        center = cumulative_size + part_size / 2
+        shards[min(int(center * shard_count / total_size), shard_count - 1)] += part
+        cumulative_size += part_size
+    return [shard for shard in shards if len(shard) > 0]
+
+
+@dataclass
+class DuplicateResource:
+    """File content referenced by multiple qrc files."""
+
+    content_hash: str
+    size: int
+    entries: list[tuple[Path, QrcEntry]] = field(default_factory=list)
+
+    @property
+    def qrc_files(self) -> list[Path]:
+        """Qrc files referencing the content.
+
+        Returns
+        -------
+        list[Path]
+            Unique qrc files in order of discovery.
+        """
+        return list(dict.fromkeys(qrc_file for qrc_file, _ in self.entries))
+
+    @property
+    def wasted_size(self) -> int:
+        """Size of the additional copies of the content embedded in generated code.
+
+        Returns
+        -------
+        int
+            Wasted size in bytes.
+        """
+        return self.size * (len(self.qrc_files) - 1)
+
+
+def find_duplicate_resources(qrc_files: Iterable[Path]) -> list[DuplicateResource]:
+    """Find files with identical content referenced by different qrc files.
+
+    Duplicates inside of a single qrc file are ignored, since 'rcc' only
+    embeds identical content once per compiled qrc file.
+
+    Parameters
+    ----------
+    qrc_files : Iterable[Path]
+        Qrc files to analyze.
+
+    Returns
+    -------
+    list[DuplicateResource]
+        Duplicates sorted by wasted size, largest first.
+    """
+    resources: dict[str, DuplicateResource] = {}
+    content_hashes: dict[Path, str] = {}
+    for qrc_file in qrc_files:
+        for entry in read_qrc(qrc_file):
+            if entry.file not in content_hashes:
+                content_hashes[entry.file] = hash_content(entry.file.read_bytes())
+            content_hash = content_hashes[entry.file]
+            if content_hash not in resources:
+                resources[content_hash] = DuplicateResource(content_hash, _file_size(entry))
+            resources[content_hash].entries.append((Path(qrc_file), entry))
+    duplicates = [resource for resource in resources.values() if len(resource.qrc_files) > 1]
+    return sorted(duplicates, key=lambda resource: resource.wasted_size, reverse=True)
@@ -0,0 +1,182 @@
+"""Linear time conformers between qss and scss.
+
+This is a drop-in replacement for ``qtsass.conformers`` which produces the same
+output for well-formed stylesheets. Instead of running regular expressions with
+backtracking and replacing each match in the whole source, the source is scanned
+once and gradient arguments are parsed by matching parentheses.
+"""
+
+from __future__ import annotations
+
+import re
+
+GRADIENT_COORDINATES = {
+    "qlineargradient": ("x1", "y1", "x2", "y2"),
+    "qradialgradient": ("cx", "cy", "radius", "fx", "fy"),
+}
+
+_GRADIENT_START_PATTERN = re.compile(r"(qlineargradient|qradialgradient)\(")
+_DELIMITER_PATTERN = re.compile(r"[(),]")
+_KEY_VALUE_PATTERN = re.compile(r"\s*([a-z0-9]+):\s*([0-9A-Za-z$_.-]+)")
+_STOP_PATTERN = re.compile(r"\s*stop:([^\n]*)")
+_LAST_STOP_PATTERN = re.compile(r"\s*stop:([^\n]*?)\s*")
+
+
+def _split_arguments(source: str, start: int) -> tuple[list[str], int] | None:
+    """Split the top level comma separated arguments of a function call.
+
+    Parameters
+    ----------
+    source : str
+        Source code containing the function call.
+    start : int
+        Index right after the opening parenthesis of the function call.
+
+    Returns
+    -------
+    tuple[list[str], int] | None
+        Arguments and index right after the closing parenthesis,
+        or None if the parenthesis is never closed.
+    """
+    arguments = []
+    argument_start = start
+    depth = 0
+    for match in _DELIMITER_PATTERN.finditer(source, start):
+        delimiter = match.group()
+        if delimiter == "(":
+            depth += 1
+        elif delimiter == "," and depth == 0:
+            arguments.append(source[argument_start : match.start()])
+            argument_start = match.end()
+        elif delimiter == ")":
+            if depth == 0:
+                arguments.append(source[argument_start : match.start()])
+                return arguments, match.end()
+            depth -= 1
+    return None
+
+
+def _consume_key_values(
+    arguments: list[str], index: int, keys: tuple[str, ...]
+) -> tuple[list[tuple[str, str]], int]:
+    """Consume consecutive ``key: value`` arguments with a key from ``keys``.
+
+    Parameters
+    ----------
+    arguments : list[str]
+        Raw function arguments.
+    index : int
+        Index of the first argument to consume.
+    keys : tuple[str, ...]
+        Valid keys.
+
+    Returns
+    -------
+    tuple[list[tuple[str, str]], int]
+        Consumed keys and values and index of the first not consumed argument.
+    """
+    key_values = []
+    while index < len(arguments):
+        match = _KEY_VALUE_PATTERN.fullmatch(arguments[index])
+        if match is None or match.group(1) not in keys:
+            break
+        key_values.append((match.group(1), match.group(2)))
+        index += 1
+    return key_values, index
+
+
+def _conform_gradient_arguments(function_name: str, arguments: list[str]) -> str | None:
+    """Conform qss gradient arguments to the form the qtsass scss functions expect.
+
+    E.g. ``x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 red, stop: 1 blue``
+    => ``0, 0, 0, 1, (0 red, 1 blue)``
+
+    Parameters
+    ----------
+    function_name : str
+        Name of the gradient function.
+    arguments : list[str]
+        Raw arguments of the gradient function.
+
+    Returns
+    -------
+    str | None
+        Conformed arguments or None if the arguments are not in qss form.
+    """
+    coordinate_names = GRADIENT_COORDINATES[function_name]
+    spreads: list[tuple[str, str]] = []
+    index = 0
+    if function_name == "qradialgradient":
+        spreads, index = _consume_key_values(arguments, index, ("spread",))
+
+    coordinate_values, index = _consume_key_values(arguments, index, coordinate_names)
+    if len(coordinate_values) == 0:
+        return None
+    coordinates = ["0"] * len(coordinate_names)
+    for name, value in coordinate_values:
+        coordinates[coordinate_names.index(name)] = value
+
+    stops = []
+    for stop_index in range(index, len(arguments)):
+        stop_pattern = _LAST_STOP_PATTERN if stop_index == len(arguments) - 1 else _STOP_PATTERN
+        match = stop_pattern.fullmatch(arguments[stop_index])
+        if match is None:
+            return None
+        stops.append(match.group(1).strip())
+
+    conformed = ", ".join(coordinates)
+    if function_name == "qradialgradient":
+        spread = spreads[-1][1] if len(spreads) > 0 else "pad"
+        conformed = f"'{spread}', {conformed}"
+    if len(stops) > 0:
+        conformed += f", ({', '.join(stops)})"
+    return conformed
+
+
+def scss_conform(qss: str) -> str:
+    """Conform qss to valid scss.
+
+    Parameters
+    ----------
+    qss : str
+        Qss source code.
+
+    Returns
+    -------
+    str
+        Scss source code which can be compiled with the qtsass custom functions.
+    """
+    qss = qss.replace(":!", ":_qnot_")
+    chunks = []
+    position = 0
+    for match in _GRADIENT_START_PATTERN.finditer(qss):
+        if match.start() < position:
+            continue
+        split_result = _split_arguments(qss, match.end())
+        if split_result is None:
+            # All following gradients are inside of the unclosed parenthesis
+            break
+        arguments, end = split_result
+        conformed_arguments = _conform_gradient_arguments(match.group(1), arguments)
+        if conformed_arguments is None:
+            continue
+        chunks += [qss[position : match.end()], conformed_arguments, ")"]
+        position = end
+    chunks.append(qss[position:])
+    return "".join(chunks)
+
+
+def qt_conform(css: str) -> str:
+    """Conform css to valid qss.
+
+    Parameters
+    ----------
+    css : str
+        Css compiled by libsass.
+
+    Returns
+    -------
+    str
+        Valid qss source code.
+    """
+    return css.replace(":_qnot_", ":!")
@@ -0,0 +1,274 @@
+"""Minification and normalization of qss stylesheets.
+
+Qt parses the whole stylesheet passed to ``setStyleSheet``, so removing comments,
+whitespace, empty rules and duplicate selectors reduces the application startup time.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from dataclasses import field
+
+_TOKEN_PATTERN = re.compile(
+    r"""(?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')"""
+    r"|(?P<comment>/\*.*?(?:\*/|$))"
+    r"|(?P<delimiter>[{};])"
+    r"""|(?P<text>[^"'/{};]+|/)""",
+    re.DOTALL,
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_SELECTOR_COMBINATOR_PATTERN = re.compile(r"\s*([>,+~])\s*")
+_VALUE_SEPARATOR_PATTERN = re.compile(r"\s*([,:])\s*")
+
+
+@dataclass
+class QssRule:
+    """Style rule consisting of a selector and its declarations."""
+
+    selector: str
+    declarations: list[tuple[str, str]] = field(default_factory=list)
+
+    def properties(self) -> set[str]:
+        """Names of the properties declared in this rule.
+
+        Returns
+        -------
+        set[str]
+            Property names.
+        """
+        return {name for name, _ in self.declarations}
+
+    def property_families(self) -> set[str]:
+        """Families of the properties declared in this rule (see :func:`property_family`).
+
+        Returns
+        -------
+        set[str]
+            Property families.
+        """
+        return {property_family(name) for name, _ in self.declarations}
+
+    def to_qss(self) -> str:
+        """Format rule as minified qss.
+
+        Returns
+        -------
+        str
+            Minified rule.
+        """
+        declarations = ";".join(f"{name}:{value}" for name, value in self.declarations)
+        return f"{self.selector}{{{declarations}}}"
+
+
+def property_family(name: str) -> str:
+    """Family of a property, which shorthand and longhand properties have in common.
+
+    Shorthands set the longhands of their family (e.g. 'font' sets 'font-size' and
+    'border-color' sets 'border-top-color'), so all properties starting with the
+    same word are treated as one family.
+
+    Parameters
+    ----------
+    name : str
+        Property name.
+
+    Returns
+    -------
+    str
+        First word of the property name (e.g. 'border' for 'border-top-color').
+    """
+    return name.split("-", 1)[0]
+
+
+def _tokenize(qss: str) -> list[tuple[str, str]]:
+    """Split qss into strings, delimiters and text, replacing comments with whitespace.
+
+    Parameters
+    ----------
+    qss : str
+        Qss source code.
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        Kind (``string``, ``delimiter`` or ``text``) and value of each token.
+    """
+    tokens: list[tuple[str, str]] = []
+    for match in _TOKEN_PATTERN.finditer(qss):
+        kind, value = str(match.lastgroup), match.group()
+        if kind == "comment":
+            kind, value = "text", " "
+        if kind == "text" and len(tokens) > 0 and tokens[-1][0] == "text":
+            tokens[-1] = ("text", tokens[-1][1] + value)
+        else:
+            tokens.append((kind, value))
+    return tokens
+
+
+def _normalize(tokens: list[tuple[str, str]], separator_pattern: re.Pattern[str]) -> str:
+    """Collapse whitespace and remove it around separators, leaving strings untouched.
+
+    Parameters
+    ----------
+    tokens : list[tuple[str, str]]
+        Tokens to join.
+    separator_pattern : re.Pattern[str]
+        Pattern matching separators (first group) and the whitespace around them.
+
+    Returns
+    -------
+    str
+        Normalized text.
+    """
+    normalized = "".join(
+        value
+        if kind == "string"
+        else separator_pattern.sub(r"\1", _WHITESPACE_PATTERN.sub(" ", value))
+        for kind, value in tokens
+    )
+    return normalized.strip()
+
+
+def _parse_declarations(tokens: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Parse the tokens inside of a rule block to declarations.
+
+    Parameters
+    ----------
+    tokens : list[tuple[str, str]]
+        Tokens between the braces of a rule.
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        Normalized property names and values.
+    """
+    declarations = []
+    current: list[tuple[str, str]] = []
+    for kind, value in [*tokens, ("delimiter", ";")]:
+        if kind != "delimiter":
+            current.append((kind, value))
+            continue
+        if len(current) > 0 and current[0][0] == "text" and ":" in current[0][1]:
+            name, first_value = current[0][1].split(":", 1)
+            declaration_value = _normalize(
+                [("text", first_value), *current[1:]], _VALUE_SEPARATOR_PATTERN
+            )
+            declarations.append((_WHITESPACE_PATTERN.sub("", name), declaration_value))
+        current = []
+    return declarations
+
+
+def parse_qss(qss: str) -> list[QssRule | str]:
+    """Parse qss into rules.
+
+    Blocks which are not plain rules (e.g. containing nested blocks) are kept
+    as normalized text, which also prevents merging rules across them.
+
+    Parameters
+    ----------
+    qss : str
+        Qss source code.
+
+    Returns
+    -------
+    list[QssRule | str]
+        Parsed rules and opaque blocks in order of definition.
+    """
+    tokens = _tokenize(qss)
+    items: list[QssRule | str] = []
+    index = 0
+    while index < len(tokens):
+        start = index
+        while index < len(tokens) and tokens[index] not in {
+            ("delimiter", "{"),
+            ("delimiter", ";"),
+        }:
+            index += 1
+        if index == len(tokens) or tokens[index][1] == ";":
+            text = _normalize(tokens[start : index + 1], _SELECTOR_COMBINATOR_PATTERN)
+            if text not in {"", ";"}:
+                items.append(text)
+            index += 1
+            continue
+        selector = _normalize(tokens[start:index], _SELECTOR_COMBINATOR_PATTERN)
+        depth = 1
+        index += 1
+        body_start = index
+        while index < len(tokens) and depth > 0:
+            if tokens[index] == ("delimiter", "{"):
+                depth += 1
+            elif tokens[index] == ("delimiter", "}"):
+                depth -= 1
+            index += 1
+        body = tokens[body_start : index - 1] if depth == 0 else tokens[body_start:index]
+        if ("delimiter", "{") in body:
+            normalized_body = "".join(
+                _normalize([token], _SELECTOR_COMBINATOR_PATTERN) for token in body
+            )
+            items.append(f"{selector}{{{normalized_body}}}")
+        else:
+            items.append(QssRule(selector, _parse_declarations(body)))
+    return items
+
+
+def merge_duplicate_rules(items: list[QssRule | str]) -> list[QssRule | str]:
+    """Merge rules with the same selector into the first rule, where this is safe.
+
+    A rule is only merged into an earlier rule with the same selector, if none of
+    the rules in between declares a property of the same family (see
+    :func:`property_family`) as the merged rule, so the cascade of the stylesheet
+    does not change.
+
+    Parameters
+    ----------
+    items : list[QssRule | str]
+        Parsed rules (see :func:`parse_qss`).
+
+    Returns
+    -------
+    list[QssRule | str]
+        Rules with merged duplicates.
+    """
+    merged: list[QssRule | str] = []
+    for item in items:
+        if isinstance(item, str):
+            merged.append(item)
+            continue
+        families = item.property_families()
+        for previous in reversed(merged):
+            if isinstance(previous, QssRule) and previous.selector == item.selector:
+                previous.declarations += item.declarations
+                break
+            if isinstance(previous, str) or len(previous.property_families() & families) > 0:
+                merged.append(QssRule(item.selector, list(item.declarations)))
+                break
+        else:
+            merged.append(QssRule(item.selector, list(item.declarations)))
+    return merged
+
+
+def minify_qss(qss: str, *, merge_duplicates: bool = True) -> str:
+    """Minify qss by removing comments, whitespace and empty rules.
+
+    Parameters
+    ----------
+    qss : str
+        Qss source code.
+    merge_duplicates : bool
+        Whether or not to merge rules with the same selector where this is safe
+        (see :func:`merge_duplicate_rules`). Defaults to True
+
+    Returns
+    -------
+    str
+        Minified qss.
+    """
+    items = [
+        item
+        for item in parse_qss(qss)
+        if not isinstance(item, QssRule) or len(item.declarations) > 0
+    ]
+    if merge_duplicates is True:
+        items = merge_duplicate_rules(items)
+    return "".join(item.to_qss() if isinstance(item, QssRule) else item for item in items)
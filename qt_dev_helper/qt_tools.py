@@ -34,6 +34,7 @@ class QtToolExecutionError(Exception):
     See Also
     --------
     call_qt_tool
+    run_qt_tool
     """
 
     def __init__(  # noqa: DOC
@@ -137,3 +138,43 @@ def call_qt_tool(tool_name: str, *, arguments: Sequence[str] = (), no_wait: bool
             )
 
         print(out.stdout.decode())  # noqa: T201
+
+
+def run_qt_tool(tool_name: str, *, arguments: Sequence[str] = ()) -> bytes:
+    """Run a Qt tool and capture what it writes to stdout.
+
+    Used to get generated code from 'uic' and 'rcc' without an output file.
+
+    Parameters
+    ----------
+    tool_name : str
+        Name of the Qt tool to use (e.g. ``rcc`` or ``uic``)
+    arguments : Sequence[str]
+        Additional arguments for options for the tool. Defaults to ()
+
+    Returns
+    -------
+    bytes
+        Output of the tool.
+
+    Raises
+    ------
+    ValueError
+        If ``arguments`` is not of type Sequence[str]
+    QtToolExecutionError
+        If the tool returns a non-zero exit code.
+    """
+    if not isinstance(arguments, Sequence) or isinstance(arguments, str):
+        msg = f"arguments needs to be of type Sequence[str],\n Got:\n\t{arguments=}"
+        raise ValueError(msg)
+    cmd = [find_qt_tool(tool_name), *arguments]
+
+    env = os.environ.copy()
+    env["PATH"] = extend_qt_tool_path()
+
+    out = subprocess.run(cmd, capture_output=True, env=env)
+    if out.returncode != 0:
+        raise QtToolExecutionError(
+            returncode=out.returncode, cmd=" ".join(cmd), stdout=out.stdout, stderr=out.stderr
+        )
+    return out.stdout
@@ -0,0 +1,222 @@
+"""Choose the rcc compression of resources by sampling the referenced files.
+
+Compression only pays off if it saves a considerable share of a file, since every
+compressed file has to be decompressed when it is accessed at runtime.
+Already compressed formats (e.g. PNG or JPEG) are therefore stored uncompressed,
+while compressible files are compressed with the lowest zlib level which is almost as
+small as the highest level and without the default 'threshold' of rcc.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Literal
+
+from qt_dev_helper.cache import hash_content
+from qt_dev_helper.qrc import QrcEntry
+from qt_dev_helper.qrc import read_qrc
+from qt_dev_helper.qrc import write_qrc
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Changing the heuristic needs a new version, so recorded choices are made again
+TUNING_VERSION = "1"
+SAMPLE_SIZE = 64 * 1024
+MIN_COMPRESSION_SIZE = 128
+MIN_COMPRESSION_SAVING = 0.1
+LEVEL_SIZE_TOLERANCE = 0.01
+COMPRESSION_LEVELS = (1, 6, 9)
+COMPRESSION_ATTRIBUTES = ("compress", "compression-algorithm", "threshold")
+
+
+@dataclass(frozen=True)
+class CompressionChoice:
+    """Compression of a resource file."""
+
+    algorithm: Literal["zlib", "none"]
+    level: int | None = None
+
+    def qrc_attributes(self) -> dict[str, str]:
+        """Attributes of a qrc file entry to apply the compression.
+
+        Returns
+        -------
+        dict[str, str]
+            Attributes overwriting the rcc command line arguments for the file.
+        """
+        if self.algorithm == "none":
+            return {"compression-algorithm": "none"}
+        return {
+            "compression-algorithm": self.algorithm,
+            "compress": str(self.level),
+            "threshold": "0",
+        }
+
+    def __str__(self) -> str:
+        """Human readable representation.
+
+        Returns
+        -------
+        str
+            Algorithm and level (e.g. 'zlib level 6').
+        """
+        if self.level is None:
+            return self.algorithm
+        return f"{self.algorithm} level {self.level}"
+
+
+def choose_compression(samples: Iterable[bytes]) -> CompressionChoice:
+    """Choose the compression for files by compressing samples of their content.
+
+    Parameters
+    ----------
+    samples : Iterable[bytes]
+        Samples of the file contents (see :data:`SAMPLE_SIZE`).
+
+    Returns
+    -------
+    CompressionChoice
+        No compression if the samples are small or compression saves less than
+        :data:`MIN_COMPRESSION_SAVING`, otherwise zlib with the lowest level creating
+        output within :data:`LEVEL_SIZE_TOLERANCE` of the highest level.
+    """
+    samples = list(samples)
+    original_size = sum(len(sample) for sample in samples)
+    if original_size < MIN_COMPRESSION_SIZE:
+        return CompressionChoice("none")
+    compressed_sizes = {
+        level: sum(len(zlib.compress(sample, level)) for sample in samples)
+        for level in COMPRESSION_LEVELS
+    }
+    smallest_size = compressed_sizes[max(COMPRESSION_LEVELS)]
+    if 1 - smallest_size / original_size < MIN_COMPRESSION_SAVING:
+        return CompressionChoice("none")
+    level = min(
+        level
+        for level, size in compressed_sizes.items()
+        if size <= smallest_size * (1 + LEVEL_SIZE_TOLERANCE)
+    )
+    return CompressionChoice("zlib", level)
+
+
+@dataclass
+class TunedEntry:
+    """Qrc file entry with its chosen compression."""
+
+    entry: QrcEntry
+    choice: CompressionChoice
+    recorded: bool
+
+
+class CompressionTuner:
+    """Choose the compression of qrc file entries and record the choices.
+
+    Parameters
+    ----------
+    record_file : Path | None
+        JSON file recording the choices by content hash, so they stay stable between
+        builds and files are only sampled again if their content changes.
+        Defaults to None
+    mode : Literal["file", "qrc"]
+        Whether to choose the compression for each file or for all files of a qrc file.
+        Defaults to "file"
+    """
+
+    def __init__(
+        self, record_file: Path | None = None, *, mode: Literal["file", "qrc"] = "file"
+    ) -> None:
+        self.record_file = None if record_file is None else Path(record_file)
+        self.mode = mode
+        self.records: dict[str, CompressionChoice] = {}
+        self.used_keys: set[str] = set()
+        if self.record_file is not None and self.record_file.is_file():
+            self.records = {
+                key: CompressionChoice(**value)
+                for key, value in json.loads(self.record_file.read_text(encoding="utf8")).items()
+            }
+
+    def choose(self, files: Iterable[Path]) -> tuple[CompressionChoice, bool]:
+        """Choose the compression for ``files``, reusing recorded choices.
+
+        Parameters
+        ----------
+        files : Iterable[Path]
+            Files which should use the same compression.
+
+        Returns
+        -------
+        tuple[CompressionChoice, bool]
+            Compression of the files and whether it was recorded by a previous build.
+        """
+        samples = [file.read_bytes()[:SAMPLE_SIZE] for file in files]
+        key = hash_content(TUNING_VERSION, *(hash_content(sample) for sample in samples))
+        recorded = key in self.records
+        if recorded is False:
+            self.records[key] = choose_compression(samples)
+        self.used_keys.add(key)
+        return self.records[key], recorded
+
+    def tune_qrc(self, qrc_file: Path, output_qrc_file: Path) -> list[TunedEntry]:
+        """Write a qrc file with the compression of each entry set by file attributes.
+
+        Entries with compression attributes in ``qrc_file`` are kept unchanged.
+
+        Parameters
+        ----------
+        qrc_file : Path
+            Qrc file to tune.
+        output_qrc_file : Path
+            Path to write the tuned qrc file to.
+
+        Returns
+        -------
+        list[TunedEntry]
+            Tuned entries of ``qrc_file`` with their chosen compression.
+        """
+        entries = read_qrc(qrc_file)
+        tunable_entries = [
+            entry
+            for entry in entries
+            if entry.file.is_file()
+            and not any(attribute in entry.attributes for attribute in COMPRESSION_ATTRIBUTES)
+        ]
+        if self.mode == "qrc":
+            choice, recorded = self.choose(entry.file for entry in tunable_entries)
+            tuned_entries = [TunedEntry(entry, choice, recorded) for entry in tunable_entries]
+        else:
+            tuned_entries = [
+                TunedEntry(entry, *self.choose([entry.file])) for entry in tunable_entries
+            ]
+        attributes = {id(tuned.entry): tuned.choice.qrc_attributes() for tuned in tuned_entries}
+        write_qrc(
+            (
+                QrcEntry(
+                    entry.prefix,
+                    entry.alias,
+                    entry.file,
+                    entry.lang,
+                    {**entry.attributes, **attributes.get(id(entry), {})},
+                )
+                for entry in entries
+            ),
+            output_qrc_file,
+        )
+        return tuned_entries
+
+    def save(self) -> None:
+        """Save the choices used since creation to :attr:`record_file`."""
+        if self.record_file is None:
+            return
+        self.record_file.parent.mkdir(parents=True, exist_ok=True)
+        self.record_file.write_text(
+            json.dumps(
+                {key: asdict(self.records[key]) for key in sorted(self.used_keys)}, indent=2
+            ),
+            encoding="utf8",
+        )
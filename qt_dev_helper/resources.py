@@ -0,0 +1,604 @@
+"""Compile Qt resource collection (qrc) files with 'rcc' in the supported resource modes.
+
+Besides plain generated code, resources can be compiled to binary '.rcc' files with a
+loader module, to shards compiled in parallel, or to a registry of prefix modules
+which are only imported when their resources are requested.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Literal
+
+from qt_dev_helper.cache import hash_content
+from qt_dev_helper.qrc import group_by_prefix
+from qt_dev_helper.qrc import prefix_identifier
+from qt_dev_helper.qrc import read_qrc
+from qt_dev_helper.qrc import split_entries
+from qt_dev_helper.qrc import write_qrc
+from qt_dev_helper.qt_tools import find_qt_tool
+from qt_dev_helper.qt_tools import run_qt_tool
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from qt_dev_helper.cache import BuildCache
+    from qt_dev_helper.qrc import QrcEntry
+
+LAZY_PREFIX_MODULES_PATTERN = re.compile(r"^PREFIX_MODULES = (.+)$", re.MULTILINE)
+
+RCC_BINDING_IMPORT_PATTERN = re.compile(
+    rb"^from\s+([\w.]+)\s+import\s+QtCore[ \t]*$", re.MULTILINE
+)
+
+BINARY_RESOURCE_LOADER_TEMPLATE = '''"""Resource loader generated by qt-dev-helper.
+
+Generated from {qrc_name!r}.
+
+The resource data are registered from the binary file {rcc_name!r}, which Qt
+memory maps, so they are paged in by the OS when used instead of being
+copied into the Python heap.
+"""
+
+from pathlib import Path
+
+from {binding}.QtCore import QResource
+
+RCC_FILE = Path(__file__).with_name({rcc_name!r})
+
+
+def qInitResources():
+    if not QResource.registerResource(str(RCC_FILE)):
+        raise ImportError(f"Could not register resource file {{RCC_FILE.as_posix()!r}}.")
+
+
+def qCleanupResources():
+    QResource.unregisterResource(str(RCC_FILE))
+
+
+qInitResources()
+'''
+
+SHARED_RESOURCE_MODULE_STEM = "shared_resources_rc"
+
+SHARED_RESOURCE_IMPORT_TEMPLATE = """
+
+# Import resources shared with other resource modules, added by qt-dev-helper
+def _import_shared_resources():
+    import importlib
+
+    if __package__:
+        return importlib.import_module({relative_name!r}, __package__)
+    return importlib.import_module({module_name!r})
+
+
+_import_shared_resources()
+"""
+
+SHARDED_RESOURCE_MODULE_TEMPLATE = '''"""Sharded resource module generated by qt-dev-helper.
+
+Generated from {qrc_name!r}.
+
+The resources are compiled to multiple modules, which are all imported
+(registering their resources) when this module is imported.
+"""
+
+import importlib
+
+SHARD_MODULES = {shard_modules!r}
+
+
+def _import_shard_module(module_name):
+    if __package__:
+        return importlib.import_module(f".{{module_name}}", __package__)
+    return importlib.import_module(module_name)
+
+
+SHARDS = [_import_shard_module(module_name) for module_name in SHARD_MODULES]
+
+
+def qInitResources():
+    for shard in SHARDS:
+        shard.qInitResources()
+
+
+def qCleanupResources():
+    for shard in SHARDS:
+        shard.qCleanupResources()
+'''
+
+LAZY_RESOURCE_REGISTRY_TEMPLATE = '''"""Lazy resource registry generated by qt-dev-helper.
+
+Generated from {qrc_name!r}.
+
+The resources of each prefix are compiled to their own module, which is only
+imported (registering its resources) when ``ensure_registered`` is called with
+the prefix or the attribute of the prefix is accessed (e.g. ``{module_name}.{example}``).
+"""
+
+import importlib
+
+PREFIX_MODULES = {prefix_modules!r}
+PREFIX_ATTRIBUTES = {prefix_attributes!r}
+
+_REGISTERED_MODULES = {{}}
+_UNREGISTERED_MODULES = {{}}
+
+
+def _import_prefix_module(prefix):
+    prefix = "/" + prefix.strip("/")
+    if prefix in _UNREGISTERED_MODULES:
+        # Importing the module again would not register its resources again
+        _UNREGISTERED_MODULES[prefix].qInitResources()
+        _REGISTERED_MODULES[prefix] = _UNREGISTERED_MODULES.pop(prefix)
+    if prefix not in _REGISTERED_MODULES:
+        module_name = PREFIX_MODULES[prefix]
+        if __package__:
+            module = importlib.import_module(f".{{module_name}}", __package__)
+        else:
+            module = importlib.import_module(module_name)
+        _REGISTERED_MODULES[prefix] = module
+    return _REGISTERED_MODULES[prefix]
+
+
+def ensure_registered(prefix=None):
+    """Register the resources with ``prefix`` or all resources if ``prefix`` is None."""
+    for registered_prefix in PREFIX_MODULES if prefix is None else [prefix]:
+        _import_prefix_module(registered_prefix)
+
+
+def qInitResources():
+    ensure_registered()
+
+
+def qCleanupResources():
+    """Unregister the resources of all prefixes registered so far."""
+    for prefix in list(_REGISTERED_MODULES):
+        _REGISTERED_MODULES[prefix].qCleanupResources()
+        _UNREGISTERED_MODULES[prefix] = _REGISTERED_MODULES.pop(prefix)
+
+
+def __getattr__(name):
+    if name in PREFIX_ATTRIBUTES:
+        return _import_prefix_module(PREFIX_ATTRIBUTES[name])
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+'''
+
+
+def rcc_arguments(
+    qrc_file: str | Path,
+    output_path: str | Path | None,
+    *,
+    generator: Literal["python", "cpp"] = "python",
+    rcc_args: Sequence[str] = (),
+    binary: bool = False,
+) -> tuple[str, ...]:
+    """Create the arguments 'rcc' is called with by :func:`compile_resource_file`.
+
+    Parameters
+    ----------
+    qrc_file : str | Path
+        Path to the resource file.
+    output_path : str | Path | None
+        Path the output file (or the binary '.rcc' file) should be saved to,
+        None means stdout.
+    generator : Literal["python", "cpp"]
+        Language to generate code for, ignored for binary resources. Defaults to "python"
+    rcc_args : Sequence[str]
+        Additional args for 'rcc' (use '--help' for details). Defaults to ()
+    binary : bool
+        Whether or not to compile to a binary '.rcc' file. Defaults to False
+
+    Returns
+    -------
+    tuple[str, ...]
+        Arguments for 'rcc'.
+    """
+    options = [] if output_path is None else ["-o", Path(output_path).as_posix()]
+    options += ["--binary"] if binary is True else ["-g", generator]
+    return (Path(qrc_file).as_posix(), *options, *rcc_args)
+
+
+def compile_resource_to_bytes(
+    qrc_file: str | Path,
+    *,
+    generator: Literal["python", "cpp"] = "python",
+    rcc_args: Sequence[str] = (),
+    binary: bool = False,
+) -> bytes:
+    """Call 'Qt Resource Compiler' and return the generated code without writing it.
+
+    Parameters
+    ----------
+    qrc_file : str | Path
+        Path to the resource file.
+    generator : Literal["python", "cpp"]
+        Language to generate code for. Defaults to "python"
+    rcc_args : Sequence[str]
+        Additional args for 'rcc' (use '--help' for details). Defaults to ()
+    binary : bool
+        Whether or not to return the content of a binary '.rcc' file instead
+        of code. Defaults to False
+
+    Returns
+    -------
+    bytes
+        Generated code (or binary resource data).
+
+    See Also
+    --------
+    compile_resource_file
+    """
+    args = rcc_arguments(qrc_file, None, generator=generator, rcc_args=rcc_args, binary=binary)
+    return run_qt_tool("rcc", arguments=args)
+
+
+@lru_cache(maxsize=1)
+def rcc_binding() -> str:
+    """Find the Qt binding the python code generated by 'rcc' imports.
+
+    The binary resource loader uses the same binding as the code generated by
+    'rcc' (e.g. the 'rcc' of PySide6 generates code importing 'PySide6').
+
+    Returns
+    -------
+    str
+        Name of the binding package, "PySide6" if it could not be detected.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        qrc_file = Path(temp_dir) / "binding.qrc"
+        qrc_file.write_text("<RCC><qresource/></RCC>", encoding="utf8")
+        code = compile_resource_to_bytes(qrc_file)
+    match = RCC_BINDING_IMPORT_PATTERN.search(code)
+    return match.group(1).decode() if match is not None else "PySide6"
+
+
+def compile_resource_file(
+    qrc_file: str | Path,
+    output_path: str | Path,
+    *,
+    generator: Literal["python", "cpp"] = "python",
+    rcc_args: Sequence[str] = (),
+    binary: bool = False,
+    lazy: bool = False,
+    shards: int | None = None,
+    shard_strategy: Literal["prefix", "size"] = "prefix",
+    cache: BuildCache | None = None,
+) -> Path:
+    """Call 'Qt Resource Compiler' to create code from a resource file.
+
+    Parameters
+    ----------
+    qrc_file : str | Path
+        Path to the resource file.
+    output_path : str | Path
+        Path the output file should be saved to.
+    generator : Literal["python", "cpp"]
+        Language to generate code for. Defaults to "python"
+    rcc_args : Sequence[str]
+        Additional args for 'rcc' (use '--help' for details). Defaults to ()
+    binary : bool
+        Whether or not to compile the resources to a binary '.rcc' file next to
+        ``output_path``. With the python generator ``output_path`` is a loader module
+        registering the '.rcc' file, so it can be imported like generated resource code.
+        Defaults to False
+    lazy : bool
+        Python: whether or not to compile the resources of each prefix to a separate module
+        and generate a registry module at ``output_path``, which only registers the
+        resources of a prefix when they are requested (see
+        :func:`compile_lazy_resource_file`). Defaults to False
+    shards : int | None
+        Python: split the resources into this many modules, which are compiled in parallel,
+        and generate a module at ``output_path`` importing all of them (see
+        :func:`compile_sharded_resource_file`). Ignored if ``lazy`` is True. Defaults to None
+    shard_strategy : Literal["prefix", "size"]
+        Whether to keep all resources of a prefix in the same shard or to split
+        by single files. Defaults to "prefix"
+    cache : BuildCache | None
+        Build cache used to skip compiling unchanged shards or prefix modules.
+        Defaults to None
+
+    Returns
+    -------
+    Path
+        Path of the compiled file
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if lazy is True and generator == "python":
+        return compile_lazy_resource_file(
+            qrc_file, output_path, rcc_args=rcc_args, binary=binary, cache=cache
+        )
+    if shards is not None and shards > 1 and generator == "python":
+        return compile_sharded_resource_file(
+            qrc_file,
+            output_path,
+            shards,
+            strategy=shard_strategy,
+            rcc_args=rcc_args,
+            binary=binary,
+            cache=cache,
+        )
+    if binary is True:
+        rcc_file = output_path.with_suffix(".rcc")
+        rcc_file.write_bytes(compile_resource_to_bytes(qrc_file, rcc_args=rcc_args, binary=True))
+        if generator == "cpp":
+            return rcc_file
+        output_path.write_text(
+            BINARY_RESOURCE_LOADER_TEMPLATE.format(
+                qrc_name=Path(qrc_file).name,
+                rcc_name=rcc_file.name,
+                binding=rcc_binding(),
+            ),
+            encoding="utf8",
+        )
+        return output_path
+
+    output_path.write_bytes(
+        compile_resource_to_bytes(qrc_file, generator=generator, rcc_args=rcc_args)
+    )
+    return output_path
+
+
+def resource_shard_fingerprint(
+    entries: Sequence[QrcEntry], *, rcc_args: Sequence[str], binary: bool
+) -> str:
+    """Create a fingerprint of everything the code generated from ``entries`` depends on.
+
+    Parameters
+    ----------
+    entries : Sequence[QrcEntry]
+        Entries of the shard.
+    rcc_args : Sequence[str]
+        Additional args for 'rcc'.
+    binary : bool
+        Whether or not the shard is compiled to a binary '.rcc' file.
+
+    Returns
+    -------
+    str
+        Fingerprint of the shard.
+    """
+    contents: list[str | bytes] = [find_qt_tool("rcc"), f"binary={binary}", *rcc_args]
+    for entry in entries:
+        contents += [
+            entry.prefix,
+            entry.alias,
+            str(entry.lang),
+            repr(sorted(entry.attributes.items())),
+            entry.file.read_bytes(),
+        ]
+    return hash_content(*contents)
+
+
+def compile_resource_shards(
+    shards: Mapping[str, Sequence[QrcEntry]],
+    output_folder: Path,
+    *,
+    rcc_args: Sequence[str] = (),
+    binary: bool = False,
+    cache: BuildCache | None = None,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """Compile resource shards to python modules in parallel.
+
+    Parameters
+    ----------
+    shards : Mapping[str, Sequence[QrcEntry]]
+        Entries of each shard by name of the module they are compiled to.
+    output_folder : Path
+        Folder to save the modules to.
+    rcc_args : Sequence[str]
+        Additional args for 'rcc' (use '--help' for details). Defaults to ()
+    binary : bool
+        Whether or not to compile the shards to binary '.rcc' files
+        (see :func:`compile_resource_file`). Defaults to False
+    cache : BuildCache | None
+        Build cache used to skip shards with unchanged inputs. Defaults to None
+    max_workers : int | None
+        Maximal number of parallel 'rcc' calls, see ``ThreadPoolExecutor``. Defaults to None
+
+    Returns
+    -------
+    list[Path]
+        Paths of all shard modules.
+    """
+    output_folder = Path(output_folder)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        jobs = []
+        for module_name, entries in shards.items():
+            module_file = output_folder / f"{module_name}.py"
+            fingerprint = resource_shard_fingerprint(entries, rcc_args=rcc_args, binary=binary)
+            # The binary data are checked (and restored) like the module loading them
+            if (
+                cache is not None
+                and cache.is_up_to_date(module_file, fingerprint)
+                and (
+                    binary is False
+                    or cache.is_up_to_date(module_file.with_suffix(".rcc"), fingerprint)
+                )
+            ):
+                continue
+            qrc_file = write_qrc(entries, Path(temp_dir) / f"{module_name}.qrc")
+            jobs.append((qrc_file, module_file, fingerprint))
+        # rcc runs in a subprocess, so threads are sufficient
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    compile_resource_file, qrc_file, module_file, rcc_args=rcc_args, binary=binary
+                )
+                for qrc_file, module_file, _ in jobs
+            ]
+            for future in futures:
+                future.result()
+    if cache is not None:
+        for _, module_file, fingerprint in jobs:
+            cache.update(module_file, fingerprint)
+            if binary is True:
+                cache.update(module_file.with_suffix(".rcc"), fingerprint)
+    return [output_folder / f"{module_name}.py" for module_name in shards]
+
+
+def _lazy_prefix_modules(registry_file: Path) -> list[str]:
+    """Read the names of the prefix modules a lazy resource registry imports.
+
+    Parameters
+    ----------
+    registry_file : Path
+        Path to the registry module.
+
+    Returns
+    -------
+    list[str]
+        Names of the prefix modules, empty if ``registry_file`` is no lazy registry.
+
+    See Also
+    --------
+    compile_lazy_resource_file
+    """
+    try:
+        match = LAZY_PREFIX_MODULES_PATTERN.search(registry_file.read_text(encoding="utf8"))
+        prefix_modules = ast.literal_eval(match.group(1)) if match is not None else {}
+    except (OSError, UnicodeDecodeError, ValueError, SyntaxError):
+        return []
+    if not isinstance(prefix_modules, dict):
+        return []
+    return [str(module_name) for module_name in prefix_modules.values()]
+
+
+def compile_lazy_resource_file(
+    qrc_file: str | Path,
+    output_path: str | Path,
+    *,
+    rcc_args: Sequence[str] = (),
+    binary: bool = False,
+    cache: BuildCache | None = None,
+) -> Path:
+    """Compile a resource file to a registry module, registering resources on first request.
+
+    The resources of each prefix are compiled to the module ``<output stem>_<prefix>.py``
+    next to ``output_path``. The registry module at ``output_path`` provides
+    ``ensure_registered(prefix)`` and a module attribute for each prefix, which import
+    the corresponding module and thus register its resources.
+    Prefix modules of a previous build, whose prefix was removed, are deleted.
+
+    Parameters
+    ----------
+    qrc_file : str | Path
+        Path to the resource file.
+    output_path : str | Path
+        Path the registry module should be saved to.
+    rcc_args : Sequence[str]
+        Additional args for 'rcc' (use '--help' for details). Defaults to ()
+    binary : bool
+        Whether or not to compile the resources of each prefix to a binary '.rcc' file
+        (see :func:`compile_resource_file`). Defaults to False
+    cache : BuildCache | None
+        Build cache used to skip prefix modules with unchanged inputs. Defaults to None
+
+    Returns
+    -------
+    Path
+        Path of the registry module.
+    """
+    qrc_file = Path(qrc_file)
+    output_path = Path(output_path)
+    prefix_modules: dict[str, str] = {}
+    prefix_attributes: dict[str, str] = {}
+    shards: dict[str, list[QrcEntry]] = {}
+    for prefix, entries in group_by_prefix(read_qrc(qrc_file)).items():
+        attribute = prefix_identifier(prefix, prefix_attributes)
+        module_name = f"{output_path.stem}_{attribute}"
+        shards[module_name] = entries
+        prefix_modules[prefix] = module_name
+        prefix_attributes[attribute] = prefix
+    compile_resource_shards(
+        shards, output_path.parent, rcc_args=rcc_args, binary=binary, cache=cache
+    )
+    for stale_module in _lazy_prefix_modules(output_path):
+        if stale_module not in shards:
+            for suffix in (".py", ".rcc"):
+                output_path.with_name(f"{stale_module}{suffix}").unlink(missing_ok=True)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(
+        LAZY_RESOURCE_REGISTRY_TEMPLATE.format(
+            qrc_name=qrc_file.name,
+            module_name=output_path.stem,
+            example=next(iter(prefix_attributes), "icons"),
+            prefix_modules=prefix_modules,
+            prefix_attributes=prefix_attributes,
+        ),
+        encoding="utf8",
+    )
+    return output_path
+
+
+def compile_sharded_resource_file(
+    qrc_file: str | Path,
+    output_path: str | Path,
+    shard_count: int,
+    *,
+    strategy: Literal["prefix", "size"] = "prefix",
+    rcc_args: Sequence[str] = (),
+    binary: bool = False,
+    cache: BuildCache | None = None,
+) -> Path:
+    """Compile a resource file to shards and a module importing all of them.
+
+    The resources are split into ``shard_count`` modules ``<output stem>_shard<index>.py``
+    next to ``output_path`` (see :func:`.qrc.split_entries`), which are compiled in
+    parallel and cached independently. The module at ``output_path`` imports all shards,
+    so it can be imported like generated resource code.
+
+    Parameters
+    ----------
+    qrc_file : str | Path
+        Path to the resource file.
+    output_path : str | Path
+        Path the aggregating module should be saved to.
+    shard_count : int
+        Maximal number of shards.
+    strategy : Literal["prefix", "size"]
+        Whether to keep all resources of a prefix in the same shard or to split
+        by single files. Defaults to "prefix"
+    rcc_args : Sequence[str]
+        Additional args for 'rcc' (use '--help' for details). Defaults to ()
+    binary : bool
+        Whether or not to compile the shards to binary '.rcc' files
+        (see :func:`compile_resource_file`). Defaults to False
+    cache : BuildCache | None
+        Build cache used to skip shards with unchanged inputs. Defaults to None
+
+    Returns
+    -------
+    Path
+        Path of the aggregating module.
+    """
+    qrc_file = Path(qrc_file)
+    output_path = Path(output_path)
+    shards = {
+        f"{output_path.stem}_shard{index}": entries
+        for index, entries in enumerate(
+            split_entries(read_qrc(qrc_file), shard_count, strategy=strategy)
+        )
+    }
+    compile_resource_shards(
+        shards, output_path.parent, rcc_args=rcc_args, binary=binary, cache=cache
+    )
+    for stale_shard in output_path.parent.glob(f"{output_path.stem}_shard*"):
+        if stale_shard.stem not in shards:
+            stale_shard.unlink()
+    output_path.write_text(
+        SHARDED_RESOURCE_MODULE_TEMPLATE.format(
+            qrc_name=qrc_file.name, shard_modules=list(shards)
+        ),
+        encoding="utf8",
+    )
+    return output_path
@@ -0,0 +1,115 @@
+"""Stream the records of a build while it runs, for progress reporting or live reloading."""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from typing import TYPE_CHECKING
+from typing import Callable
+
+import rich
+
+from qt_dev_helper.transpiler import BuildRecord
+from qt_dev_helper.transpiler import build_all_assets
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from qt_dev_helper.config import Config
+
+
+def iter_build(
+    config: Config | str | Path,
+    log_function: Callable[..., None] = rich.print,
+    *,
+    recurse_folder: bool = True,
+) -> Generator[BuildRecord, None, None]:
+    """Build all assets and yield a record for each output as soon as it is ready.
+
+    The build runs in a background thread (see :func:`build_all_assets`), so
+    consumers can e.g. show progress or reload stylesheets while forms are still
+    compiled. Errors of the build are raised after the last record. If iteration
+    stops early, the build still runs to completion before the generator closes.
+
+    Parameters
+    ----------
+    config : Config | str | Path
+        Configuration to use for building assets.
+        If a path is passed it will try to find the config.
+    log_function : Callable[..., None]
+        Function used to print log messages. Defaults to rich.print
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+
+    Yields
+    ------
+    BuildRecord
+        Output, status, duration and cache hit of each built or up to date output.
+
+    See Also
+    --------
+    aiter_build
+    """
+    records: queue.Queue[BuildRecord | None] = queue.Queue()
+    errors: list[BaseException] = []
+
+    def build() -> None:
+        try:
+            build_all_assets(
+                config,
+                log_function,
+                recurse_folder=recurse_folder,
+                report_function=records.put,
+            )
+        except BaseException as error:  # noqa: BLE001
+            errors.append(error)
+        finally:
+            records.put(None)
+
+    build_thread = threading.Thread(target=build, name="qt-dev-helper-build")
+    build_thread.start()
+    try:
+        while (record := records.get()) is not None:
+            yield record
+    finally:
+        build_thread.join()
+    if len(errors) > 0:
+        raise errors[0]
+
+
+async def aiter_build(
+    config: Config | str | Path,
+    log_function: Callable[..., None] = rich.print,
+    *,
+    recurse_folder: bool = True,
+) -> AsyncIterator[BuildRecord]:
+    """Asynchronous variant of :func:`iter_build`, which does not block the event loop.
+
+    If iteration stops early, closing the iterator (``aclose``) waits for the build
+    in a worker thread, so the event loop is not blocked.
+
+    Parameters
+    ----------
+    config : Config | str | Path
+        Configuration to use for building assets.
+        If a path is passed it will try to find the config.
+    log_function : Callable[..., None]
+        Function used to print log messages. Defaults to rich.print
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+
+    Yields
+    ------
+    BuildRecord
+        Output, status, duration and cache hit of each built or up to date output.
+    """
+    records = iter_build(config, log_function, recurse_folder=recurse_folder)
+    try:
+        while (record := await asyncio.to_thread(next, records, None)) is not None:
+            yield record
+    finally:
+        # Wait for the build outside of the event loop, if iteration stopped early
+        await asyncio.to_thread(records.close)
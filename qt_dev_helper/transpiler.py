@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Callable
@@ -10,122 +18,1327 @@ from typing import cast
 
 import qtsass
 import rich
+import sass
+from qtsass import conformers as qtsass_conformers
+from qtsass.api import DEFAULT_CUSTOM_FUNCTIONS
 
+from qt_dev_helper import qss_conformer
+from qt_dev_helper.asset_optimizer import AssetOptimizer
+from qt_dev_helper.bytecode import compile_bytecode
+from qt_dev_helper.cache import BuildCache
+from qt_dev_helper.cache import hash_content
+from qt_dev_helper.cache import read_output_fingerprint
+from qt_dev_helper.cache import write_output_fingerprint
 from qt_dev_helper.config import Config
 from qt_dev_helper.config import QtDevHelperConfigError
 from qt_dev_helper.config import RccKwargs
 from qt_dev_helper.config import UicKwargs
 from qt_dev_helper.config import load_config
-from qt_dev_helper.qt_tools import call_qt_tool
+from qt_dev_helper.depfile import write_depfile
+from qt_dev_helper.qrc import find_duplicate_resources
+from qt_dev_helper.qrc import read_qrc
+from qt_dev_helper.qrc import write_qrc
+from qt_dev_helper.qss_minifier import minify_qss
+from qt_dev_helper.qt_tools import find_qt_tool
+from qt_dev_helper.qt_tools import run_qt_tool
+from qt_dev_helper.rcc_compression import CompressionTuner
+from qt_dev_helper.resources import SHARED_RESOURCE_IMPORT_TEMPLATE
+from qt_dev_helper.resources import SHARED_RESOURCE_MODULE_STEM
+from qt_dev_helper.resources import compile_resource_file
+from qt_dev_helper.resources import resource_shard_fingerprint
+from qt_dev_helper.ui_files import UI_INDEX_FILE_NAME
+from qt_dev_helper.ui_files import UiIndex
+from qt_dev_helper.ui_files import read_form_class
 from qt_dev_helper.utils import find_matching_files
 from qt_dev_helper.utils import format_rel_output_path
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from collections.abc import MutableMapping
     from collections.abc import Sequence
 
+    from qt_dev_helper.qrc import DuplicateResource
+    from qt_dev_helper.qrc import QrcEntry
 
-def transpile_sass(sass_file: str | Path, qss_file: str | Path) -> Path:
+SCSS_CONFORMERS: dict[str, Callable[[str], str]] = {
+    "qt-dev-helper": qss_conformer.scss_conform,
+    "qtsass": qtsass_conformers.scss_conform,
+}
+SASS_IMPORT_PATTERN = re.compile(r"@import\s+([^;]+);")
+SASS_IMPORT_NAME_PATTERN = re.compile(r"""["']([^"']+)["']""")
+OPTIMIZED_ASSETS_FOLDER_NAME = "optimized_assets"
+COMPRESSION_RECORD_FILE_NAME = "rcc_compression.json"
+UI_REGISTRY_FILE_NAME = "__init__.py"
+UI_REGISTRY_HEADER = '''"""Form registry generated by qt-dev-helper.'''
+UI_REGISTRY_TEMPLATE = (
+    UI_REGISTRY_HEADER
+    + '''
+
+The form classes generated from ui files are only imported when they are
+accessed (e.g. ``from {package_name} import {example}``), so forms which are
+never opened are never imported.
+"""
+
+import importlib
+
+FORM_MODULES = {form_modules!r}
+
+__all__ = {form_classes!r}
+
+
+def __getattr__(name):
+    if name not in FORM_MODULES:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    form_class = getattr(importlib.import_module(f".{{FORM_MODULES[name]}}", __name__), name)
+    globals()[name] = form_class
+    return form_class
+
+
+def __dir__():
+    return sorted({{*globals(), *FORM_MODULES}})
+'''
+)
+
+
+def _find_sass_import(import_name: str, search_paths: Sequence[Path]) -> Path | None:
+    """Resolve the file an ``@import`` statement refers to.
+
+    The lookup follows the same rules as ``qtsass`` (partial prefix ``_`` and
+    the extensions ``.scss``, ``.css`` and ``.sass`` are optional).
+
+    Parameters
+    ----------
+    import_name : str
+        Name of the import as written in the ``@import`` statement.
+    search_paths : Sequence[Path]
+        Folders to resolve ``import_name`` against, in order of precedence.
+
+    Returns
+    -------
+    Path | None
+        Resolved path of the imported file or None if it could not be found.
+    """
+    import_path = Path(import_name)
+    partial_path = import_path.parent / f"_{import_path.name}"
+    candidate_names = [
+        f"{name}{ext}"
+        for ext in ("", ".scss", ".css", ".sass")
+        for name in (import_path.as_posix(), partial_path.as_posix())
+    ]
+    for search_path in search_paths:
+        for candidate_name in candidate_names:
+            candidate = search_path / candidate_name
+            if candidate.is_file():
+                return candidate.resolve()
+    return None
+
+
+def collect_sass_partials(
+    sass_file: str | Path,
+    partials_cache: MutableMapping[str, str] | None = None,
+    *,
+    conformer: Literal["qt-dev-helper", "qtsass"] = "qt-dev-helper",
+) -> dict[str, str]:
+    """Read and conform all files imported by ``sass_file`` (recursively).
+
+    Partials already present in ``partials_cache`` are neither read nor conformed again,
+    which allows sharing the work between multiple entry points importing the same partials.
+
+    Parameters
+    ----------
+    sass_file : str | Path
+        Path to the scss entry point.
+    partials_cache : MutableMapping[str, str] | None
+        Already conformed partials, newly collected partials are added to it. Defaults to None
+    conformer : Literal["qt-dev-helper", "qtsass"]
+        Implementation used to conform qss to scss. Defaults to "qt-dev-helper"
+
+    Returns
+    -------
+    dict[str, str]
+        Mapping of resolved posix paths of files imported by ``sass_file``
+        to their conformed scss source.
+    """
+    if partials_cache is None:
+        partials_cache = {}
+    collected: dict[str, str] = {}
+    sass_file = Path(sass_file).resolve()
+    include_paths = [sass_file.parent]
+    to_visit = [(sass_file, sass_file.read_text(encoding="utf8"))]
+    while len(to_visit) > 0:
+        current_file, source = to_visit.pop()
+        for import_statement in SASS_IMPORT_PATTERN.findall(source):
+            for import_name in SASS_IMPORT_NAME_PATTERN.findall(import_statement):
+                partial_file = _find_sass_import(
+                    import_name, [current_file.parent, *include_paths]
+                )
+                if partial_file is None or partial_file.as_posix() in collected:
+                    continue
+                key = partial_file.as_posix()
+                if key not in partials_cache:
+                    partials_cache[key] = SCSS_CONFORMERS[conformer](
+                        partial_file.read_text(encoding="utf8")
+                    )
+                collected[key] = partials_cache[key]
+                to_visit.append((partial_file, collected[key]))
+    return collected
+
+
+def override_sass_variables(
+    source: str, variables: Mapping[str, str], *, declare: bool = False
+) -> str:
+    """Replace the values of scss variable declarations in ``source``.
+
+    Parameters
+    ----------
+    source : str
+        Scss source code.
+    variables : Mapping[str, str]
+        Mapping of variable names (with or without leading ``$``) to their new values.
+    declare : bool
+        Whether or not to prepend declarations of all ``variables``, so they are also
+        defined if ``source`` does not declare them. Defaults to False
+
+    Returns
+    -------
+    str
+        ``source`` with overridden variable values.
+    """
+    declarations = []
+    for raw_name, value in variables.items():
+        name = raw_name.lstrip("$")
+        replacement = value.replace("\\", r"\\")
+        source = re.sub(
+            rf"^(\s*\${re.escape(name)}\s*:)[^;]*;",
+            rf"\g<1> {replacement};",
+            source,
+            flags=re.MULTILINE,
+        )
+        declarations.append(f"${name}: {value};\n")
+    if declare is True:
+        return "".join(declarations) + source
+    return source
+
+
+def _cached_qss_importer(
+    partials: MutableMapping[str, str],
+    include_paths: Sequence[Path],
+    variables: Mapping[str, str] | None = None,
+    *,
+    conformer: Literal["qt-dev-helper", "qtsass"] = "qt-dev-helper",
+) -> Callable[[str, str], list[tuple[str, str]] | None]:
+    """Create a libsass importer which serves conformed partials from ``partials``.
+
+    Parameters
+    ----------
+    partials : MutableMapping[str, str]
+        Mapping of resolved posix paths to conformed scss source,
+        partials missing from it are added on first import.
+    include_paths : Sequence[Path]
+        Folders to resolve imports against.
+    variables : Mapping[str, str] | None
+        Variable overrides applied to each imported partial. Defaults to None
+    conformer : Literal["qt-dev-helper", "qtsass"]
+        Implementation used to conform qss to scss. Defaults to "qt-dev-helper"
+
+    Returns
+    -------
+    Callable[[str, str], list[tuple[str, str]] | None]
+        Importer to be passed to ``sass.compile``.
+    """
+
+    def import_partial(import_name: str, prev: str) -> list[tuple[str, str]] | None:
+        """Resolve ``import_name`` relative to the importing file ``prev``."""
+        search_paths = list(include_paths)
+        if prev != "stdin":
+            search_paths.insert(0, Path(prev).parent)
+        partial_file = _find_sass_import(import_name, search_paths)
+        if partial_file is None:
+            return None
+        key = partial_file.as_posix()
+        if key not in partials:
+            partials[key] = SCSS_CONFORMERS[conformer](partial_file.read_text(encoding="utf8"))
+        return [(key, override_sass_variables(partials[key], variables or {}))]
+
+    return import_partial
+
+
+def transpile_sass_to_str(
+    sass_file: str | Path,
+    *,
+    partials: MutableMapping[str, str] | None = None,
+    variables: Mapping[str, str] | None = None,
+    conformer: Literal["qt-dev-helper", "qtsass"] = "qt-dev-helper",
+    minify: bool = False,
+    output_style: Literal["nested", "expanded", "compact", "compressed"] = "nested",
+) -> str:
+    """Transpile scss file to qss and return the qss instead of writing it to a file.
+
+    By default the linear time conformers from :mod:`qt_dev_helper.qss_conformer`
+    are used instead of the ones from ``qtsass``.
+
+    Parameters
+    ----------
+    sass_file : str | Path
+        Path to the sass input file.
+    partials : MutableMapping[str, str] | None
+        Already conformed partials (see :func:`collect_sass_partials`),
+        used instead of reading imported files again. Defaults to None
+    variables : Mapping[str, str] | None
+        Scss variables to override in ``sass_file`` and all its imports
+        (see :func:`override_sass_variables`). Defaults to None
+    conformer : Literal["qt-dev-helper", "qtsass"]
+        Implementation used to conform qss to scss and back. Defaults to "qt-dev-helper"
+    minify : bool
+        Whether or not to minify the qss (see :func:`.minify_qss`). Defaults to False
+    output_style : Literal["nested", "expanded", "compact", "compressed"]
+        Output style of libsass. Defaults to "nested"
+
+    Returns
+    -------
+    str
+        Compiled qss.
+
+    See Also
+    --------
+    transpile_sass
+    """
+    sass_file = Path(sass_file).resolve()
+    if partials is None:
+        partials = {}
+    if variables is None:
+        variables = {}
+    source = override_sass_variables(
+        sass_file.read_text(encoding="utf8"), variables, declare=len(variables) > 0
+    )
+    importers = [
+        (0, _cached_qss_importer(partials, [sass_file.parent], variables, conformer=conformer))
+    ]
+    if conformer == "qtsass":
+        qss = qtsass.compile(
+            source,
+            include_paths=[sass_file.parent.as_posix()],
+            importers=importers,
+            output_style=output_style,
+        )
+    else:
+        qss = qss_conformer.qt_conform(
+            sass.compile(
+                string=qss_conformer.scss_conform(source),
+                include_paths=[sass_file.parent.as_posix()],
+                importers=importers,
+                custom_functions=DEFAULT_CUSTOM_FUNCTIONS,
+                source_comments=False,
+                output_style=output_style,
+            )
+        )
+    if minify is True:
+        qss = minify_qss(qss)
+    return cast(str, qss)
+
+
+def transpile_sass(
+    sass_file: str | Path,
+    qss_file: str | Path,
+    *,
+    partials: MutableMapping[str, str] | None = None,
+    variables: Mapping[str, str] | None = None,
+    conformer: Literal["qt-dev-helper", "qtsass"] = "qt-dev-helper",
+    minify: bool = False,
+    output_style: Literal["nested", "expanded", "compact", "compressed"] = "nested",
+) -> Path:
     """Transpile scss file to qss.
 
-    This function differs from ``qtsass.compile_filename`` in that
-    it ensures that the output file is utf8 encoded.
+    This function differs from ``qtsass.compile_filename`` in that
+    it ensures that the output file is utf8 encoded.
+
+    Parameters
+    ----------
+    sass_file : str | Path
+        Path to the sass input file.
+    qss_file : str | Path
+        Path to output the compiled qss file to.
+    partials : MutableMapping[str, str] | None
+        Already conformed partials (see :func:`collect_sass_partials`),
+        used instead of reading imported files again. Defaults to None
+    variables : Mapping[str, str] | None
+        Scss variables to override in ``sass_file`` and all its imports
+        (see :func:`override_sass_variables`). Defaults to None
+    conformer : Literal["qt-dev-helper", "qtsass"]
+        Implementation used to conform qss to scss and back. Defaults to "qt-dev-helper"
+    minify : bool
+        Whether or not to minify the qss (see :func:`.minify_qss`). Defaults to False
+    output_style : Literal["nested", "expanded", "compact", "compressed"]
+        Output style of libsass. Defaults to "nested"
+
+    Returns
+    -------
+    Path
+        Absolute path to the compiled qss file.
+
+    See Also
+    --------
+    transpile_sass_to_str
+    """
+    qss = transpile_sass_to_str(
+        sass_file,
+        partials=partials,
+        variables=variables,
+        conformer=conformer,
+        minify=minify,
+        output_style=output_style,
+    )
+    qss_file = Path(qss_file).resolve()
+    qss_file.parent.mkdir(parents=True, exist_ok=True)
+    qss_file.write_text(qss, encoding="utf8")
+    return qss_file
+
+
+def expand_style_variants(
+    style_paths: Sequence[tuple[Path, Path]],
+    variants: Mapping[str, Mapping[str, str]],
+    *,
+    variant_file_name: str = "{file_stem}_{variant}.qss",
+) -> list[tuple[Path, Path, dict[str, str]]]:
+    """Expand style paths with the variants of each stylesheet.
+
+    Parameters
+    ----------
+    style_paths : Sequence[tuple[Path, Path]]
+        Pairs of paths to a scss entry point and the qss file to compile it to.
+    variants : Mapping[str, Mapping[str, str]]
+        Mapping of variant names to scss variable overrides.
+    variant_file_name : str
+        Format of the variant qss file name with the instructions 'file_stem'
+        and 'variant'. Defaults to "{file_stem}_{variant}.qss"
+
+    Returns
+    -------
+    list[tuple[Path, Path, dict[str, str]]]
+        Scss entry point, qss output file and variable overrides of each stylesheet
+        followed by its variants.
+    """
+    style_jobs: list[tuple[Path, Path, dict[str, str]]] = []
+    for sass_file, qss_file in style_paths:
+        style_jobs.append((sass_file, qss_file, {}))
+        style_jobs.extend(
+            (
+                sass_file,
+                qss_file.with_name(
+                    variant_file_name.format(file_stem=qss_file.stem, variant=variant)
+                ),
+                dict(variables),
+            )
+            for variant, variables in variants.items()
+        )
+    return style_jobs
+
+
+def _is_up_to_date(
+    output_file: Path,
+    fingerprint: str,
+    *,
+    cache: BuildCache | None,
+    fingerprint_headers: bool,
+) -> bool:
+    """Check if ``output_file`` was built from inputs with ``fingerprint``.
+
+    Parameters
+    ----------
+    output_file : Path
+        Path to the output file.
+    fingerprint : str
+        Fingerprint of the current inputs of ``output_file``.
+    cache : BuildCache | None
+        Build cache recording the fingerprints of the outputs.
+    fingerprint_headers : bool
+        Whether or not outputs carry their fingerprint in a header comment.
+
+    Returns
+    -------
+    bool
+        Whether or not the cache or the header of ``output_file`` match ``fingerprint``.
+    """
+    if cache is not None and cache.is_up_to_date(output_file, fingerprint):
+        return True
+    return fingerprint_headers is True and read_output_fingerprint(output_file) == fingerprint
+
+
+def _record_fingerprint(
+    output_file: Path,
+    fingerprint: str,
+    *,
+    cache: BuildCache | None,
+    fingerprint_headers: bool,
+) -> None:
+    """Record that ``output_file`` was built from inputs with ``fingerprint``.
+
+    The header is written first, so outputs stored by the cache contain it.
+
+    Parameters
+    ----------
+    output_file : Path
+        Path to the output file.
+    fingerprint : str
+        Fingerprint of the inputs ``output_file`` was built from.
+    cache : BuildCache | None
+        Build cache recording the fingerprints of the outputs.
+    fingerprint_headers : bool
+        Whether or not to write the fingerprint to a header comment of ``output_file``.
+    """
+    if fingerprint_headers is True:
+        write_output_fingerprint(output_file, fingerprint)
+    if cache is not None:
+        cache.update(output_file, fingerprint)
+
+
+@dataclass(frozen=True)
+class BuildRecord:
+    """Result of building a single output, reported as soon as the output is ready."""
+
+    output: Path
+    kind: Literal["qss", "resource", "ui"]
+    status: Literal["built", "up-to-date"]
+    duration: float
+
+    @property
+    def cache_hit(self) -> bool:
+        """Whether the output was up to date, so it was not built.
+
+        Returns
+        -------
+        bool
+            True if :attr:`status` is 'up-to-date'.
+        """
+        return self.status == "up-to-date"
+
+
+def _report_output(
+    report_function: Callable[[BuildRecord], object] | None,
+    output_file: Path,
+    kind: Literal["qss", "resource", "ui"],
+    status: Literal["built", "up-to-date"],
+    duration: float,
+) -> None:
+    """Pass a :class:`BuildRecord` of ``output_file`` to ``report_function`` if given.
+
+    Parameters
+    ----------
+    report_function : Callable[[BuildRecord], object] | None
+        Function called with the record of each output.
+    output_file : Path
+        Path to the output file.
+    kind : Literal["qss", "resource", "ui"]
+        Kind of asset the output was generated from.
+    status : Literal["built", "up-to-date"]
+        Whether the output was built or skipped since it was up to date.
+    duration : float
+        Seconds spent building or checking the output.
+    """
+    if report_function is not None:
+        report_function(BuildRecord(Path(output_file), kind, status, duration))
+
+
+def _timed_call(function: Callable[..., object], *args: object, **kwargs: object) -> float:
+    """Call ``function`` and measure how long it took, used for jobs run in pools.
+
+    Parameters
+    ----------
+    function : Callable[..., object]
+        Function to call.
+    *args : object
+        Positional arguments passed to ``function``.
+    **kwargs : object
+        Keyword arguments passed to ``function``.
+
+    Returns
+    -------
+    float
+        Duration of the call in seconds.
+    """
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def transpile_sass_files(
+    style_paths: Sequence[tuple[Path, Path]],
+    *,
+    variants: Mapping[str, Mapping[str, str]] | None = None,
+    variant_file_name: str = "{file_stem}_{variant}.qss",
+    conformer: Literal["qt-dev-helper", "qtsass"] = "qt-dev-helper",
+    minify: bool = False,
+    output_style: Literal["nested", "expanded", "compact", "compressed"] = "nested",
+    cache: BuildCache | None = None,
+    fingerprint_headers: bool = False,
+    log_function: Callable[..., None] = rich.print,
+    base_path: Path | None = None,
+    max_workers: int | None = None,
+    report_function: Callable[[BuildRecord], object] | None = None,
+) -> list[Path]:
+    """Transpile multiple scss entry points and their variants to qss in parallel.
+
+    Since libsass holds the GIL for the whole compilation, the stylesheets are
+    compiled in a process pool. Partials shared between entry points are read and
+    conformed only once and then passed to all workers.
+
+    Parameters
+    ----------
+    style_paths : Sequence[tuple[Path, Path]]
+        Pairs of paths to a scss entry point and the qss file to compile it to.
+    variants : Mapping[str, Mapping[str, str]] | None
+        Mapping of variant names to scss variable overrides, each stylesheet is
+        additionally compiled for each variant. Defaults to None
+    variant_file_name : str
+        Format of the variant qss file name with the instructions 'file_stem'
+        and 'variant'. Defaults to "{file_stem}_{variant}.qss"
+    conformer : Literal["qt-dev-helper", "qtsass"]
+        Implementation used to conform qss to scss and back. Defaults to "qt-dev-helper"
+    minify : bool
+        Whether or not to minify the qss (see :func:`.minify_qss`). Defaults to False
+    output_style : Literal["nested", "expanded", "compact", "compressed"]
+        Output style of libsass. Defaults to "nested"
+    cache : BuildCache | None
+        Build cache used to skip stylesheets with unchanged inputs. Defaults to None
+    fingerprint_headers : bool
+        Whether or not to write the fingerprint of the inputs to a header comment of each
+        qss file and skip qss files whose header matches (see
+        :func:`.write_output_fingerprint`). Defaults to False
+    log_function : Callable[..., None]
+        Function used to print log messages. Defaults to rich.print
+    base_path : Path | None
+        Path logged output paths are relative to. Defaults to None
+    max_workers : int | None
+        Maximum number of worker processes. Defaults to None which means
+        the number of stylesheets capped by the number of CPUs.
+    report_function : Callable[[BuildRecord], object] | None
+        Function called with a :class:`BuildRecord` as soon as each qss file is
+        written or found up to date. Defaults to None
+
+    Returns
+    -------
+    list[Path]
+        Absolute paths to the qss files, in the same order as ``style_paths``
+        with the variants following each stylesheet.
+
+    See Also
+    --------
+    transpile_sass
+    expand_style_variants
+    """
+    partials_cache: dict[str, str] = {}
+    entry_partials = {
+        sass_file: collect_sass_partials(sass_file, partials_cache, conformer=conformer)
+        for sass_file, _ in style_paths
+    }
+    style_jobs = expand_style_variants(
+        style_paths, variants or {}, variant_file_name=variant_file_name
+    )
+
+    qss_files = [Path(qss_file).resolve() for _, qss_file, _ in style_jobs]
+    pending_jobs = []
+    for (sass_file, qss_file, variables), resolved_qss_file in zip(style_jobs, qss_files):
+        start = time.perf_counter()
+        fingerprint = hash_content(
+            qtsass.__version__,
+            conformer,
+            f"minify={minify}",
+            f"output_style={output_style}",
+            Path(sass_file).read_text(encoding="utf8"),
+            *(f"{path}\n{source}" for path, source in sorted(entry_partials[sass_file].items())),
+            *(f"{name}={value}" for name, value in sorted(variables.items())),
+        )
+        rel_qss_path = (
+            Path(qss_file).relative_to(base_path) if base_path is not None else Path(qss_file)
+        )
+        if _is_up_to_date(
+            resolved_qss_file, fingerprint, cache=cache, fingerprint_headers=fingerprint_headers
+        ):
+            log_function(f"Up to date: {rel_qss_path.as_posix()}")
+            _report_output(
+                report_function,
+                resolved_qss_file,
+                "qss",
+                "up-to-date",
+                time.perf_counter() - start,
+            )
+            continue
+        log_function(f"Creating: {rel_qss_path.as_posix()}")
+        pending_jobs.append((sass_file, resolved_qss_file, variables, fingerprint))
+
+    def finish_job(qss_file: Path, fingerprint: str, duration: float) -> None:
+        _record_fingerprint(
+            qss_file, fingerprint, cache=cache, fingerprint_headers=fingerprint_headers
+        )
+        _report_output(report_function, qss_file, "qss", "built", duration)
+
+    transpile_kwargs = {
+        "partials": partials_cache,
+        "conformer": conformer,
+        "minify": minify,
+        "output_style": output_style,
+    }
+    if max_workers is None:
+        max_workers = min(len(pending_jobs), os.cpu_count() or 1)
+    if len(pending_jobs) <= 1 or max_workers <= 1:
+        for sass_file, qss_file, variables, fingerprint in pending_jobs:
+            duration = _timed_call(
+                transpile_sass, sass_file, qss_file, variables=variables, **transpile_kwargs
+            )
+            finish_job(qss_file, fingerprint, duration)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _timed_call,
+                    transpile_sass,
+                    sass_file,
+                    qss_file,
+                    variables=variables,
+                    **transpile_kwargs,
+                ): (qss_file, fingerprint)
+                for sass_file, qss_file, variables, fingerprint in pending_jobs
+            }
+            # Stylesheets are recorded in the order they finish, so they are reported early
+            for future in as_completed(futures):
+                finish_job(*futures[future], future.result())
+    return qss_files
+
+
+def uic_arguments(
+    ui_file: str | Path,
+    output_path: str | Path | None,
+    *,
+    generator: Literal["python", "cpp"] = "python",
+    form_import: bool = True,
+    uic_args: Sequence[str] = (),
+) -> tuple[str, ...]:
+    """Create the arguments 'uic' is called with by :func:`compile_ui_file`.
+
+    Parameters
+    ----------
+    ui_file : str | Path
+        Path to the ui file.
+    output_path : str | Path | None
+        Path the output file should be saved to, None means stdout.
+    generator : Literal["python", "cpp"]
+        Language to generate code for. Defaults to "python"
+    form_import : bool
+        Sets the '--from-imports' flag when used with python. Defaults to True
+    uic_args : Sequence[str]
+        Additional args for 'uic' (use '--help' for details). Defaults to ()
+
+    Returns
+    -------
+    tuple[str, ...]
+        Arguments for 'uic'.
+    """
+    options = [] if output_path is None else ["-o", Path(output_path).as_posix()]
+    options += ["-g", generator]
+    if generator == "python" and form_import is True:
+        options.append("--from-imports")
+    return (Path(ui_file).as_posix(), *options, *uic_args)
+
+
+def _uic_header_guard(file_name: str) -> str:
+    """Create the include guard 'uic' uses for a header file (e.g. 'UI_FORM_H').
+
+    Parameters
+    ----------
+    file_name : str
+        Name of the header file.
+
+    Returns
+    -------
+    str
+        Include guard, with characters invalid in C identifiers replaced by their code.
+    """
+    base_name = Path(file_name).name.split(".")[0] or "noname"
+    if base_name[0].isdigit():
+        base_name = f"_{base_name}"
+    guard = "".join(
+        char if char.isascii() and (char.isalnum() or char == "_") else f"_{ord(char):X}_"
+        for char in base_name
+    )
+    return f"{guard.upper()}_H"
+
+
+def compile_ui_to_str(
+    ui_file: str | Path,
+    *,
+    generator: Literal["python", "cpp"] = "python",
+    form_import: bool = True,
+    uic_args: Sequence[str] = (),
+    output_name: str | None = None,
+) -> str:
+    """Call 'Qt User Interface Compiler' and return the generated code without writing it.
+
+    Parameters
+    ----------
+    ui_file : str | Path
+        Path to the ui file.
+    generator : Literal["python", "cpp"]
+        Language to generate code for. Defaults to "python"
+    form_import : bool
+        Sets the '--from-imports' flag when used with python. Defaults to True
+    uic_args : Sequence[str]
+        Additional args for 'uic' (use '--help' for details). Defaults to ()
+    output_name : str | None
+        C++: name of the header file the code is saved as, which 'uic' derives the
+        include guard from. Defaults to None which means the guard is derived from
+        the name of ``ui_file``.
+
+    Returns
+    -------
+    str
+        Generated code.
+
+    See Also
+    --------
+    compile_ui_file
+    """
+    args = uic_arguments(
+        ui_file, None, generator=generator, form_import=form_import, uic_args=uic_args
+    )
+    code = run_qt_tool("uic", arguments=args).decode("utf8").replace("\r\n", "\n")
+    if generator == "cpp" and output_name is not None:
+        stdout_guard = _uic_header_guard(f"ui_{Path(ui_file).as_posix()}")
+        output_guard = _uic_header_guard(output_name)
+        for directive in ("#ifndef ", "#define ", "#endif // "):
+            code = code.replace(f"{directive}{stdout_guard}\n", f"{directive}{output_guard}\n", 1)
+    return code
+
+
+def compile_ui_file(
+    ui_file: str | Path,
+    output_path: str | Path,
+    *,
+    generator: Literal["python", "cpp"] = "python",
+    form_import: bool = True,
+    uic_args: Sequence[str] = (),
+) -> Path:
+    """Call 'Qt User Interface Compiler' to create code from a ui file.
+
+    Parameters
+    ----------
+    ui_file : str | Path
+        Path to the ui file.
+    output_path : str | Path
+        Path the output file should be saved to.
+    generator : Literal["python", "cpp"]
+        Language to generate code for. Defaults to "python"
+    form_import : bool
+        Sets the '--from-imports' flag when used with python. Defaults to True
+    uic_args : Sequence[str]
+        Additional args for 'uic' (use '--help' for details). Defaults to ()
+
+    Returns
+    -------
+    Path
+        Path of the compiled file
+
+    See Also
+    --------
+    compile_ui_to_str
+    """
+    output_path = Path(output_path)
+    code = compile_ui_to_str(
+        ui_file,
+        generator=generator,
+        form_import=form_import,
+        uic_args=uic_args,
+        output_name=output_path.name,
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(code, encoding="utf8")
+    return output_path
+
+
+class OutputCollisionError(Exception):
+    """Error thrown when multiple input files would be compiled to the same output file."""
+
+
+def _resolved_output_path(
+    rel_input_file: Path,
+    rel_out_path: Path,
+    format_string: str,
+    *,
+    collision_policy: Literal["suffix", "structure"],
+    generator: Literal["python", "cpp"],
+) -> Path:
+    """Determine the output path of an input file, whose flattened output path collides.
+
+    Parameters
+    ----------
+    rel_input_file : Path
+        Path of the input file relative to the input folder.
+    rel_out_path : Path
+        Colliding output path relative to the output folder.
+    format_string : str
+        Format of the python output file name (e.g. 'Ui_{file_stem}.py').
+    collision_policy : Literal["suffix", "structure"]
+        Whether to append the relative folder to the output name or to keep the folder.
+    generator : Literal["python", "cpp"]
+        Language code is generated for.
+
+    Returns
+    -------
+    Path
+        Output path relative to the output folder (e.g. 'Ui_minimal_a.py' or 'a/Ui_minimal.py').
+    """
+    rel_folder = rel_input_file.parent
+    if collision_policy == "structure":
+        return rel_folder / rel_out_path.name
+    if len(rel_folder.parts) == 0:
+        return rel_out_path
+    rel_out_path = Path(
+        format_string.format(file_stem="_".join((rel_input_file.stem, *rel_folder.parts)))
+    )
+    return rel_out_path.with_suffix(".h") if generator == "cpp" else rel_out_path
+
+
+def _resolve_output_collisions(
+    rel_paths: Sequence[tuple[Path, Path]],
+    input_folder: Path,
+    format_string: str,
+    *,
+    collision_policy: Literal["overwrite", "error", "suffix", "structure"],
+    generator: Literal["python", "cpp"],
+    log_function: Callable[..., None] | None,
+) -> list[tuple[Path, Path]]:
+    """Resolve input files with the same relative output path according to ``collision_policy``.
+
+    Parameters
+    ----------
+    rel_paths : Sequence[tuple[Path, Path]]
+        Pairs of input file and output path relative to the output folder.
+    input_folder : Path
+        Base path containing the input files.
+    format_string : str
+        Format of the python output file name (e.g. 'Ui_{file_stem}.py').
+    collision_policy : Literal["overwrite", "error", "suffix", "structure"]
+        Whether to only keep the last of the colliding input files (like compiling all of
+        them, which overwrite each others output), to raise an error, to append the
+        relative folder of colliding input files to their output names or to keep the
+        folder structure of colliding input files.
+    generator : Literal["python", "cpp"]
+        Language code is generated for.
+    log_function : Callable[..., None] | None
+        Function used to print log messages about resolved or overwritten collisions.
+
+    Returns
+    -------
+    list[tuple[Path, Path]]
+        Pairs of input file and unique relative output path.
+
+    Raises
+    ------
+    OutputCollisionError
+        If the policy is 'error' and there are collisions or the collisions can't be resolved.
+    """
+    inputs_by_output: dict[Path, list[Path]] = {}
+    for input_file, rel_out_path in rel_paths:
+        inputs_by_output.setdefault(rel_out_path, []).append(input_file)
+    collisions = {
+        rel_out_path: input_files
+        for rel_out_path, input_files in inputs_by_output.items()
+        if len(input_files) > 1
+    }
+    if len(collisions) == 0:
+        return list(rel_paths)
+    messages = [
+        f"{rel_out_path.as_posix()} <= "
+        + ", ".join(input_file.relative_to(input_folder).as_posix() for input_file in input_files)
+        for rel_out_path, input_files in collisions.items()
+    ]
+    if collision_policy == "error":
+        msg = "Multiple files would be compiled to the same output:\n\t" + "\n\t".join(messages)
+        raise OutputCollisionError(msg)
+    if collision_policy == "overwrite":
+        if log_function is not None:
+            for message in messages:
+                log_function(
+                    f"Warning: output collision, only the last file is compiled: {message}"
+                )
+        return [
+            (input_file, rel_out_path)
+            for input_file, rel_out_path in rel_paths
+            if input_file == inputs_by_output[rel_out_path][-1]
+        ]
+
+    resolved_paths = [
+        (
+            input_file,
+            _resolved_output_path(
+                input_file.relative_to(input_folder),
+                rel_out_path,
+                format_string,
+                collision_policy=collision_policy,
+                generator=generator,
+            )
+            if rel_out_path in collisions
+            else rel_out_path,
+        )
+        for input_file, rel_out_path in rel_paths
+    ]
+    if len({rel_out_path for _, rel_out_path in resolved_paths}) < len(resolved_paths):
+        msg = f"Output collisions can't be resolved with {collision_policy!r}:\n\t" + (
+            "\n\t".join(messages)
+        )
+        raise OutputCollisionError(msg)
+    if log_function is not None:
+        for message in messages:
+            log_function(f"Output collision resolved with {collision_policy!r}: {message}")
+    return resolved_paths
+
+
+def _output_paths(
+    input_folder: Path,
+    output_folder: Path,
+    file_pattern: str,
+    format_string: str,
+    *,
+    flatten_path: bool,
+    generator: Literal["python", "cpp"],
+    recurse_folder: bool,
+    collision_policy: Literal["overwrite", "error", "suffix", "structure"] = "overwrite",
+    log_function: Callable[..., None] | None = None,
+) -> list[tuple[Path, Path]]:
+    """Determine the output path of each file matching ``file_pattern`` in ``input_folder``.
+
+    All output paths are planned before anything is compiled, so input files which
+    would overwrite each others output are detected (see :func:`_resolve_output_collisions`).
+
+    Parameters
+    ----------
+    input_folder : Path
+        Base path containing the input files.
+    output_folder : Path
+        Base path to save generated code to.
+    file_pattern : str
+        Pattern to match input files (e.g. '*.ui').
+    format_string : str
+        Format of the python output file name (e.g. 'Ui_{file_stem}.py').
+    flatten_path : bool
+        Whether or not to flatten the folder structure of the input files.
+    generator : Literal["python", "cpp"]
+        Language code is generated for.
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files.
+    collision_policy : Literal["overwrite", "error", "suffix", "structure"]
+        Handling of input files with the same output path. Defaults to "overwrite"
+    log_function : Callable[..., None] | None
+        Function used to print log messages about resolved collisions. Defaults to None
+
+    Returns
+    -------
+    list[tuple[Path, Path]]
+        Pairs of input file and output file paths, sorted by input file.
+    """
+    rel_paths = []
+    for input_file in find_matching_files(
+        [input_folder], file_pattern, recurse_folder=recurse_folder
+    ):
+        rel_out_path = format_rel_output_path(
+            input_folder, Path(input_file), format_string, flatten_path=flatten_path
+        )
+        if generator == "cpp":
+            rel_out_path = rel_out_path.with_suffix(".h")
+        rel_paths.append((Path(input_file), rel_out_path))
+    return [
+        (input_file, output_folder / rel_out_path)
+        for input_file, rel_out_path in _resolve_output_collisions(
+            rel_paths,
+            input_folder,
+            format_string,
+            collision_policy=collision_policy,
+            generator=generator,
+            log_function=log_function,
+        )
+    ]
+
+
+def ui_output_paths(
+    ui_files_folder: Path,
+    generated_ui_code_folder: Path,
+    *,
+    flatten_path: bool = True,
+    generator: Literal["python", "cpp"] = "python",
+    recurse_folder: bool = True,
+    collision_policy: Literal["overwrite", "error", "suffix", "structure"] = "overwrite",
+    log_function: Callable[..., None] | None = None,
+) -> list[tuple[Path, Path]]:
+    """Determine the path of the generated code for each ui file in a folder.
+
+    Parameters
+    ----------
+    ui_files_folder : Path
+        Base path containing the input ui files.
+    generated_ui_code_folder : Path
+        Base path to save generated code from ui files to.
+    flatten_path : bool
+        Whether or not to flatten the folder structure of the ui files. Defaults to True
+    generator : Literal["python", "cpp"]
+        Language code is generated for. Defaults to "python"
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+    collision_policy : Literal["overwrite", "error", "suffix", "structure"]
+        Handling of files with the same flattened output path ('overwrite' only compiles
+        the last of them and 'error' raises an :class:`OutputCollisionError`).
+        Defaults to "overwrite"
+    log_function : Callable[..., None] | None
+        Function used to print log messages about resolved collisions. Defaults to None
+
+    Returns
+    -------
+    list[tuple[Path, Path]]
+        Pairs of ui file and generated code file paths.
+    """
+    return _output_paths(
+        ui_files_folder,
+        generated_ui_code_folder,
+        "*.ui",
+        "Ui_{file_stem}.py",
+        flatten_path=flatten_path,
+        generator=generator,
+        recurse_folder=recurse_folder,
+        collision_policy=collision_policy,
+        log_function=log_function,
+    )
+
+
+def resource_output_paths(
+    resource_folder: Path,
+    generated_rc_code_folder: Path,
+    *,
+    flatten_path: bool = True,
+    generator: Literal["python", "cpp"] = "python",
+    recurse_folder: bool = True,
+    collision_policy: Literal["overwrite", "error", "suffix", "structure"] = "overwrite",
+    log_function: Callable[..., None] | None = None,
+) -> list[tuple[Path, Path]]:
+    """Determine the path of the generated code for each qrc file in a folder.
+
+    Parameters
+    ----------
+    resource_folder : Path
+        Base path containing the input qrc files.
+    generated_rc_code_folder : Path
+        Base path to save generated code from qrc files to.
+    flatten_path : bool
+        Whether or not to flatten the folder structure of the qrc files. Defaults to True
+    generator : Literal["python", "cpp"]
+        Language code is generated for. Defaults to "python"
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+    collision_policy : Literal["overwrite", "error", "suffix", "structure"]
+        Handling of files with the same flattened output path ('overwrite' only compiles
+        the last of them and 'error' raises an :class:`OutputCollisionError`).
+        Defaults to "overwrite"
+    log_function : Callable[..., None] | None
+        Function used to print log messages about resolved collisions. Defaults to None
+
+    Returns
+    -------
+    list[tuple[Path, Path]]
+        Pairs of qrc file and generated code file paths.
+    """
+    return _output_paths(
+        resource_folder,
+        generated_rc_code_folder,
+        "*.qrc",
+        "{file_stem}_rc.py",
+        flatten_path=flatten_path,
+        generator=generator,
+        recurse_folder=recurse_folder,
+        collision_policy=collision_policy,
+        log_function=log_function,
+    )
+
+
+def ui_dependency_edges(
+    ui_modules: Iterable[tuple[Path, Path]],
+    resource_paths: Iterable[tuple[Path, Path]],
+    index: UiIndex,
+) -> dict[Path, list[Path]]:
+    """Find the files the code generated from ui files depends on.
+
+    Forms depend on the resources they include (e.g. ``<include location="../icons.qrc"/>``)
+    and on the headers (or python modules) of promoted custom widgets, which exist
+    relative to the ui file. Included qrc files, which are compiled by the build,
+    are replaced by their generated output, so a form is rebuilt when the code it
+    imports is rebuilt.
 
     Parameters
     ----------
-    sass_file : str | Path
-        Path to the sass input file.
-    qss_file : str | Path
-        Path to output the compiled qss file to.
+    ui_modules : Iterable[tuple[Path, Path]]
+        Pairs of ui files and the code files generated from them.
+    resource_paths : Iterable[tuple[Path, Path]]
+        Pairs of qrc files and the code files generated from them.
+    index : UiIndex
+        Index providing the metadata of the ui files.
 
     Returns
     -------
-    Path
-        Absolute path to the compiled qss file.
+    dict[Path, list[Path]]
+        Dependencies of each code file generated from a ui file.
     """
-    sass_file = Path(sass_file).resolve()
-    qss = qtsass.compile(
-        sass_file.read_text(encoding="utf8"),
-        include_paths=[sass_file.parent.as_posix()],
-    )
-    qss_file = Path(qss_file).resolve()
-    qss_file.parent.mkdir(parents=True, exist_ok=True)
-    qss_file.write_text(cast(str, qss), encoding="utf8")
-    return qss_file
+    resource_outputs = {qrc_file.resolve(): out_file for qrc_file, out_file in resource_paths}
+    edges: dict[Path, list[Path]] = {}
+    for ui_file, out_file in ui_modules:
+        metadata = index.get(ui_file)
+        dependencies = [
+            resource_outputs.get(qrc_file.resolve(), qrc_file)
+            for qrc_file in metadata.resource_files(ui_file)
+        ]
+        for custom_widget in metadata.custom_widgets:
+            if custom_widget.header is None or custom_widget.global_include is True:
+                continue
+            header_file = ui_file.parent / custom_widget.header
+            dependencies += [
+                path for path in (header_file, header_file.with_suffix(".py")) if path.is_file()
+            ]
+        edges[out_file] = list(dict.fromkeys(dependencies))
+    return edges
 
 
-def compile_ui_file(
-    ui_file: str | Path,
-    output_path: str | Path,
-    *,
-    generator: Literal["python", "cpp"] = "python",
-    form_import: bool = True,
-    uic_args: Sequence[str] = (),
-) -> Path:
-    """Call 'Qt User Interface Compiler' to create code from a ui file.
+def _ui_fingerprint(ui_file: Path, dependencies: Sequence[Path], *, uic_kwargs: UicKwargs) -> str:
+    """Create a fingerprint of everything the code generated from ``ui_file`` depends on.
 
     Parameters
     ----------
-    ui_file : str | Path
+    ui_file : Path
         Path to the ui file.
-    output_path : str | Path
-        Path the output file should be saved to.
-    generator : Literal["python", "cpp"]
-        Language to generate code for. Defaults to "python"
-    form_import : bool
-        Sets the '--from-imports' flag when used with python. Defaults to True
-    uic_args : Sequence[str]
-        Additional args for 'uic' (use '--help' for details). Defaults to ()
+    dependencies : Sequence[Path]
+        Files the generated code depends on (see :func:`ui_dependency_edges`).
+    uic_kwargs : UicKwargs
+        Keyword arguments passed to :func:`compile_ui_file`.
 
     Returns
     -------
-    Path
-        Path of the compiled file
+    str
+        Fingerprint of the form.
     """
-    options = ["-g", generator]
-    if generator == "python" and form_import is True:
-        options.append("--from-imports")
-
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    args = (Path(ui_file).as_posix(), "-o", output_path.as_posix(), *options, *uic_args)
-
-    call_qt_tool("uic", arguments=args)
-    return output_path
+    contents: list[str | bytes] = [
+        find_qt_tool("uic"),
+        repr(sorted(uic_kwargs.items())),
+        ui_file.read_bytes(),
+    ]
+    for dependency in dependencies:
+        contents += [
+            dependency.as_posix(),
+            dependency.read_bytes() if dependency.is_file() else b"",
+        ]
+    return hash_content(*contents)
 
 
-def compile_resource_file(
-    qrc_file: str | Path,
+def write_ui_registry(
+    ui_modules: Iterable[tuple[Path, Path]],
     output_path: str | Path,
     *,
-    generator: Literal["python", "cpp"] = "python",
-    rcc_args: Sequence[str] = (),
-) -> Path:
-    """Call 'Qt Resource Compiler' to create code from a resource file.
+    log_function: Callable[..., None] = rich.print,
+    index: UiIndex | None = None,
+) -> bool:
+    """Write a package ``__init__.py`` importing generated form classes on first access.
+
+    The registry maps the form class of each ui file (e.g. 'Ui_MainWindow') to the
+    module generated from it and imports the module in the module ``__getattr__``.
+    The file is only written if its content changed, so unchanged registries keep
+    their modification time and bytecode.
 
     Parameters
     ----------
-    qrc_file : str | Path
-        Path to the resource file.
+    ui_modules : Iterable[tuple[Path, Path]]
+        Pairs of ui files and the python modules generated from them.
     output_path : str | Path
-        Path the output file should be saved to.
-    generator : Literal["python", "cpp"]
-        Language to generate code for. Defaults to "python"
-    rcc_args : Sequence[str]
-        Additional args for 'rcc' (use '--help' for details). Defaults to ()
+        Path the registry should be saved to, the modules are imported relative to it.
+    log_function : Callable[..., None]
+        Function used to print log messages. Defaults to rich.print
+    index : UiIndex | None
+        Index to look up the form classes in instead of reading the ui files.
+        Defaults to None
 
     Returns
     -------
-    Path
-        Path of the compiled file
+    bool
+        Whether or not the registry was written.
     """
-    options = ["-g", generator]
-
     output_path = Path(output_path)
+    form_files: dict[str, list[Path]] = {}
+    form_modules: dict[str, str] = {}
+    for ui_file, module_file in ui_modules:
+        form_class = read_form_class(ui_file) if index is None else index.get(ui_file).form_class
+        if form_class is None or not form_class.isidentifier():
+            continue
+        form_files.setdefault(form_class, []).append(ui_file)
+        form_modules[form_class] = ".".join(
+            module_file.relative_to(output_path.parent).with_suffix("").parts
+        )
+    for form_class, ui_files in form_files.items():
+        if len(ui_files) > 1:
+            log_function(
+                f"Ambiguous form class {form_class!r} not registered, defined in: "
+                + ", ".join(ui_file.name for ui_file in ui_files)
+            )
+            del form_modules[form_class]
+
+    form_modules = dict(sorted(form_modules.items()))
+    registry = UI_REGISTRY_TEMPLATE.format(
+        package_name=output_path.parent.name,
+        example=next(iter(form_modules), "Ui_MainWindow"),
+        form_modules=form_modules,
+        form_classes=list(form_modules),
+    )
+    if output_path.is_file() and output_path.read_text(encoding="utf8") == registry:
+        return False
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    args = (Path(qrc_file).as_posix(), "-o", output_path.as_posix(), *options, *rcc_args)
+    output_path.write_text(registry, encoding="utf8")
+    return True
 
-    call_qt_tool("rcc", arguments=args)
-    return output_path
+
+def _build_ui_registry(
+    ui_modules: Sequence[tuple[Path, Path]],
+    generated_ui_code_folder: Path,
+    *,
+    index: UiIndex,
+    log_function: Callable[..., None],
+    report_function: Callable[[BuildRecord], object] | None = None,
+) -> list[Path]:
+    """Write the form registry unless a not generated ``__init__.py`` exists.
+
+    Parameters
+    ----------
+    ui_modules : Sequence[tuple[Path, Path]]
+        Pairs of ui files and the python modules generated from them.
+    generated_ui_code_folder : Path
+        Folder the registry is written to.
+    index : UiIndex
+        Index to look up the form classes in.
+    log_function : Callable[..., None]
+        Function used to print log messages.
+    report_function : Callable[[BuildRecord], object] | None
+        Function called with the :class:`BuildRecord` of the registry. Defaults to None
+
+    Returns
+    -------
+    list[Path]
+        List containing the registry if it was written.
+    """
+    registry_file = generated_ui_code_folder / UI_REGISTRY_FILE_NAME
+    if registry_file.is_file() and not registry_file.read_text(encoding="utf8").startswith(
+        UI_REGISTRY_HEADER
+    ):
+        log_function(f"Skipping: {UI_REGISTRY_FILE_NAME} is not a generated form registry")
+        return []
+    start = time.perf_counter()
+    if write_ui_registry(ui_modules, registry_file, log_function=log_function, index=index):
+        log_function(f"Creating: {UI_REGISTRY_FILE_NAME}")
+        _report_output(report_function, registry_file, "ui", "built", time.perf_counter() - start)
+        return [registry_file]
+    log_function(f"Up to date: {UI_REGISTRY_FILE_NAME}")
+    _report_output(report_function, registry_file, "ui", "up-to-date", time.perf_counter() - start)
+    return []
 
 
 def build_uis(
@@ -136,9 +1349,21 @@ def build_uis(
     uic_kwargs: UicKwargs | None = None,
     log_function: Callable[..., None] = rich.print,
     recurse_folder: bool = True,
+    collision_policy: Literal["overwrite", "error", "suffix", "structure"] = "overwrite",
+    registry: bool = False,
+    index: UiIndex | None = None,
+    resource_paths: Sequence[tuple[Path, Path]] = (),
+    cache: BuildCache | None = None,
+    fingerprint_headers: bool = False,
+    max_workers: int | None = None,
+    report_function: Callable[[BuildRecord], object] | None = None,
 ) -> list[Path]:
     """Compile ui files by iterating over all ui files in a folder.
 
+    Forms are compiled in parallel and, if a ``cache`` is given, only if the ui file
+    or one of its dependencies (see :func:`ui_dependency_edges`) changed. Resources
+    should be built before, so changed resource code marks dependent forms as changed.
+
     Parameters
     ----------
     ui_files_folder : Path
@@ -155,6 +1380,31 @@ def build_uis(
         Function used to print log messages. Defaults to rich.print
     recurse_folder : bool
         Whether or not to recurse directories searching for files. Defaults to True
+    collision_policy : Literal["overwrite", "error", "suffix", "structure"]
+        Handling of ui files with the same flattened output path
+        (see :func:`ui_output_paths`). Defaults to "overwrite"
+    registry : bool
+        Python: whether or not to generate an ``__init__.py`` in ``generated_ui_code_folder``
+        importing the form classes lazily (see :func:`write_ui_registry`).
+        An existing ``__init__.py``, which was not generated, is never overwritten.
+        Defaults to False
+    index : UiIndex | None
+        Index updated with the metadata of each ui file, which can be queried by
+        later build stages. Defaults to None
+    resource_paths : Sequence[tuple[Path, Path]]
+        Pairs of qrc files and their generated code files, which are built before the
+        forms including them. Defaults to ()
+    cache : BuildCache | None
+        Build cache used to skip forms with unchanged inputs. Defaults to None
+    fingerprint_headers : bool
+        Whether or not to write the fingerprint of the inputs to a header comment of
+        the generated code and skip forms whose header matches (see
+        :func:`.write_output_fingerprint`). Defaults to False
+    max_workers : int | None
+        Maximal number of parallel 'uic' calls, see ``ThreadPoolExecutor``. Defaults to None
+    report_function : Callable[[BuildRecord], object] | None
+        Function called with a :class:`BuildRecord` as soon as each form is compiled
+        or found up to date. Defaults to None
 
     Returns
     -------
@@ -168,19 +1418,63 @@ def build_uis(
     built_files = []
     if uic_kwargs is None:
         uic_kwargs = {}
-    for ui_file in find_matching_files([ui_files_folder], "*.ui", recurse_folder=recurse_folder):
-        rel_out_path = format_rel_output_path(
-            ui_files_folder,
-            Path(ui_file),
-            "Ui_{file_stem}.py",
-            flatten_path=flatten_path,
+    generator = uic_kwargs.get("generator", "python")
+    ui_modules = ui_output_paths(
+        ui_files_folder,
+        generated_ui_code_folder,
+        flatten_path=flatten_path,
+        generator=generator,
+        recurse_folder=recurse_folder,
+        collision_policy=collision_policy,
+        log_function=log_function,
+    )
+    if index is None:
+        index = UiIndex()
+    edges = ui_dependency_edges(ui_modules, resource_paths, index)
+    jobs = []
+    for ui_file, out_file in ui_modules:
+        start = time.perf_counter()
+        rel_out_path = out_file.relative_to(generated_ui_code_folder).as_posix()
+        fingerprint = (
+            _ui_fingerprint(ui_file, edges[out_file], uic_kwargs=uic_kwargs)
+            if cache is not None or fingerprint_headers is True
+            else ""
+        )
+        built_files.append(out_file)
+        if _is_up_to_date(
+            out_file, fingerprint, cache=cache, fingerprint_headers=fingerprint_headers
+        ):
+            log_function(f"Up to date: {rel_out_path}")
+            _report_output(
+                report_function, out_file, "ui", "up-to-date", time.perf_counter() - start
+            )
+            continue
+        log_function(f"Creating: {rel_out_path}")
+        jobs.append((ui_file, out_file, fingerprint))
+    # uic runs in a subprocess, so threads are sufficient
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_timed_call, compile_ui_file, ui_file, out_file, **uic_kwargs): (
+                out_file,
+                fingerprint,
+            )
+            for ui_file, out_file, fingerprint in jobs
+        }
+        for future in as_completed(futures):
+            out_file, fingerprint = futures[future]
+            duration = future.result()
+            _record_fingerprint(
+                out_file, fingerprint, cache=cache, fingerprint_headers=fingerprint_headers
+            )
+            _report_output(report_function, out_file, "ui", "built", duration)
+    if registry is True and generator == "python":
+        built_files += _build_ui_registry(
+            ui_modules,
+            generated_ui_code_folder,
+            index=index,
+            log_function=log_function,
+            report_function=report_function,
         )
-        if uic_kwargs.get("generator", "python") == "cpp":
-            rel_out_path = rel_out_path.with_suffix(".h")
-        out_file = generated_ui_code_folder / rel_out_path
-        log_function(f"Creating: {rel_out_path.as_posix()}")
-        built_file = compile_ui_file(ui_file, out_file, **uic_kwargs)
-        built_files.append(built_file)
     return built_files
 
 
@@ -192,6 +1486,13 @@ def build_resources(
     rcc_kwargs: RccKwargs | None = None,
     log_function: Callable[..., None] = rich.print,
     recurse_folder: bool = True,
+    collision_policy: Literal["overwrite", "error", "suffix", "structure"] = "overwrite",
+    cache: BuildCache | None = None,
+    deduplication: Literal["off", "report", "share"] = "off",
+    optimize_assets: bool = False,
+    compression_tuning: Literal["off", "file", "qrc"] = "off",
+    fingerprint_headers: bool = False,
+    report_function: Callable[[BuildRecord], object] | None = None,
 ) -> list[Path]:
     """Compile qrc files by iterating over all qrc files in a folder.
 
@@ -211,38 +1512,563 @@ def build_resources(
         Function used to print log messages. Defaults to rich.print
     recurse_folder : bool
         Whether or not to recurse directories searching for files. Defaults to True
+    collision_policy : Literal["overwrite", "error", "suffix", "structure"]
+        Handling of qrc files with the same flattened output path
+        (see :func:`resource_output_paths`). Defaults to "overwrite"
+    cache : BuildCache | None
+        Build cache used to skip compiling unchanged shards or prefix modules
+        (see :func:`.resources.compile_resource_file`). Defaults to None
+    deduplication : Literal["off", "report", "share"]
+        Whether to ignore, log ('report') or share ('share', python only) files with
+        identical content referenced by multiple qrc files
+        (see :func:`build_shared_resources`). Defaults to "off"
+    optimize_assets : bool
+        Whether or not to minify SVG and recompress PNG files before compiling them
+        (see :class:`.asset_optimizer.AssetOptimizer`). Optimized files are saved in the
+        folder of ``cache`` so they are only optimized again if their content changes.
+        Defaults to False
+    compression_tuning : Literal["off", "file", "qrc"]
+        Whether to choose the rcc compression for each file, for all files of a qrc file
+        or to only use ``rcc_args`` (see :func:`tune_resource_compression`).
+        Choices are recorded in the folder of ``cache``. Defaults to "off"
+    fingerprint_headers : bool
+        Whether or not to write the fingerprint of the inputs to a header comment of
+        the generated code and skip qrc files whose header matches (see
+        :func:`.write_output_fingerprint`). Only applies to qrc files compiled to a
+        single code file, binary, lazy and sharded resources are always compiled.
+        Defaults to False
+    report_function : Callable[[BuildRecord], object] | None
+        Function called with a :class:`BuildRecord` as soon as each qrc file is
+        compiled or found up to date. Defaults to None
+
+    Returns
+    -------
+    list[Path]
+        List of generated files.
+    """
+    if rcc_kwargs is None:
+        rcc_kwargs = {}
+    resource_paths = resource_output_paths(
+        resource_folder,
+        generated_rc_code_folder,
+        flatten_path=flatten_path,
+        generator=rcc_kwargs.get("generator", "python"),
+        recurse_folder=recurse_folder,
+        collision_policy=collision_policy,
+        log_function=log_function,
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if optimize_assets is True:
+            optimized_qrc_folder = Path(temp_dir) / "qrc"
+            resource_paths = optimize_resource_assets(
+                resource_paths,
+                resource_folder,
+                optimized_qrc_folder,
+                asset_cache_folder=(
+                    Path(temp_dir) / "assets"
+                    if cache is None
+                    else cache.cache_folder / OPTIMIZED_ASSETS_FOLDER_NAME
+                ),
+                log_function=log_function,
+            )
+            resource_folder = optimized_qrc_folder
+        if compression_tuning != "off":
+            tuned_qrc_folder = Path(temp_dir) / "tuned_qrc"
+            resource_paths = tune_resource_compression(
+                resource_paths,
+                resource_folder,
+                tuned_qrc_folder,
+                mode=compression_tuning,
+                record_file=(
+                    None if cache is None else cache.cache_folder / COMPRESSION_RECORD_FILE_NAME
+                ),
+                log_function=log_function,
+            )
+            resource_folder = tuned_qrc_folder
+        duplicates = []
+        if deduplication != "off":
+            duplicates = find_duplicate_resources(qrc_file for qrc_file, _ in resource_paths)
+            for duplicate in duplicates:
+                references = ", ".join(
+                    f"{qrc_file.relative_to(resource_folder).as_posix()}:{entry.resource_path}"
+                    for qrc_file, entry in duplicate.entries
+                )
+                log_function(f"Duplicate resource ({duplicate.size} bytes): {references}")
+        if (
+            deduplication == "share"
+            and len(duplicates) > 0
+            and rcc_kwargs.get("generator", "python") == "python"
+        ):
+            return build_shared_resources(
+                resource_paths,
+                duplicates,
+                generated_rc_code_folder,
+                rcc_kwargs=rcc_kwargs,
+                log_function=log_function,
+                cache=cache,
+                report_function=report_function,
+            )
+        return _compile_resources(
+            resource_paths,
+            generated_rc_code_folder,
+            rcc_kwargs=rcc_kwargs,
+            cache=cache,
+            fingerprint_headers=fingerprint_headers,
+            log_function=log_function,
+            report_function=report_function,
+        )
+
+
+def _compile_resources(
+    resource_paths: Sequence[tuple[Path, Path]],
+    generated_rc_code_folder: Path,
+    *,
+    rcc_kwargs: RccKwargs,
+    cache: BuildCache | None,
+    fingerprint_headers: bool,
+    log_function: Callable[..., None],
+    report_function: Callable[[BuildRecord], object] | None = None,
+) -> list[Path]:
+    """Compile each qrc file, skipping those whose fingerprint header is up to date.
+
+    Parameters
+    ----------
+    resource_paths : Sequence[tuple[Path, Path]]
+        Pairs of qrc files and the code files to generate from them.
+    generated_rc_code_folder : Path
+        Base path of the generated code, which logged paths are relative to.
+    rcc_kwargs : RccKwargs
+        Keyword arguments passed to :func:`.resources.compile_resource_file`.
+    cache : BuildCache | None
+        Build cache used to skip compiling unchanged shards or prefix modules.
+    fingerprint_headers : bool
+        Whether or not to use fingerprint headers for qrc files compiled to a single file.
+    log_function : Callable[..., None]
+        Function used to print log messages.
+    report_function : Callable[[BuildRecord], object] | None
+        Function called with the :class:`BuildRecord` of each qrc file. Defaults to None
 
     Returns
     -------
     list[Path]
         List of generated files.
     """
+    generator = rcc_kwargs.get("generator", "python")
+    single_output = not rcc_kwargs.get("binary", False) and (
+        generator == "cpp"
+        or (not rcc_kwargs.get("lazy", False) and (rcc_kwargs.get("shards") or 1) <= 1)
+    )
     built_files = []
+    for resource_file, out_file in resource_paths:
+        start = time.perf_counter()
+        rel_out_path = out_file.relative_to(generated_rc_code_folder).as_posix()
+        fingerprint = ""
+        if fingerprint_headers is True and single_output is True:
+            fingerprint = hash_content(
+                generator,
+                resource_shard_fingerprint(
+                    read_qrc(resource_file), rcc_args=rcc_kwargs.get("rcc_args", ()), binary=False
+                ),
+            )
+            if read_output_fingerprint(out_file) == fingerprint:
+                log_function(f"Up to date: {rel_out_path}")
+                _report_output(
+                    report_function,
+                    out_file,
+                    "resource",
+                    "up-to-date",
+                    time.perf_counter() - start,
+                )
+                built_files.append(out_file)
+                continue
+        log_function(f"Creating: {rel_out_path}")
+        built_file = compile_resource_file(resource_file, out_file, cache=cache, **rcc_kwargs)
+        if fingerprint != "":
+            write_output_fingerprint(built_file, fingerprint)
+        _report_output(
+            report_function, built_file, "resource", "built", time.perf_counter() - start
+        )
+        built_files.append(built_file)
+    return built_files
+
+
+def optimize_resource_assets(
+    resource_paths: Sequence[tuple[Path, Path]],
+    resource_folder: Path,
+    optimized_qrc_folder: Path,
+    *,
+    asset_cache_folder: Path,
+    log_function: Callable[..., None] = rich.print,
+) -> list[tuple[Path, Path]]:
+    """Write qrc files referencing optimized versions of the assets of the original qrc files.
+
+    Assets are only optimized if their content is not in ``asset_cache_folder`` yet,
+    optimized assets which are no longer referenced are removed from it.
+
+    Parameters
+    ----------
+    resource_paths : Sequence[tuple[Path, Path]]
+        Pairs of qrc file and generated module paths (see :func:`resource_output_paths`).
+    resource_folder : Path
+        Base path containing the input qrc files.
+    optimized_qrc_folder : Path
+        Folder to write the qrc files to, keeping their path relative to ``resource_folder``.
+    asset_cache_folder : Path
+        Folder to save optimized assets to.
+    log_function : Callable[..., None]
+        Function used to print log messages. Defaults to rich.print
+
+    Returns
+    -------
+    list[tuple[Path, Path]]
+        Pairs of optimized qrc file and generated module paths.
+    """
+    optimizer = AssetOptimizer(asset_cache_folder)
+    optimized_resource_paths = [
+        (
+            optimizer.optimize_qrc(
+                resource_file, optimized_qrc_folder / resource_file.relative_to(resource_folder)
+            ),
+            out_file,
+        )
+        for resource_file, out_file in resource_paths
+    ]
+    optimizer.clear_unused()
+    for result in optimizer.results.values():
+        if result.cached is False and result.saved_size > 0:
+            log_function(
+                f"Optimized: {result.source.name} saved {result.saved_size} bytes "
+                f"({result.saved_size / result.original_size:.0%})"
+            )
+    saved_size = sum(max(result.saved_size, 0) for result in optimizer.results.values())
+    log_function(f"Asset optimization saved {saved_size} bytes in {len(optimizer.results)} files")
+    return optimized_resource_paths
+
+
+def tune_resource_compression(
+    resource_paths: Sequence[tuple[Path, Path]],
+    resource_folder: Path,
+    tuned_qrc_folder: Path,
+    *,
+    mode: Literal["file", "qrc"] = "file",
+    record_file: Path | None = None,
+    log_function: Callable[..., None] = rich.print,
+) -> list[tuple[Path, Path]]:
+    """Write qrc files with the rcc compression chosen by sampling the referenced files.
+
+    The compression is set by attributes of the file entries, which take precedence over
+    the compression arguments in ``rcc_args`` (see :mod:`.rcc_compression`).
+
+    Parameters
+    ----------
+    resource_paths : Sequence[tuple[Path, Path]]
+        Pairs of qrc file and generated module paths (see :func:`resource_output_paths`).
+    resource_folder : Path
+        Base path containing the input qrc files.
+    tuned_qrc_folder : Path
+        Folder to write the qrc files to, keeping their path relative to ``resource_folder``.
+    mode : Literal["file", "qrc"]
+        Whether to choose the compression for each file or for all files of a qrc file.
+        Defaults to "file"
+    record_file : Path | None
+        JSON file recording the choices, so they stay stable between builds.
+        Defaults to None
+    log_function : Callable[..., None]
+        Function used to print log messages. Defaults to rich.print
+
+    Returns
+    -------
+    list[tuple[Path, Path]]
+        Pairs of tuned qrc file and generated module paths.
+    """
+    tuner = CompressionTuner(record_file, mode=mode)
+    tuned_resource_paths = []
+    for resource_file, out_file in resource_paths:
+        rel_qrc_file = resource_file.relative_to(resource_folder)
+        tuned_entries = tuner.tune_qrc(resource_file, tuned_qrc_folder / rel_qrc_file)
+        if mode == "qrc":
+            tuned_entries = tuned_entries[:1]
+        for tuned in tuned_entries:
+            if tuned.recorded is False:
+                name = rel_qrc_file.as_posix()
+                if mode == "file":
+                    name += f":{tuned.entry.resource_path}"
+                log_function(f"Compression: {name} {tuned.choice}")
+        tuned_resource_paths.append((tuned_qrc_folder / rel_qrc_file, out_file))
+    tuner.save()
+    return tuned_resource_paths
+
+
+def build_shared_resources(
+    resource_paths: Sequence[tuple[Path, Path]],
+    duplicates: Sequence[DuplicateResource],
+    generated_rc_code_folder: Path,
+    *,
+    rcc_kwargs: RccKwargs | None = None,
+    log_function: Callable[..., None] = rich.print,
+    cache: BuildCache | None = None,
+    report_function: Callable[[BuildRecord], object] | None = None,
+) -> list[Path]:
+    """Compile qrc files embedding files referenced by multiple qrc files only once.
+
+    All entries of ``duplicates`` are compiled to the python module
+    ``shared_resources_rc.py`` in ``generated_rc_code_folder``, where 'rcc' embeds
+    identical content only once. They are removed from the other resource modules,
+    which import the shared module instead, so all resource paths stay valid.
+
+    Parameters
+    ----------
+    resource_paths : Sequence[tuple[Path, Path]]
+        Pairs of qrc file and generated module paths (see :func:`resource_output_paths`).
+    duplicates : Sequence[DuplicateResource]
+        Duplicates found in the qrc files (see :func:`.qrc.find_duplicate_resources`).
+    generated_rc_code_folder : Path
+        Base path to save generated code from qrc files to.
+    rcc_kwargs : RccKwargs | None
+        Keyword arguments passed to the rcc executable. Defaults to None
+    log_function : Callable[..., None]
+        Function used to print log messages. Defaults to rich.print
+    cache : BuildCache | None
+        Build cache passed to :func:`.resources.compile_resource_file`. Defaults to None
+    report_function : Callable[[BuildRecord], object] | None
+        Function called with a :class:`BuildRecord` as soon as each module is
+        written. Defaults to None
+
+    Returns
+    -------
+    list[Path]
+        List of generated files, starting with the shared module.
+    """
     if rcc_kwargs is None:
         rcc_kwargs = {}
-    for resource_file in find_matching_files(
-        [resource_folder], "*.qrc", recurse_folder=recurse_folder
-    ):
-        rel_out_path = format_rel_output_path(
-            resource_folder,
-            Path(resource_file),
-            "{file_stem}_rc.py",
-            flatten_path=flatten_path,
+    shared_entries: dict[tuple[str, str, str | None], QrcEntry] = {}
+    duplicate_keys = set()
+    for duplicate in duplicates:
+        for qrc_file, entry in duplicate.entries:
+            duplicate_keys.add((qrc_file, entry.prefix, entry.alias, entry.lang))
+            shared_entries.setdefault((entry.prefix, entry.alias, entry.lang), entry)
+
+    shared_module = generated_rc_code_folder / f"{SHARED_RESOURCE_MODULE_STEM}.py"
+    built_files = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        start = time.perf_counter()
+        log_function(f"Creating: {shared_module.name}")
+        built_file = compile_resource_file(
+            write_qrc(shared_entries.values(), Path(temp_dir) / "shared_resources.qrc"),
+            shared_module,
+            rcc_args=rcc_kwargs.get("rcc_args", ()),
+            binary=rcc_kwargs.get("binary", False),
+        )
+        _report_output(
+            report_function, built_file, "resource", "built", time.perf_counter() - start
         )
-        if rcc_kwargs.get("generator", "python") == "cpp":
-            rel_out_path = rel_out_path.with_suffix(".h")
-        out_file = generated_rc_code_folder / rel_out_path
-        log_function(f"Creating: {rel_out_path.as_posix()}")
-        built_file = compile_resource_file(resource_file, out_file, **rcc_kwargs)
         built_files.append(built_file)
+        for index, (resource_file, out_file) in enumerate(resource_paths):
+            start = time.perf_counter()
+            log_function(f"Creating: {out_file.relative_to(generated_rc_code_folder).as_posix()}")
+            entries = read_qrc(resource_file)
+            unique_entries = [
+                entry
+                for entry in entries
+                if (resource_file, entry.prefix, entry.alias, entry.lang) not in duplicate_keys
+            ]
+            if len(unique_entries) == len(entries):
+                built_file = compile_resource_file(
+                    resource_file, out_file, cache=cache, **rcc_kwargs
+                )
+                _report_output(
+                    report_function, built_file, "resource", "built", time.perf_counter() - start
+                )
+                built_files.append(built_file)
+                continue
+            if len(unique_entries) > 0:
+                compile_resource_file(
+                    write_qrc(unique_entries, Path(temp_dir) / str(index) / resource_file.name),
+                    out_file,
+                    cache=cache,
+                    **rcc_kwargs,
+                )
+                module_code = out_file.read_text(encoding="utf8")
+            else:
+                out_file.parent.mkdir(parents=True, exist_ok=True)
+                module_code = (
+                    f'"""Resources of {resource_file.name!r} generated by qt-dev-helper."""\n'
+                )
+            depth = len(out_file.relative_to(generated_rc_code_folder).parent.parts)
+            out_file.write_text(
+                module_code
+                + SHARED_RESOURCE_IMPORT_TEMPLATE.format(
+                    relative_name="." * (depth + 1) + SHARED_RESOURCE_MODULE_STEM,
+                    module_name=SHARED_RESOURCE_MODULE_STEM,
+                ),
+                encoding="utf8",
+            )
+            _report_output(
+                report_function, out_file, "resource", "built", time.perf_counter() - start
+            )
+            built_files.append(out_file)
     return built_files
 
 
+def generated_python_modules(
+    ui_files: Iterable[Path], resource_files: Iterable[Path]
+) -> list[Path]:
+    """Python modules generated by :func:`build_uis` and :func:`build_resources`.
+
+    Modules generated alongside a resource module (e.g. shards or prefix modules)
+    are named after it, so they are found next to it. Other modules in the
+    generated code folders (e.g. hand-written modules of a package) are not included.
+
+    Parameters
+    ----------
+    ui_files : Iterable[Path]
+        Files returned by :func:`build_uis`.
+    resource_files : Iterable[Path]
+        Files returned by :func:`build_resources`.
+
+    Returns
+    -------
+    list[Path]
+        Sorted unique paths of the generated python modules.
+    """
+    resource_files = [Path(resource_file) for resource_file in resource_files]
+    module_files = {Path(path).resolve() for path in [*ui_files, *resource_files]}
+    for resource_file in resource_files:
+        module_files.update(
+            module_file.resolve()
+            for module_file in resource_file.parent.glob(f"{resource_file.stem}_*.py")
+        )
+    return sorted(module_file for module_file in module_files if module_file.suffix == ".py")
+
+
+def asset_dependencies(
+    config: Config,
+    *,
+    recurse_folder: bool = True,
+    index: UiIndex | None = None,
+) -> dict[Path, list[Path]]:
+    """Find the input files each file generated by :func:`build_all_assets` depends on.
+
+    Stylesheets depend on their scss entry point and all imported partials, code
+    generated from qrc files on the qrc file and all files it references and code
+    generated from ui files on the ui file and its dependencies (see
+    :func:`ui_dependency_edges`).
+
+    Parameters
+    ----------
+    config : Config
+        Configuration defining the assets.
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+    index : UiIndex | None
+        Index providing the metadata of the ui files. Defaults to None
+
+    Returns
+    -------
+    dict[Path, list[Path]]
+        Input files of each generated file.
+    """
+    dependencies: dict[Path, list[Path]] = {}
+    try:
+        style_paths = config.style_paths()
+    except QtDevHelperConfigError:
+        style_paths = []
+    partials_cache: dict[str, str] = {}
+    for sass_file, qss_file, _ in expand_style_variants(
+        style_paths, config.style_variants, variant_file_name=config.style_variant_file_name
+    ):
+        partials = collect_sass_partials(
+            sass_file, partials_cache, conformer=config.sass_conformer.value
+        )
+        dependencies[qss_file] = [sass_file, *(Path(partial) for partial in partials)]
+    try:
+        resource_paths = resource_output_paths(
+            *config.rc_folder_paths(),
+            flatten_path=config.flatten_folder_structure,
+            generator=config.generator.value,
+            recurse_folder=recurse_folder,
+            collision_policy=config.output_collision_policy.value,
+        )
+    except QtDevHelperConfigError:
+        resource_paths = []
+    for qrc_file, out_file in resource_paths:
+        rcc_file = out_file.with_suffix(".rcc")
+        binary_output = config.rcc_binary is True and config.generator.value == "cpp"
+        dependencies[rcc_file if binary_output else out_file] = [
+            qrc_file,
+            *(entry.file for entry in read_qrc(qrc_file)),
+        ]
+    try:
+        ui_modules = ui_output_paths(
+            *config.ui_folder_paths(),
+            flatten_path=config.flatten_folder_structure,
+            generator=config.generator.value,
+            recurse_folder=recurse_folder,
+            collision_policy=config.output_collision_policy.value,
+        )
+    except QtDevHelperConfigError:
+        return dependencies
+    edges = ui_dependency_edges(ui_modules, resource_paths, index or UiIndex())
+    for ui_file, out_file in ui_modules:
+        dependencies[out_file] = [ui_file, *edges[out_file]]
+    return dependencies
+
+
+def write_asset_depfiles(
+    config: Config,
+    *,
+    recurse_folder: bool = True,
+    index: UiIndex | None = None,
+    log_function: Callable[..., None] = rich.print,
+) -> list[Path]:
+    """Write a Makefile style depfile for each file generated by :func:`build_all_assets`.
+
+    Paths in the depfiles are relative to the base path of ``config``.
+
+    Parameters
+    ----------
+    config : Config
+        Configuration defining the assets and the depfile folder.
+    recurse_folder : bool
+        Whether or not to recurse directories searching for files. Defaults to True
+    index : UiIndex | None
+        Index providing the metadata of the ui files. Defaults to None
+    log_function : Callable[..., None]
+        Function used to print log messages. Defaults to rich.print
+
+    Returns
+    -------
+    list[Path]
+        Depfiles which were written, since their content changed.
+
+    See Also
+    --------
+    asset_dependencies
+    .depfile.write_depfile
+    """
+    written_files = []
+    for out_file, dependencies in asset_dependencies(
+        config, recurse_folder=recurse_folder, index=index
+    ).items():
+        depfile = write_depfile(
+            out_file,
+            dependencies,
+            depfile_folder=config.depfile_folder_path(),
+            base_path=config.base_path,
+        )
+        if depfile is not None:
+            rel_depfile = Path(os.path.relpath(depfile, config.base_path))
+            log_function(f"Creating: {rel_depfile.as_posix()}")
+            written_files.append(depfile)
+    return written_files
+
+
 def build_all_assets(
     config: Config | str | Path,
     log_function: Callable[..., None] = rich.print,
     *,
     recurse_folder: bool = True,
+    report_function: Callable[[BuildRecord], object] | None = None,
 ) -> list[Path]:
     """Build all assets based on the provided configuration.
 
@@ -257,6 +2083,9 @@ def build_all_assets(
         Function used to print log messages. Defaults to rich.print
     recurse_folder : bool
         Whether or not to recurse directories searching for files. Defaults to True
+    report_function : Callable[[BuildRecord], object] | None
+        Function called with a :class:`BuildRecord` as soon as each stylesheet, resource
+        module and form is built or found up to date. Defaults to None
 
     Returns
     -------
@@ -269,32 +2098,91 @@ def build_all_assets(
     """
     if not isinstance(config, Config):
         config = load_config(config)
+    cache_path = config.cache_path()
+    cache = (
+        BuildCache(cache_path, store_outputs=config.profile is not None)
+        if cache_path is not None
+        else None
+    )
+    ui_index = UiIndex(cache_path / UI_INDEX_FILE_NAME if cache_path is not None else None)
     built_files = []
     try:
-        sass_file, qss_file = config.root_style_paths()
-        log_function(f"Creating: {qss_file.relative_to(config.base_path).as_posix()}")
-        built_files += [transpile_sass(sass_file, qss_file)]
+        built_files += transpile_sass_files(
+            config.style_paths(),
+            variants=config.style_variants,
+            variant_file_name=config.style_variant_file_name,
+            conformer=config.sass_conformer.value,
+            minify=config.qss_minify,
+            output_style=config.sass_output_style.value,
+            cache=cache,
+            fingerprint_headers=config.output_fingerprints,
+            log_function=log_function,
+            base_path=config.base_path,
+            report_function=report_function,
+        )
     except QtDevHelperConfigError:
         log_function("No style files to compile fund in config!")
+    # Resources are built first, since forms including them depend on their generated code
+    resource_paths: list[tuple[Path, Path]] = []
+    resource_files: list[Path] = []
     try:
-        built_files += build_uis(
-            *config.ui_folder_paths(),
+        resource_paths = resource_output_paths(
+            *config.rc_folder_paths(),
             flatten_path=config.flatten_folder_structure,
-            uic_kwargs=config.uic_kwargs(),
-            log_function=log_function,
+            generator=config.generator.value,
             recurse_folder=recurse_folder,
+            collision_policy=config.output_collision_policy.value,
         )
-    except QtDevHelperConfigError:
-        log_function("No ui folders fund in config!")
-    try:
-        built_files += build_resources(
+        resource_files = build_resources(
             *config.rc_folder_paths(),
             flatten_path=config.flatten_folder_structure,
             rcc_kwargs=config.rcc_kwargs(),
+            cache=cache,
+            deduplication=config.rcc_deduplication.value,
+            optimize_assets=config.optimize_assets,
+            compression_tuning=config.rcc_compression_tuning.value,
+            fingerprint_headers=config.output_fingerprints,
             log_function=log_function,
             recurse_folder=recurse_folder,
+            collision_policy=config.output_collision_policy.value,
+            report_function=report_function,
         )
+        built_files += resource_files
     except QtDevHelperConfigError:
         log_function("No resource folders fund in config!")
+    ui_files: list[Path] = []
+    try:
+        ui_files = build_uis(
+            *config.ui_folder_paths(),
+            flatten_path=config.flatten_folder_structure,
+            uic_kwargs=config.uic_kwargs(),
+            log_function=log_function,
+            recurse_folder=recurse_folder,
+            collision_policy=config.output_collision_policy.value,
+            registry=config.ui_registry,
+            index=ui_index,
+            resource_paths=resource_paths,
+            cache=cache,
+            fingerprint_headers=config.output_fingerprints,
+            report_function=report_function,
+        )
+        built_files += ui_files
+    except QtDevHelperConfigError:
+        log_function("No ui folders fund in config!")
+    if config.compile_bytecode is True and config.generator.value == "python":
+        compile_bytecode(
+            generated_python_modules(ui_files, resource_files),
+            invalidation_mode=config.bytecode_invalidation_mode.value,
+            log_function=log_function,
+            base_path=config.base_path,
+        )
+    if config.depfiles is True:
+        write_asset_depfiles(
+            config, recurse_folder=recurse_folder, index=ui_index, log_function=log_function
+        )
+
+    if cache is not None:
+        cache.save()
+    ui_index.save()
 
     return built_files
@@ -0,0 +1,305 @@
+"""Module to read information from Qt Designer (ui) files without compiling them."""
+
+from __future__ import annotations
+
+import io
+import json
+import xml.etree.ElementTree as ET
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from qt_dev_helper.cache import hash_content
+
+FORM_CLASS_PREFIX = "Ui_"
+UI_INDEX_FILE_NAME = "ui_index.json"
+# Increase when the content of UiMetadata changes, to invalidate existing indexes
+UI_INDEX_VERSION = "1"
+
+
+@dataclass
+class CustomWidget:
+    """Custom (promoted) widget used by a form."""
+
+    class_name: str
+    extends: str | None = None
+    header: str | None = None
+    global_include: bool = False
+
+
+@dataclass
+class UiMetadata:
+    """Information from a ui file, which other build stages depend on."""
+
+    form_class: str | None = None
+    custom_widgets: list[CustomWidget] = field(default_factory=list)
+    resources: list[str] = field(default_factory=list)
+    translatable_strings: list[str] = field(default_factory=list)
+
+    def resource_files(self, ui_file: str | Path) -> list[Path]:
+        """Resolve the qrc files included by the form.
+
+        Parameters
+        ----------
+        ui_file : str | Path
+            Path to the ui file the metadata were read from.
+
+        Returns
+        -------
+        list[Path]
+            Paths to the included qrc files, relative to the folder of ``ui_file``.
+        """
+        return [Path(ui_file).parent / location for location in self.resources]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UiMetadata:
+        """Create metadata from their dict representation (see ``dataclasses.asdict``).
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Metadata as stored in the index file.
+
+        Returns
+        -------
+        UiMetadata
+            Metadata instance.
+        """
+        return cls(
+            form_class=data.get("form_class"),
+            custom_widgets=[CustomWidget(**widget) for widget in data.get("custom_widgets", [])],
+            resources=list(data.get("resources", [])),
+            translatable_strings=list(data.get("translatable_strings", [])),
+        )
+
+
+def _form_class_name(class_name: str) -> str:
+    """Name of the generated form class for the class name defined in a ui file.
+
+    Parameters
+    ----------
+    class_name : str
+        Class name as defined in the ui file, which might contain C++ namespaces.
+
+    Returns
+    -------
+    str
+        Name of the generated class (e.g. 'ns::MainWindow' => 'Ui_MainWindow').
+    """
+    return f"{FORM_CLASS_PREFIX}{class_name.strip().rpartition('::')[2]}"
+
+
+def read_form_class(ui_file: str | Path) -> str | None:
+    """Read the name of the form class 'uic' generates from a ui file.
+
+    Parsing stops as soon as the class name is found, so the rest of the
+    (potentially large) form is not read.
+
+    Parameters
+    ----------
+    ui_file : str | Path
+        Path to the ui file.
+
+    Returns
+    -------
+    str | None
+        Name of the generated class (e.g. 'Ui_MainWindow') or None if the
+        file is no valid ui file.
+    """
+    depth = 0
+    try:
+        for event, element in ET.iterparse(Path(ui_file), events=("start", "end")):
+            if event == "start":
+                depth += 1
+                # The top level widget defines the name if there is no class element
+                if depth == 2 and element.tag == "widget" and element.get("name"):
+                    return _form_class_name(element.get("name", ""))
+                continue
+            depth -= 1
+            if depth == 1 and element.tag == "class" and (element.text or "").strip():
+                return _form_class_name(element.text or "")
+    except ET.ParseError:
+        return None
+    return None
+
+
+def _element_text(element: ET.Element | None) -> str | None:
+    """Get the stripped text of an element.
+
+    Parameters
+    ----------
+    element : ET.Element | None
+        Element to get the text of.
+
+    Returns
+    -------
+    str | None
+        Text of the element or None if it does not exist or is empty.
+    """
+    if element is None:
+        return None
+    return (element.text or "").strip() or None
+
+
+def _read_custom_widget(element: ET.Element) -> CustomWidget:
+    """Read a ``customwidget`` element.
+
+    Parameters
+    ----------
+    element : ET.Element
+        Element defining the custom widget.
+
+    Returns
+    -------
+    CustomWidget
+        Class, base class and header of the custom widget.
+    """
+    header = element.find("header")
+    return CustomWidget(
+        class_name=_element_text(element.find("class")) or "",
+        extends=_element_text(element.find("extends")),
+        header=_element_text(header),
+        global_include=header is not None and header.get("location") == "global",
+    )
+
+
+def parse_ui_metadata(content: bytes) -> UiMetadata:
+    """Collect the metadata of a ui file in a single streamed pass.
+
+    Elements are discarded as soon as they are processed, so memory usage does
+    not grow with the size of the form.
+
+    Parameters
+    ----------
+    content : bytes
+        Content of the ui file.
+
+    Returns
+    -------
+    UiMetadata
+        Metadata of the form, empty if ``content`` is no valid XML.
+    """
+    metadata = UiMetadata()
+    # Top level class name and name of the top level widget, which is used if no class is set
+    form_names: dict[str, str | None] = {}
+    translatable_strings: dict[str, None] = {}
+    parents: list[ET.Element] = []
+    try:
+        for event, element in ET.iterparse(io.BytesIO(content), events=("start", "end")):
+            if event == "start":
+                if len(parents) == 1 and element.tag == "widget":
+                    form_names.setdefault("widget", element.get("name"))
+                parents.append(element)
+                continue
+            parents.pop()
+            if len(parents) == 1 and element.tag == "class":
+                form_names.setdefault("class", _element_text(element))
+            elif element.tag == "customwidget":
+                metadata.custom_widgets.append(_read_custom_widget(element))
+            elif element.tag == "include" and parents[-1:] and parents[-1].tag == "resources":
+                metadata.resources.append(element.get("location", ""))
+            elif element.tag == "string" and element.get("notr") != "true":
+                translatable_strings[element.text or ""] = None
+            # Children of custom widgets are read when the custom widget ends
+            if len(parents) > 0 and all(parent.tag != "customwidget" for parent in parents):
+                element.clear()
+                parents[-1].remove(element)
+    except ET.ParseError:
+        return UiMetadata()
+    form_name = form_names.get("class") or form_names.get("widget")
+    metadata.form_class = None if form_name is None else _form_class_name(form_name)
+    metadata.resources = [location for location in metadata.resources if location]
+    metadata.translatable_strings = [text for text in translatable_strings if text.strip()]
+    return metadata
+
+
+def read_ui_metadata(ui_file: str | Path) -> UiMetadata:
+    """Collect the metadata of a ui file (see :func:`parse_ui_metadata`).
+
+    Parameters
+    ----------
+    ui_file : str | Path
+        Path to the ui file.
+
+    Returns
+    -------
+    UiMetadata
+        Metadata of the form.
+    """
+    return parse_ui_metadata(Path(ui_file).read_bytes())
+
+
+class UiIndex:
+    """Persistent index of the metadata of ui files, which are only parsed if they changed.
+
+    Parameters
+    ----------
+    index_file : Path | None
+        JSON file storing the metadata with the content hash of each ui file.
+        Defaults to None which means the index is only kept in memory.
+    """
+
+    def __init__(self, index_file: Path | None = None) -> None:
+        self.index_file = None if index_file is None else Path(index_file)
+        self._records: dict[str, dict[str, Any]] = {}
+        if self.index_file is not None and self.index_file.is_file():
+            try:
+                self._records = json.loads(self.index_file.read_text(encoding="utf8"))
+            except json.JSONDecodeError:
+                self._records = {}
+
+    @staticmethod
+    def _key(ui_file: str | Path) -> str:
+        """Normalize ``ui_file`` to be used as key.
+
+        Parameters
+        ----------
+        ui_file : str | Path
+            Path to the ui file.
+
+        Returns
+        -------
+        str
+            Absolute posix path of ``ui_file``.
+        """
+        return Path(ui_file).resolve().as_posix()
+
+    def get(self, ui_file: str | Path) -> UiMetadata:
+        """Metadata of ``ui_file``, which is parsed if its content changed since indexing.
+
+        Parameters
+        ----------
+        ui_file : str | Path
+            Path to the ui file.
+
+        Returns
+        -------
+        UiMetadata
+            Metadata of the form.
+        """
+        content = Path(ui_file).read_bytes()
+        content_hash = hash_content(UI_INDEX_VERSION, content)
+        record = self._records.get(self._key(ui_file))
+        if record is None or record.get("hash") != content_hash:
+            record = {"hash": content_hash, "metadata": asdict(parse_ui_metadata(content))}
+            self._records[self._key(ui_file)] = record
+        return UiMetadata.from_dict(record["metadata"])
+
+    def save(self) -> None:
+        """Save the index to :attr:`index_file`, dropping records of removed ui files."""
+        if self.index_file is None:
+            return
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        self.index_file.write_text(
+            json.dumps(
+                {
+                    key: record
+                    for key, record in sorted(self._records.items())
+                    if Path(key).is_file()
+                },
+                indent=2,
+            ),
+            encoding="utf8",
+        )
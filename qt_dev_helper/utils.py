@@ -56,7 +56,7 @@ def find_matching_files(
     Returns
     -------
     tuple[str, ...]
-        Tuple of posix conform string paths to files matching ``file_pattern``.
+        Sorted tuple of posix conform string paths to files matching ``file_pattern``.
     """
     file_paths = set()
     for path in files:
@@ -67,4 +67,4 @@ def find_matching_files(
                 file_paths.add(file.as_posix())
         if path.is_file() and fnmatch(path.as_posix(), file_pattern) is not False:
             file_paths.add(path.as_posix())
-    return tuple(file_paths)
+    return tuple(sorted(file_paths))
@@ -0,0 +1,99 @@
+"""Tests for qt_dev_helper.cli.commands.bench."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from typer.testing import CliRunner
+
+from qt_dev_helper.cli.main_app import app
+from qt_dev_helper.transpiler import build_all_assets
+
+if TYPE_CHECKING:
+    from qt_dev_helper.config import Config
+
+
+def test_bench_qss(qapp, dummy_config: Config):
+    """Timings and the most expensive selectors are reported."""
+    dummy_config.uic_args = []
+    build_all_assets(dummy_config, log_function=lambda *_: None)
+    runner = CliRunner()
+
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            "qss",
+            dummy_config.base_path.as_posix(),
+            "--config",
+            dummy_config.base_path.as_posix(),
+            "--repeat",
+            "1",
+            "--top",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "Widgets:" in result.stdout
+    assert "Parse time:" in result.stdout
+    assert "Polish time:" in result.stdout
+    assert "Most expensive selectors" in result.stdout
+
+
+def test_bench_ui(qapp, dummy_config: Config):
+    """Results are written as JSON and compared to a baseline."""
+    dummy_config.uic_args = []
+    build_all_assets(dummy_config, log_function=lambda *_: None)
+    output = dummy_config.base_path / "bench/ui.json"
+    runner = CliRunner()
+    args = [
+        "bench",
+        "ui",
+        dummy_config.base_path.as_posix(),
+        "--config",
+        dummy_config.base_path.as_posix(),
+        "--repeat",
+        "1",
+        "--output",
+        output.as_posix(),
+    ]
+
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0, result.stdout
+    assert "minimal.ui" in result.stdout
+    assert "minimal.ui" in json.loads(output.read_text())["forms"]
+
+    result = runner.invoke(app, [*args, "--baseline", output.as_posix()])
+
+    assert result.exit_code == 0, result.stdout
+    assert "%)" in result.stdout
+
+
+def test_bench_resources(qapp, dummy_config: Config):
+    """Import cost of each resource module is reported."""
+    dummy_config.uic_args = []
+    build_all_assets(dummy_config, log_function=lambda *_: None)
+    output = dummy_config.base_path / "bench/resources.json"
+    runner = CliRunner()
+
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            "resources",
+            dummy_config.base_path.as_posix(),
+            "--config",
+            dummy_config.base_path.as_posix(),
+            "--repeat",
+            "1",
+            "--output",
+            output.as_posix(),
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "Resource module import cost" in result.stdout
+    assert "test_resource.qrc" in json.loads(output.read_text())["resources"]
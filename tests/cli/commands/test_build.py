@@ -100,3 +100,116 @@ def test_build_cli_no_config(monkeypatch: MonkeyPatch, tmp_path: Path, pass_base
         assert result.exit_code == 0, result.stdout
 
         assert call_kwargs["config"].base_path.samefile(expected_base_path)
+
+
+@pytest.mark.parametrize(
+    ("flag", "attr_name"),
+    [
+        ("--qss-minify", "qss_minify"),
+        ("--rcc-binary", "rcc_binary"),
+        ("--rcc-lazy", "rcc_lazy"),
+        ("--optimize-assets", "optimize_assets"),
+        ("--compile-bytecode", "compile_bytecode"),
+        ("--ui-registry", "ui_registry"),
+        ("--depfiles", "depfiles"),
+        ("--output-fingerprints", "output_fingerprints"),
+    ],
+)
+def test_build_cli_activate(
+    monkeypatch: MonkeyPatch, dummy_config: Config, flag: str, attr_name: str
+):
+    """Optional build features are activated."""
+    runner = CliRunner()
+    call_kwargs = {}
+
+    def mock_func(**kwargs):
+        call_kwargs.update(kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(build_cli_module, "build_all_assets", mock_func)
+        m.setattr(os, "curdir", (dummy_config.base_path / "assets").as_posix())
+        result = runner.invoke(app, ["build", flag])
+
+        assert result.exit_code == 0, result.stdout
+
+        assert getattr(call_kwargs["config"], attr_name) is True
+
+
+def test_build_cli_rcc_shards(monkeypatch: MonkeyPatch, dummy_config: Config):
+    """Resource sharding and compression tuning are configured."""
+    runner = CliRunner()
+    call_kwargs = {}
+
+    def mock_func(**kwargs):
+        call_kwargs.update(kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(build_cli_module, "build_all_assets", mock_func)
+        m.setattr(os, "curdir", (dummy_config.base_path / "assets").as_posix())
+        result = runner.invoke(
+            app,
+            [
+                "build",
+                "--rcc-shards",
+                "4",
+                "--rcc-shard-strategy",
+                "size",
+                "--rcc-compression-tuning",
+                "qrc",
+            ],
+        )
+
+        assert result.exit_code == 0, result.stdout
+
+        assert call_kwargs["config"].rcc_shards == 4
+        assert call_kwargs["config"].rcc_shard_strategy == "size"
+        assert call_kwargs["config"].rcc_compression_tuning == "qrc"
+
+
+def test_build_cli_profile(monkeypatch: MonkeyPatch, dummy_config: Config):
+    """Build profiles are applied before other options and unknown profiles are reported."""
+    runner = CliRunner()
+    call_kwargs = {}
+
+    def mock_func(**kwargs):
+        call_kwargs.update(kwargs)
+
+    pyproject_toml = dummy_config.base_path / "pyproject.toml"
+    pyproject_toml.write_text(
+        pyproject_toml.read_text()
+        + "\n[tool.qt-dev-helper.profiles.release]\nqss_minify = true\nrcc_args = ['-x']\n"
+    )
+
+    with monkeypatch.context() as m:
+        m.setattr(build_cli_module, "build_all_assets", mock_func)
+        m.setattr(os, "curdir", (dummy_config.base_path / "assets").as_posix())
+        result = runner.invoke(app, ["build", "--profile", "release", "--rcc-args", "-y"])
+
+        assert result.exit_code == 0, result.stdout
+
+        assert call_kwargs["config"].profile == "release"
+        assert call_kwargs["config"].qss_minify is True
+        assert call_kwargs["config"].rcc_args == ["-y"]
+
+        result = runner.invoke(app, ["build", "--profile", "unknown"])
+
+        assert result.exit_code == 2
+
+
+def test_build_cli_depfile_folder(monkeypatch: MonkeyPatch, dummy_config: Config):
+    """Depfiles are written to the given folder."""
+    runner = CliRunner()
+    call_kwargs = {}
+
+    def mock_func(**kwargs):
+        call_kwargs.update(kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(build_cli_module, "build_all_assets", mock_func)
+        m.setattr(os, "curdir", (dummy_config.base_path / "assets").as_posix())
+        result = runner.invoke(app, ["build", "--depfiles", "--depfile-folder", "deps"])
+
+        assert result.exit_code == 0, result.stdout
+
+        assert call_kwargs["config"].depfiles is True
+        assert call_kwargs["config"].depfile_folder_path() == dummy_config.base_path / "deps"
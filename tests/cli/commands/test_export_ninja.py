@@ -0,0 +1,46 @@
+"""Tests for qt_dev_helper.cli.commands.export_ninja."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from typer.testing import CliRunner
+
+import qt_dev_helper.cli.commands.export_ninja as export_ninja_cli_module
+from qt_dev_helper.cli.main_app import app
+from qt_dev_helper.config import QtDevHelperConfigError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+    from qt_dev_helper.config import Config
+
+
+def test_export_ninja(dummy_config: Config, tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Autodiscover config and write the Ninja file to the given path."""
+    monkeypatch.setattr(os, "curdir", (dummy_config.base_path / "assets").as_posix())
+    result = CliRunner().invoke(
+        app, ["export-ninja", "--output", str(tmp_path / "out.ninja"), "--recurse-folder"]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "Created:" in result.stdout
+    assert "rule uic" in (tmp_path / "out.ninja").read_text()
+
+
+def test_export_ninja_unsupported(dummy_config: Config, monkeypatch: MonkeyPatch):
+    """Unsupported options are reported as error."""
+
+    def mock_func(*_, **__):
+        msg = "The following options can't be exported to Ninja"
+        raise QtDevHelperConfigError(msg)
+
+    monkeypatch.setattr(export_ninja_cli_module, "export_ninja_file", mock_func)
+    monkeypatch.setattr(os, "curdir", (dummy_config.base_path / "assets").as_posix())
+    result = CliRunner().invoke(app, ["export-ninja"])
+
+    assert result.exit_code == 2
+    assert "can't be exported to Ninja" in result.output
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from typing import TYPE_CHECKING
 from typing import TypedDict
@@ -42,6 +43,14 @@ def dummy_config(tmp_path: Path):
     )
 
 
+@pytest.fixture(scope="session")
+def qapp():
+    """Qt application using the offscreen platform."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    qt_widgets = pytest.importorskip("PySide6.QtWidgets")
+    return qt_widgets.QApplication.instance() or qt_widgets.QApplication([])
+
+
 @pytest.fixture
 def nested_ui_folder(tmp_path: Path):
     """Nested folder structure with *.ui files."""
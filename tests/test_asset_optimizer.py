@@ -0,0 +1,129 @@
+"""Tests for ``qt_dev_helper.asset_optimizer``."""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import TYPE_CHECKING
+
+from qt_dev_helper.asset_optimizer import PNG_SIGNATURE
+from qt_dev_helper.asset_optimizer import AssetOptimizer
+from qt_dev_helper.asset_optimizer import minify_svg
+from qt_dev_helper.asset_optimizer import recompress_png
+from qt_dev_helper.qrc import read_qrc
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SVG = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!-- Created with Inkscape -->
+<svg xmlns="http://www.w3.org/2000/svg"
+     xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+     xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"
+     width="16" height="16" inkscape:version="1.2">
+  <metadata><rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"/></metadata>
+  <sodipodi:namedview id="view" pagecolor="#ffffff"/>
+  <g>
+    <circle cx="8" cy="8" r="4" inkscape:label="circle"/>
+    <text x="0" y="8"> keep  spaces </text>
+  </g>
+</svg>
+"""
+
+
+def _png_chunk(chunk_type: bytes, chunk_data: bytes) -> bytes:
+    """Create a PNG chunk for test images."""
+    checksum = zlib.crc32(chunk_type + chunk_data)
+    return (
+        struct.pack(">I", len(chunk_data)) + chunk_type + chunk_data + struct.pack(">I", checksum)
+    )
+
+
+def _uncompressed_png(raw_image_data: bytes) -> bytes:
+    """Create an 8x8 RGB PNG with uncompressed image data split into two IDAT chunks."""
+    compressed = zlib.compress(raw_image_data, 0)
+    return (
+        PNG_SIGNATURE
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", 8, 8, 8, 2, 0, 0, 0))
+        + _png_chunk(b"IDAT", compressed[:20])
+        + _png_chunk(b"IDAT", compressed[20:])
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+RAW_IMAGE_DATA = b"".join(b"\x00" + bytes([row * 10, 0, 255]) * 8 for row in range(8))
+
+
+def test_minify_svg():
+    """Comments, editor data and formatting whitespace are removed."""
+    result = minify_svg(SVG)
+
+    assert result == (
+        b'<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16">'
+        b'<g><circle cx="8" cy="8" r="4"/><text x="0" y="8"> keep  spaces </text></g></svg>'
+    )
+
+
+def test_minify_svg_unchanged():
+    """Invalid or already minimal files are returned unchanged."""
+    assert minify_svg(b"<svg") == b"<svg"
+    assert minify_svg(b"<svg/>") == b"<svg/>"
+
+
+def test_recompress_png():
+    """Image data are recompressed into a single IDAT chunk without changing pixels."""
+    png = _uncompressed_png(RAW_IMAGE_DATA)
+
+    result = recompress_png(png)
+
+    assert len(result) < len(png)
+    assert result.startswith(PNG_SIGNATURE)
+    assert result.count(b"IDAT") == 1
+    idat_start = result.index(b"IDAT") + 4
+    (idat_length,) = struct.unpack(">I", result[idat_start - 8 : idat_start - 4])
+    assert zlib.decompress(result[idat_start : idat_start + idat_length]) == RAW_IMAGE_DATA
+    assert result.endswith(_png_chunk(b"IEND", b""))
+
+
+def test_recompress_png_unchanged():
+    """Invalid or already optimal files are returned unchanged."""
+    assert recompress_png(b"GIF89a") == b"GIF89a"
+    optimal = recompress_png(_uncompressed_png(RAW_IMAGE_DATA))
+    assert recompress_png(optimal) == optimal
+
+
+def test_asset_optimizer(tmp_path: Path):
+    """Assets are optimized once per content and qrc files reference the optimized files."""
+    (tmp_path / "icon.svg").write_bytes(SVG)
+    (tmp_path / "same.svg").write_bytes(SVG)
+    (tmp_path / "text.txt").write_text("text")
+    (tmp_path / "icons.qrc").write_text(
+        '<RCC><qresource prefix="icons">'
+        '<file alias="a.svg">icon.svg</file><file>same.svg</file><file>text.txt</file>'
+        "</qresource></RCC>"
+    )
+    cache_folder = tmp_path / "cache"
+
+    optimizer = AssetOptimizer(cache_folder)
+    entries = read_qrc(optimizer.optimize_qrc(tmp_path / "icons.qrc", tmp_path / "out/icons.qrc"))
+
+    assert [entry.alias for entry in entries] == ["a.svg", "same.svg", "text.txt"]
+    assert entries[0].file.parent == cache_folder
+    assert entries[0].file == entries[1].file
+    assert entries[2].file == tmp_path / "text.txt"
+    result = optimizer.results[tmp_path / "icon.svg"]
+    assert result.cached is False
+    assert result.saved_size == len(SVG) - entries[0].file.stat().st_size
+
+    (cache_folder / "unused.svg").write_text("")
+    optimizer.clear_unused()
+
+    assert list(cache_folder.iterdir()) == [entries[0].file]
+
+    second_optimizer = AssetOptimizer(cache_folder)
+    second_result = second_optimizer.optimize_file(tmp_path / "icon.svg")
+
+    assert second_result is not None
+    assert second_result.cached is True
+    assert second_result.saved_size == result.saved_size
+    assert second_optimizer.optimize_file(tmp_path / "text.txt") is None
@@ -0,0 +1,214 @@
+"""Tests for ``qt_dev_helper.benchmark``."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+import qt_dev_helper.benchmark as benchmark_module
+from qt_dev_helper.benchmark import ResourceBenchmarkResult
+from qt_dev_helper.benchmark import benchmark_config_qss
+from qt_dev_helper.benchmark import benchmark_config_resources
+from qt_dev_helper.benchmark import benchmark_config_uis
+from qt_dev_helper.benchmark import benchmark_qss
+from qt_dev_helper.benchmark import benchmark_resource_module
+from qt_dev_helper.benchmark import compare_benchmark_reports
+from qt_dev_helper.benchmark import import_generated_module
+from qt_dev_helper.benchmark import load_ui_forms
+from qt_dev_helper.benchmark import resource_benchmark_report
+from qt_dev_helper.benchmark import ui_benchmark_report
+from qt_dev_helper.transpiler import build_all_assets
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+    from qt_dev_helper.config import Config
+
+
+@pytest.fixture
+def built_config(dummy_config: Config) -> Config:
+    """Config of a project with all assets built."""
+    dummy_config.uic_args = []
+    build_all_assets(dummy_config, log_function=lambda *_: None)
+    return dummy_config
+
+
+def test_import_generated_module(tmp_path: Path):
+    """Generated modules are imported with relative and absolute imports resolved."""
+    (tmp_path / "ui").mkdir()
+    (tmp_path / "rc").mkdir()
+    (tmp_path / "rc/foo_rc.py").write_text("VALUE = 1\n")
+    (tmp_path / "ui/Ui_relative.py").write_text("from . import foo_rc\n")
+    (tmp_path / "ui/Ui_absolute.py").write_text("import foo_rc\n")
+
+    relative = import_generated_module(
+        tmp_path / "ui/Ui_relative.py", [tmp_path / "ui", tmp_path / "rc"]
+    )
+    absolute = import_generated_module(
+        tmp_path / "ui/Ui_absolute.py", [tmp_path / "ui", tmp_path / "rc"]
+    )
+
+    assert relative.foo_rc.VALUE == 1
+    assert absolute.foo_rc.VALUE == 1
+
+    with pytest.raises(ValueError, match="is not inside of any of the search paths"):
+        import_generated_module(tmp_path / "rc/foo_rc.py", [tmp_path / "ui"])
+
+
+def test_load_ui_forms(qapp, built_config: Config):
+    """Forms are loaded with the class of their root widget."""
+    forms = load_ui_forms(built_config)
+
+    assert len(forms) == 1
+    assert forms[0].form_class.__name__ == "Ui_MainWindow"
+    assert forms[0].widget_class_name == "QMainWindow"
+    assert type(forms[0].create()).__name__ == "QMainWindow"
+
+
+def test_load_ui_forms_not_built(dummy_config: Config):
+    """Missing generated code is reported."""
+    with pytest.raises(FileNotFoundError, match="build the assets before running benchmarks"):
+        load_ui_forms(dummy_config)
+
+
+def test_benchmark_qss(qapp, built_config: Config):
+    """Timings and selector costs of all rules are measured."""
+    qapp.setStyleSheet("QWidget{color:red}")
+    forms = load_ui_forms(built_config)
+
+    result = benchmark_qss(
+        "QWidget { color: blue; }\nQMainWindow, QLabel { margin: 1px; }\n@media x {a{b:c}}",
+        forms,
+        repeat=1,
+    )
+
+    assert result.parse_time > 0
+    assert result.polish_time > 0
+    assert result.baseline_polish_time > 0
+    assert result.widget_count > 1
+    assert set(result.selector_costs) == {"QWidget", "QMainWindow,QLabel"}
+    assert len(result.most_expensive_selectors(1)) == 1
+    assert qapp.styleSheet() == "QWidget{color:red}"
+
+    qapp.setStyleSheet("")
+
+
+def test_benchmark_config_qss(qapp, built_config: Config):
+    """The root qss file of the config is benchmarked."""
+    result = benchmark_config_qss(built_config, repeat=1, selector_costs=False)
+
+    assert result.parse_time > 0
+    assert result.selector_costs == {}
+
+
+def test_benchmark_config_uis(qapp, built_config: Config):
+    """Import time, setupUi times and peak memory are measured for each form."""
+    results = benchmark_config_uis(built_config, repeat=2)
+
+    assert list(results) == ["minimal.ui"]
+    assert len(results["minimal.ui"].setup_ui_times) == 2
+    assert results["minimal.ui"].peak_memory > 0
+
+    report = ui_benchmark_report(results)
+
+    assert json.loads(json.dumps(report)) == report
+    assert set(report["forms"]["minimal.ui"]) == {
+        "import_time",
+        "setup_ui_min",
+        "setup_ui_mean",
+        "setup_ui_max",
+        "peak_memory",
+    }
+
+
+def test_compare_benchmark_reports():
+    """Relative changes are calculated for entries and metrics in both reports."""
+    report = {"forms": {"a.ui": {"time": 2.0, "memory": 5}, "b.ui": {"time": 1.0}}}
+    baseline = {"forms": {"a.ui": {"time": 1.0, "memory": 0}, "c.ui": {"time": 1.0}}}
+
+    assert compare_benchmark_reports(report, baseline) == {"a.ui": {"time": 1.0}}
+
+
+def test_benchmark_config_resources(qapp, built_config: Config):
+    """Sizes, import times and memory usage are measured for each resource module."""
+    results = benchmark_config_resources(built_config, repeat=1)
+
+    assert list(results) == ["test_resource.qrc"]
+    result = results["test_resource.qrc"]
+    assert result.source_size == (
+        (built_config.base_path / "outputs/ui_files/test_resource_rc.py").stat().st_size
+    )
+    assert result.pyc_size > 0
+    assert result.cold_import_time > 0
+    assert result.warm_import_time > 0
+
+    report = resource_benchmark_report(results)
+
+    assert json.loads(json.dumps(report)) == report
+    assert list(report["resources"]) == ["test_resource.qrc"]
+
+
+@pytest.mark.parametrize(
+    "rcc_options",
+    [
+        {"rcc_binary": True},
+        {"rcc_shards": 2},
+        {"rcc_lazy": True},
+        {"rcc_lazy": True, "rcc_binary": True},
+        {"rcc_deduplication": "share"},
+    ],
+)
+def test_benchmark_config_resources_modes(
+    qapp, dummy_config: Config, monkeypatch: MonkeyPatch, rcc_options: dict
+):
+    """Resource modules of all modes are executed with their imports and resources registered."""
+    qt_core = pytest.importorskip("PySide6.QtCore")
+    prefix = "benchmark_" + "_".join(f"{key}_{value}" for key, value in rcc_options.items())
+    (dummy_config.base_path / "assets/benchmark.qrc").write_text(
+        f'<RCC><qresource prefix="{prefix}"><file>icons/circle.svg</file></qresource></RCC>'
+    )
+    dummy_config.update(rcc_options)
+    dummy_config.deactivate_ui_build()
+    dummy_config.deactivate_style_build()
+    build_all_assets(dummy_config, log_function=lambda *_: None)
+    registered = []
+
+    def resident_memory() -> None:
+        registered.append(qt_core.QFile(f":/{prefix}/icons/circle.svg").exists())
+
+    monkeypatch.setattr(benchmark_module, "_resident_memory", resident_memory)
+    results = benchmark_config_resources(dummy_config, repeat=1)
+
+    assert sorted(results) == ["benchmark.qrc", "test_resource.qrc"]
+    assert True in registered
+    assert qt_core.QFile(f":/{prefix}/icons/circle.svg").exists() is False
+
+
+def test_benchmark_resource_module_cleanup(qapp, tmp_path: Path):
+    """Resources are unregistered after each execution and the memory includes the data."""
+    cleanup_log = tmp_path / "cleanup.log"
+    module_file = tmp_path / "large_rc.py"
+    module_file.write_text(
+        f"from pathlib import Path\n\nqt_resource_data = {b'x' * 10_000_000!r}\n\n\n"
+        "def qCleanupResources():\n"
+        f"    with Path({str(cleanup_log)!r}).open('a') as log:\n"
+        "        log.write('x')\n"
+    )
+
+    result = benchmark_resource_module(module_file, repeat=2)
+
+    assert cleanup_log.read_text() == "x" * 5
+    if result.resident_memory is not None:
+        assert result.resident_memory > 10_000_000
+
+
+def test_resource_benchmark_report_sorted():
+    """Resource modules with the slowest cold import come first."""
+    fast = ResourceBenchmarkResult(1, 1, 0.1, 0.01, None)
+    slow = ResourceBenchmarkResult(1, 1, 0.5, 0.01, None)
+
+    assert list(resource_benchmark_report({"a": fast, "b": slow})["resources"]) == ["b", "a"]
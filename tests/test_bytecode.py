@@ -0,0 +1,63 @@
+"""Tests for ``qt_dev_helper.bytecode``."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qt_dev_helper.bytecode import bytecode_up_to_date
+from qt_dev_helper.bytecode import compile_bytecode
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+
+
+@pytest.mark.parametrize("invalidation_mode", ["timestamp", "checked-hash", "unchecked-hash"])
+def test_compile_bytecode(tmp_path: Path, invalidation_mode: str):
+    """Only modules with outdated bytecode are compiled."""
+    module_files = [tmp_path / "Ui_form.py", tmp_path / "resources_rc.py"]
+    for module_file in module_files:
+        module_file.write_text(f"NAME = {module_file.stem!r}\n")
+
+    result = compile_bytecode(
+        module_files, invalidation_mode=invalidation_mode, log_function=lambda *_: None
+    )
+
+    assert result == [Path(importlib.util.cache_from_source(path)) for path in module_files]
+    assert all(
+        bytecode_up_to_date(module_file, invalidation_mode=invalidation_mode)
+        for module_file in module_files
+    )
+
+    module_files[0].write_text("NAME = 'changed and longer'\n")
+
+    assert compile_bytecode(
+        module_files, invalidation_mode=invalidation_mode, log_function=lambda *_: None
+    ) == [result[0]]
+
+
+def test_bytecode_up_to_date_invalidation_mode(tmp_path: Path):
+    """Bytecode compiled with a different invalidation mode is outdated."""
+    module_file = tmp_path / "module.py"
+    module_file.write_text("VALUE = 1\n")
+
+    assert bytecode_up_to_date(module_file) is False
+
+    compile_bytecode([module_file], invalidation_mode="unchecked-hash", log_function=print)
+
+    assert bytecode_up_to_date(module_file, invalidation_mode="unchecked-hash") is True
+    assert bytecode_up_to_date(module_file, invalidation_mode="checked-hash") is False
+    assert bytecode_up_to_date(module_file, invalidation_mode="timestamp") is False
+
+
+def test_compile_bytecode_log(tmp_path: Path, capsys: CaptureFixture):
+    """Compiled modules are logged relative to the base path."""
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out/module.py").write_text("VALUE = 1\n")
+
+    compile_bytecode([tmp_path / "out/module.py"], base_path=tmp_path)
+
+    assert capsys.readouterr().out == "Compiling bytecode: out/module.py\n"
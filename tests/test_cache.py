@@ -0,0 +1,122 @@
+"""Tests for ``qt_dev_helper.cache``."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qt_dev_helper.cache import BuildCache
+from qt_dev_helper.cache import hash_content
+from qt_dev_helper.cache import read_output_fingerprint
+from qt_dev_helper.cache import write_output_fingerprint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_hash_content():
+    """Fingerprints depend on content and its separation."""
+    assert hash_content("foo", b"bar") == hash_content(b"foo", "bar")
+    assert hash_content("foo", "bar") != hash_content("foobar")
+    assert hash_content("foo", "bar") != hash_content("bar", "foo")
+
+
+def test_build_cache(tmp_path: Path):
+    """Fingerprints are persisted and outputs need to exist to be up to date."""
+    output_file = tmp_path / "out.qss"
+    cache = BuildCache(tmp_path / "cache")
+    cache.update(output_file, "fingerprint")
+
+    assert cache.is_up_to_date(output_file, "fingerprint") is False
+
+    output_file.write_text("")
+
+    assert cache.is_up_to_date(output_file, "fingerprint") is True
+    assert cache.is_up_to_date(output_file, "other") is False
+
+    cache.save()
+
+    assert BuildCache(tmp_path / "cache").is_up_to_date(output_file, "fingerprint") is True
+
+    cache.cache_file.write_text("{invalid")
+
+    assert BuildCache(tmp_path / "cache").is_up_to_date(output_file, "fingerprint") is False
+
+
+def test_build_cache_changed_output(tmp_path: Path):
+    """Outputs whose content changed since the cache was saved are not up to date."""
+    output_file = tmp_path / "out.qss"
+    output_file.write_text("built")
+    cache = BuildCache(tmp_path / "cache")
+    cache.update(output_file, "fingerprint")
+    cache.save()
+
+    assert BuildCache(tmp_path / "cache").is_up_to_date(output_file, "fingerprint") is True
+
+    output_file.write_text("written by another build")
+
+    assert BuildCache(tmp_path / "cache").is_up_to_date(output_file, "fingerprint") is False
+
+    cache.cache_file.write_text(json.dumps({output_file.resolve().as_posix(): "fingerprint"}))
+
+    assert BuildCache(tmp_path / "cache").is_up_to_date(output_file, "fingerprint") is False
+
+
+def test_build_cache_store_outputs(tmp_path: Path):
+    """Stored outputs are restored if they were overwritten by a different build."""
+    output_file = tmp_path / "out.qss"
+    cache = BuildCache(tmp_path / "cache", store_outputs=True)
+    output_file.write_text("first")
+    cache.update(output_file, "first")
+    cache.save()
+
+    assert cache.is_up_to_date(output_file, "first") is True
+
+    output_file.write_text("other build")
+
+    assert cache.is_up_to_date(output_file, "first") is True
+    assert output_file.read_text() == "first"
+
+    output_file.write_text("second")
+    cache.update(output_file, "second")
+    cache.save()
+
+    assert len(list((tmp_path / "cache/outputs").iterdir())) == 1
+    assert BuildCache(tmp_path / "cache", store_outputs=True).is_up_to_date(output_file, "second")
+    assert cache.is_up_to_date(output_file, "first") is False
+
+
+@pytest.mark.parametrize(
+    ("file_name", "expected_header"),
+    [
+        ("Ui_form.py", "# qt-dev-helper fingerprint: {}\n"),
+        ("Ui_form.h", "/* qt-dev-helper fingerprint: {} */\n"),
+        ("theme.qss", "/* qt-dev-helper fingerprint: {} */\n"),
+    ],
+)
+def test_output_fingerprint(tmp_path: Path, file_name: str, expected_header: str):
+    """Fingerprint headers are added or replaced and read from the first line."""
+    output_file = tmp_path / file_name
+    output_file.write_text("content\n")
+
+    assert read_output_fingerprint(output_file) is None
+    assert write_output_fingerprint(output_file, "first") is True
+    assert output_file.read_text() == f"{expected_header.format('first')}content\n"
+    assert read_output_fingerprint(output_file) == "first"
+
+    write_output_fingerprint(output_file, "second")
+
+    assert output_file.read_text() == f"{expected_header.format('second')}content\n"
+    assert read_output_fingerprint(output_file) == "second"
+
+
+def test_output_fingerprint_unsupported(tmp_path: Path):
+    """Missing files and file types without comments have no fingerprint."""
+    output_file = tmp_path / "resources.rcc"
+    output_file.write_bytes(b"qres")
+
+    assert write_output_fingerprint(output_file, "first") is False
+    assert read_output_fingerprint(output_file) is None
+    assert read_output_fingerprint(tmp_path / "missing.py") is None
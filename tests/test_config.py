@@ -118,6 +118,41 @@ def test_config_path_extraction(dummy_config: Config):
     assert generated_rc_code_folder == base_path / "outputs/ui_files"
 
 
+def test_config_style_paths(dummy_config: Config):
+    """Root style files and additional style files are combined."""
+    base_path = dummy_config.base_path
+
+    assert dummy_config.style_paths() == [dummy_config.root_style_paths()]
+
+    dummy_config.update(
+        {"style_files": [{"sass_file": "assets/styles/_consts.scss", "qss_file": "out/c.qss"}]}
+    )
+
+    assert dummy_config.style_paths() == [
+        dummy_config.root_style_paths(),
+        (base_path / "assets/styles/_consts.scss", base_path / "out/c.qss"),
+    ]
+
+    dummy_config.deactivate_style_build()
+
+    with pytest.raises(QtDevHelperConfigError) as exc_info:
+        dummy_config.style_paths()
+
+    assert str(exc_info.value) == "Neither 'root_sass_file' nor 'style_files' are defined."
+
+
+def test_config_validate_style_files_exist():
+    """Raise error if a 'sass_file' in 'style_files' does not exist."""
+    with pytest.raises(ValidationError) as exc_info:
+        Config(
+            base_path=TEST_DATA,
+            style_files=[{"sass_file": "not_a_path", "qss_file": "outputs/theme.qss"}],
+        )
+    assert "The values of 'sass_file' in 'style_files' need to be valid paths." in str(
+        exc_info.value
+    )
+
+
 def test_config_path_extraction_exception(dummy_config: Config):
     """Raise error if any path is None."""
     dummy_config.root_qss_file = None
@@ -141,7 +176,14 @@ def test_config_uic_kwargs(dummy_config: Config):
 def test_config_rcc_kwargs(dummy_config: Config):
     """Kwargs for rcc are same as in config."""
 
-    expected: RccKwargs = {"generator": "python", "rcc_args": ["--compress-algo", "zlib"]}
+    expected: RccKwargs = {
+        "generator": "python",
+        "rcc_args": ["--compress-algo", "zlib"],
+        "binary": False,
+        "lazy": False,
+        "shards": None,
+        "shard_strategy": "prefix",
+    }
 
     assert dummy_config.rcc_kwargs() == expected
 
@@ -152,6 +194,7 @@ def test_config_deactivate_style_build(dummy_config: Config):
 
     assert dummy_config.root_sass_file is None
     assert dummy_config.root_qss_file is None
+    assert dummy_config.style_files == []
 
 
 def test_config_deactivate_ui_build(dummy_config: Config):
@@ -196,6 +239,38 @@ def test_config_update_errors(dummy_config: Config):
     assert "Extra inputs are not permitted" in str(exec_info.value)
 
 
+def test_config_apply_profile(dummy_config: Config):
+    """Profiles override build options, can be switched and use separate caches."""
+    dummy_config.update(
+        {
+            "cache_folder": ".cache",
+            "rcc_args": ["--compress", "9"],
+            "profiles": {
+                "dev": {"rcc_args": ["--no-compress"]},
+                "release": {"qss_minify": True, "sass_output_style": "compressed"},
+            },
+        }
+    )
+
+    dummy_config.apply_profile("dev")
+
+    assert dummy_config.rcc_args == ["--no-compress"]
+    assert dummy_config.cache_path() == dummy_config.base_path / ".cache/profiles/dev"
+
+    dummy_config.apply_profile("release")
+
+    assert dummy_config.profile == "release"
+    assert dummy_config.rcc_args == ["--compress", "9"]
+    assert dummy_config.qss_minify is True
+    assert dummy_config.sass_output_style.value == "compressed"
+
+    with pytest.raises(QtDevHelperConfigError, match="available profiles: dev, release"):
+        dummy_config.apply_profile("unknown")
+
+    with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
+        dummy_config.update({"profiles": {"dev": {"ui_files_folder": "ui"}}})
+
+
 def test_load_toml_config(dummy_config: Config):
     """Load config from test toml config."""
 
@@ -205,6 +280,20 @@ def test_load_toml_config(dummy_config: Config):
     )
 
 
+def test_load_toml_config_profile(tmp_path: Path):
+    """The profile defined in the config is applied."""
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text(
+        '[tool.qt-dev-helper]\nprofile = "dev"\nqss_minify = true\n'
+        "[tool.qt-dev-helper.profiles.dev]\nqss_minify = false\n"
+    )
+
+    config = load_toml_config(config_file)
+
+    assert config.profile == "dev"
+    assert config.qss_minify is False
+
+
 def test_load_toml_config_no_tool_config(tmp_path: Path):
     """Load config without config for qt-dev-helper."""
     config_file = tmp_path / "pyproject.toml"
@@ -0,0 +1,58 @@
+"""Tests for ``qt_dev_helper.depfile``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from qt_dev_helper.depfile import depfile_path
+from qt_dev_helper.depfile import escape_make_path
+from qt_dev_helper.depfile import format_depfile
+from qt_dev_helper.depfile import write_depfile
+
+
+def test_escape_make_path():
+    """Spaces, comments and variables are escaped."""
+    assert escape_make_path("my assets/#1/$icon.svg") == "my\\ assets/\\#1/$$icon.svg"
+
+
+def test_format_depfile(tmp_path: Path):
+    """Paths are relative to the base path and each dependency has an empty rule."""
+    result = format_depfile(
+        tmp_path / "out/Ui_form.py",
+        [tmp_path / "form.ui", tmp_path / "icons.qrc", tmp_path / "form.ui"],
+        base_path=tmp_path,
+    )
+
+    assert result == ("out/Ui_form.py: \\\n  form.ui \\\n  icons.qrc\n\nform.ui:\n\nicons.qrc:\n")
+    assert format_depfile(tmp_path / "out.qss", []) == f"{(tmp_path / 'out.qss').as_posix()}:\n"
+
+
+@pytest.mark.parametrize(
+    ("depfile_folder", "expected"),
+    [
+        (None, "out/Ui_form.py.d"),
+        (Path("deps"), "deps/out/Ui_form.py.d"),
+    ],
+)
+def test_depfile_path(tmp_path: Path, depfile_folder: Path | None, expected: str):
+    """Depfiles are placed next to the output or mirrored into the depfile folder."""
+    if depfile_folder is not None:
+        depfile_folder = tmp_path / depfile_folder
+
+    assert depfile_path(
+        tmp_path / "out/Ui_form.py", depfile_folder=depfile_folder, base_path=tmp_path
+    ) == (tmp_path / expected)
+
+
+def test_write_depfile(tmp_path: Path):
+    """Depfiles are only written if their content changed."""
+    target = tmp_path / "out.qss"
+
+    assert write_depfile(target, [tmp_path / "in.scss"], base_path=tmp_path) == (
+        tmp_path / "out.qss.d"
+    )
+    assert write_depfile(target, [tmp_path / "in.scss"], base_path=tmp_path) is None
+    assert write_depfile(target, [tmp_path / "other.scss"], base_path=tmp_path) is not None
+    assert "other.scss:" in (tmp_path / "out.qss.d").read_text()
@@ -0,0 +1,120 @@
+"""Tests for ``qt_dev_helper.import_hook``."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qt_dev_helper import import_hook
+from qt_dev_helper.import_hook import QtAssetFinder
+from qt_dev_helper.import_hook import install_import_hook
+from qt_dev_helper.import_hook import uninstall_import_hook
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from qt_dev_helper.config import Config
+
+MODULE_NAMES = ("Ui_minimal", "test_resource_rc")
+
+
+@pytest.fixture
+def clean_modules() -> Generator[None, None, None]:
+    """Remove modules imported via the hook and installed finders after the test.
+
+    Resources are unregistered first, since Qt keeps pointers to the module data.
+    """
+    meta_path = list(sys.meta_path)
+    yield
+    sys.meta_path[:] = meta_path
+    for module_name in list(sys.modules):
+        if module_name.split(".")[-1] in MODULE_NAMES or module_name.startswith("hooked"):
+            module = sys.modules.pop(module_name)
+            if hasattr(module, "qCleanupResources"):
+                module.qCleanupResources()
+
+
+@pytest.mark.usefixtures("clean_modules")
+def test_import_hook_top_level(dummy_config: Config, tmp_path: Path):
+    """Forms and resources are compiled to the cache folder when they are imported."""
+    finder = install_import_hook(dummy_config)
+
+    assert sys.meta_path[0] is finder
+    assert finder.cache_folder == tmp_path / ".qt-dev-helper-cache/import_hook"
+    assert set(finder.sources) == {"Ui_minimal", "test_resource_rc"}
+
+    ui_module = importlib.import_module("Ui_minimal")
+
+    assert hasattr(ui_module, "Ui_MainWindow")
+    assert "test_resource_rc" in sys.modules
+    assert ui_module.__file__ == str(finder.cache_folder / "Ui_minimal.py")
+    assert "import test_resource_rc" in (finder.cache_folder / "Ui_minimal.py").read_text()
+    assert not (tmp_path / "outputs/ui_files").exists()
+
+    uninstall_import_hook(finder)
+
+    assert finder not in sys.meta_path
+
+
+def test_import_hook_staleness(
+    dummy_config: Config, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Modules are only compiled if they are missing or their inputs changed."""
+    finder = QtAssetFinder(dummy_config, cache_folder=tmp_path / "cache")
+    compiled: list[str] = []
+
+    def compile_ui_file(ui_file: Path, output_file: Path, **_: object) -> None:
+        compiled.append(ui_file.name)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text("")
+
+    monkeypatch.setattr(import_hook, "compile_ui_file", compile_ui_file)
+
+    assert finder.find_spec("Ui_minimal", None) is not None
+    assert finder.find_spec("Ui_minimal", None) is not None
+    assert compiled == ["minimal.ui"]
+
+    ui_file = tmp_path / "assets/ui_files/minimal.ui"
+    ui_file.write_text(ui_file.read_text() + "\n")
+
+    assert finder.is_stale("Ui_minimal") is True
+
+    finder.find_spec("Ui_minimal", None)
+
+    assert compiled == ["minimal.ui", "minimal.ui"]
+
+    dummy_config.uic_args = ["--no-autoconnection"]
+
+    assert finder.is_stale("Ui_minimal") is True
+    assert finder.find_spec("Ui_unknown", None) is None
+    assert finder.find_spec("package.Ui_minimal", None) is None
+
+
+def test_import_hook_resource_inputs(dummy_config: Config, tmp_path: Path):
+    """Resource modules are stale if a file referenced by the qrc file changed."""
+    finder = QtAssetFinder(dummy_config, cache_folder=tmp_path / "cache")
+    finder.compile_module("test_resource_rc")
+
+    assert finder.is_stale("test_resource_rc") is False
+
+    icon_file = next((tmp_path / "assets/icons").iterdir())
+    icon_file.write_bytes(icon_file.read_bytes() + b"\n")
+
+    assert finder.is_stale("test_resource_rc") is True
+
+
+@pytest.mark.usefixtures("clean_modules")
+def test_import_hook_package(dummy_config: Config, tmp_path: Path):
+    """Modules are provided in a namespace package and import resources relative to it."""
+    finder = install_import_hook(dummy_config, cache_folder=tmp_path / "cache", package="hooked")
+
+    ui_module = importlib.import_module("hooked.Ui_minimal")
+
+    assert hasattr(ui_module, "Ui_MainWindow")
+    assert "hooked.test_resource_rc" in sys.modules
+    assert "from . import test_resource_rc" in (finder.cache_folder / "Ui_minimal.py").read_text()
+    assert finder.find_spec("Ui_minimal", None) is None
@@ -0,0 +1,151 @@
+"""Tests for ``qt_dev_helper.ninja``."""
+
+from __future__ import annotations
+
+import shlex
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qt_dev_helper.config import CodeGenerators
+from qt_dev_helper.config import QtDevHelperConfigError
+from qt_dev_helper.ninja import NinjaWriter
+from qt_dev_helper.ninja import export_ninja
+from qt_dev_helper.ninja import main
+from qt_dev_helper.ninja import ninja_escape
+from qt_dev_helper.qt_tools import find_qt_tool
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from qt_dev_helper.config import Config
+
+
+def edge_command(ninja_text: str, output: str) -> list[str]:
+    """Command line arguments of the edge building ``output``."""
+    lines = ninja_text.splitlines()
+    edge_index = next(i for i, line in enumerate(lines) if line.startswith(f"build {output}:"))
+    return shlex.split(lines[edge_index + 1].removeprefix("  cmd = "))
+
+
+@pytest.mark.parametrize(
+    ("value", "path", "expected"),
+    [
+        ("a b:c", False, "a b:c"),
+        ("a b:c", True, "a$ b$:c"),
+        ("$var", False, "$$var"),
+    ],
+)
+def test_ninja_escape(value: str, path: bool, expected: str):
+    """Special characters are escaped depending on where the value is used."""
+    assert ninja_escape(value, path=path) == expected
+
+
+def test_ninja_writer(tmp_path: Path):
+    """Paths are written relative to the build folder with implicit dependencies."""
+    writer = NinjaWriter(tmp_path)
+    writer.rule("tool", "Running $out")
+    writer.build(
+        "tool",
+        [tmp_path / "out dir/out.py"],
+        [tmp_path / "in.txt"],
+        ["tool", "in.txt"],
+        implicit=[tmp_path / "b.txt", tmp_path / "a.txt", tmp_path / "b.txt"],
+    )
+    text = writer.text()
+
+    assert "build out$ dir/out.py: tool in.txt | a.txt b.txt\n  cmd = tool in.txt\n" in text
+    assert text.endswith("build qt_assets: phony out$ dir/out.py\ndefault qt_assets\n")
+
+
+def test_export_ninja(dummy_config: Config, tmp_path: Path):
+    """One edge per asset with the same arguments as the build functions."""
+    ninja_file = export_ninja(dummy_config)
+
+    assert ninja_file == tmp_path / "build.ninja"
+
+    ninja_text = ninja_file.read_text()
+
+    assert "build outputs/ui_files/Ui_minimal.py: uic assets/ui_files/minimal.ui\n" in ninja_text
+    assert edge_command(ninja_text, "outputs/ui_files/Ui_minimal.py") == [
+        find_qt_tool("uic"),
+        "assets/ui_files/minimal.ui",
+        "-o",
+        "outputs/ui_files/Ui_minimal.py",
+        "-g",
+        "python",
+        "--from-imports",
+        "--idbased",
+    ]
+    assert (
+        "build outputs/ui_files/test_resource_rc.py: rcc assets/test_resource.qrc"
+        " | assets/icons/circle.svg\n"
+    ) in ninja_text
+    assert edge_command(ninja_text, "outputs/ui_files/test_resource_rc.py") == [
+        find_qt_tool("rcc"),
+        "assets/test_resource.qrc",
+        "-o",
+        "outputs/ui_files/test_resource_rc.py",
+        "-g",
+        "python",
+        "--compress-algo",
+        "zlib",
+    ]
+    assert (
+        "build outputs/theme.qss: sass assets/styles/theme.scss | assets/styles/_consts.scss\n"
+    ) in ninja_text
+    assert edge_command(ninja_text, "outputs/theme.qss")[1:] == [
+        "-m",
+        "qt_dev_helper.ninja",
+        "assets/styles/theme.scss",
+        "outputs/theme.qss",
+        "--conformer",
+        "qt-dev-helper",
+        "--output-style",
+        "nested",
+    ]
+
+
+def test_export_ninja_output_path(dummy_config: Config, tmp_path: Path):
+    """Paths are relative to the folder of the Ninja file and missing parts are skipped."""
+    dummy_config.root_sass_file = None
+    dummy_config.rcc_binary = True
+    dummy_config.generator = CodeGenerators.cpp
+    dummy_config.ui_files_folder = None
+
+    ninja_text = export_ninja(dummy_config, tmp_path / "build/assets.ninja").read_text()
+
+    assert "rule sass" not in ninja_text
+    assert "rule uic" not in ninja_text
+    assert edge_command(ninja_text, "../outputs/ui_files/test_resource_rc.rcc")[1:4] == [
+        "../assets/test_resource.qrc",
+        "-o",
+        "../outputs/ui_files/test_resource_rc.rcc",
+    ]
+
+
+def test_export_ninja_unsupported(dummy_config: Config):
+    """Options needing more than a single tool call per asset raise an error."""
+    dummy_config.rcc_lazy = True
+    dummy_config.ui_registry = True
+
+    with pytest.raises(QtDevHelperConfigError, match=r"rcc_lazy, ui_registry$"):
+        export_ninja(dummy_config)
+
+
+def test_main(tmp_path: Path):
+    """Stylesheets are transpiled with the variables passed."""
+    (tmp_path / "theme.scss").write_text("$color: red !default;\nQWidget { color: $color; }\n")
+
+    main(
+        [
+            str(tmp_path / "theme.scss"),
+            str(tmp_path / "theme.qss"),
+            "--output-style",
+            "compressed",
+            "--variable",
+            "color=blue",
+        ]
+    )
+
+    assert "blue" in (tmp_path / "theme.qss").read_text()
@@ -0,0 +1,121 @@
+"""Tests for ``qt_dev_helper.qrc``."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qt_dev_helper.qrc import QrcEntry
+from qt_dev_helper.qrc import find_duplicate_resources
+from qt_dev_helper.qrc import group_by_prefix
+from qt_dev_helper.qrc import normalize_prefix
+from qt_dev_helper.qrc import prefix_identifier
+from qt_dev_helper.qrc import read_qrc
+from qt_dev_helper.qrc import split_entries
+from qt_dev_helper.qrc import write_qrc
+from tests import INPUT_TEST_DATA
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_read_qrc():
+    """File entries are read with resolved paths."""
+    entries = read_qrc(INPUT_TEST_DATA / "test_resource.qrc")
+
+    assert entries == [
+        QrcEntry(
+            prefix="/icons",
+            alias="icons/circle.svg",
+            file=(INPUT_TEST_DATA / "icons/circle.svg").resolve(),
+        )
+    ]
+    assert entries[0].resource_path == ":/icons/icons/circle.svg"
+
+
+def test_write_qrc(tmp_path: Path):
+    """Written qrc files keep prefixes, aliases, languages and file attributes."""
+    entries = [
+        QrcEntry("/a", "one.svg", tmp_path / "x/one.svg", attributes={"compress": "9"}),
+        QrcEntry("/b", "two.svg", tmp_path / "two.svg", lang="de"),
+        QrcEntry("/a", "three.svg", tmp_path / "three.svg"),
+    ]
+
+    qrc_file = write_qrc(entries, tmp_path / "out/written.qrc")
+
+    assert read_qrc(qrc_file) == [entries[0], entries[2], entries[1]]
+
+
+def test_group_by_prefix(tmp_path: Path):
+    """Entries are grouped by prefix in order of definition."""
+    entries = [
+        QrcEntry("/b", "one", tmp_path),
+        QrcEntry("/a", "two", tmp_path),
+        QrcEntry("/b", "three", tmp_path),
+    ]
+
+    assert group_by_prefix(entries) == {"/b": [entries[0], entries[2]], "/a": [entries[1]]}
+
+
+def test_normalize_prefix():
+    """Prefixes start with exactly one slash."""
+    assert normalize_prefix(None) == "/"
+    assert normalize_prefix("icons/") == "/icons"
+    assert normalize_prefix("//icons") == "/icons"
+
+
+def test_prefix_identifier():
+    """Identifiers are valid and unique."""
+    assert prefix_identifier("/icons/dark-mode") == "icons_dark_mode"
+    assert prefix_identifier("/") == "root"
+    assert prefix_identifier("/1x") == "_1x"
+    assert prefix_identifier("/icons", ["icons", "icons_1"]) == "icons_2"
+
+
+@pytest.mark.parametrize(
+    ("strategy", "expected_aliases"),
+    [
+        ("size", [["a1", "a2"], ["b1"], ["b2"]]),
+        ("prefix", [["a1", "a2"], ["b1", "b2"]]),
+    ],
+)
+def test_split_entries(tmp_path: Path, strategy: str, expected_aliases: list[list[str]]):
+    """Entries are split into contiguous shards of similar size."""
+    sizes = {"a1": 10, "a2": 10, "b1": 20, "b2": 20}
+    entries = []
+    for alias, size in sizes.items():
+        (tmp_path / alias).write_bytes(b"x" * size)
+        entries.append(QrcEntry(f"/{alias[0]}", alias, tmp_path / alias))
+
+    shards = split_entries(entries, 3, strategy=strategy)
+
+    assert [[entry.alias for entry in shard] for shard in shards] == expected_aliases
+    assert split_entries(entries, 1, strategy=strategy) == [entries]
+
+
+def test_find_duplicate_resources(tmp_path: Path):
+    """Identical content referenced by multiple qrc files is found."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a/icon.svg").write_text("icon")
+    (tmp_path / "b/copy.svg").write_text("icon")
+    (tmp_path / "a/unique.svg").write_text("unique")
+    (tmp_path / "a/a.qrc").write_text(
+        "<RCC><qresource><file>icon.svg</file><file alias='x.svg'>icon.svg</file>"
+        "<file>unique.svg</file></qresource></RCC>"
+    )
+    (tmp_path / "b/b.qrc").write_text("<RCC><qresource><file>copy.svg</file></qresource></RCC>")
+
+    duplicates = find_duplicate_resources([tmp_path / "a/a.qrc", tmp_path / "b/b.qrc"])
+
+    assert len(duplicates) == 1
+    assert duplicates[0].size == 4
+    assert duplicates[0].wasted_size == 4
+    assert duplicates[0].qrc_files == [tmp_path / "a/a.qrc", tmp_path / "b/b.qrc"]
+    assert [entry.resource_path for _, entry in duplicates[0].entries] == [
+        ":/icon.svg",
+        ":/x.svg",
+        ":/copy.svg",
+    ]
+    assert find_duplicate_resources([tmp_path / "a/a.qrc"]) == []
@@ -0,0 +1,136 @@
+"""Tests for ``qt_dev_helper.qss_conformer``."""
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING
+
+import pytest
+from qtsass import conformers as qtsass_conformers
+
+from qt_dev_helper.qss_conformer import qt_conform
+from qt_dev_helper.qss_conformer import scss_conform
+from qt_dev_helper.transpiler import transpile_sass
+from tests import EXPECTED_TEST_DATA
+from tests import INPUT_TEST_DATA
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def generate_stylesheet(block_count: int) -> str:
+    """Generate a large stylesheet using all qss features that need conforming."""
+    blocks = [
+        f"""QPushButton#button{index}:!hover {{
+  color: $font-color;
+  background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 rgba(1, 2, 3, 0.5), stop:1 blue);
+  border: 1px solid #{index % 999:03d};
+}}
+QFrame#frame{index} {{
+  background: qradialgradient(spread: pad, cx: 0.5, cy: 0.5, radius: 1, fx: 0.5, fy: 0.5,
+                              stop: 0 red, stop: 1 blue);
+  margin: {index % 7}px;
+}}
+QLabel#label{index} {{
+  background: qlineargradient(
+    x1: 0, y1: 0,
+    x2: 1, y2: 0,
+    stop: 0 red,
+    stop: 0.5 rgba(1, 2, 3, 4),
+    stop: 1 $bg-color
+  );
+}}
+"""
+        for index in range(block_count)
+    ]
+    return '@import "consts";\n' + "".join(blocks)
+
+
+@pytest.mark.parametrize(
+    "qss",
+    [
+        "QWidget:!hover { color: red; }",
+        "a { b: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 red, stop: 1 blue); }",
+        "a { b: qlineargradient(y2:1, x1:0.5, stop:0 rgba(1, 2, 3, 0.5), stop:1 $c ); }",
+        "a { b: qlineargradient(\n  x1: 0, y1: 0,\n  stop: 0 red,\n  stop: 1 blue\n); }",
+        "a { b: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1); }",
+        "a { b: qlineargradient(0, 0, 0, 1, (0 red, 1 blue)); }",
+        "a { b: qlineargradient(x1 : 0, stop: 0 red); }",
+        "a { b: qlineargradient(x1: 0, stop: 0\n red); }",
+        "a { b: qradialgradient(spread: repeat, cx: 0, radius: 1, stop: 0 red, stop: 1 blue); }",
+        (
+            "a { b: qlineargradient(x1: 0, stop: 0 red); }\n"
+            "c { d: qlineargradient(x1: 0, stop: 0 red); }"
+        ),
+        "a { b: qlineargradient(x1: 0, stop: 0 red",
+    ],
+)
+def test_scss_conform_same_as_qtsass(qss: str):
+    """Conformed scss is the same as with qtsass."""
+    assert scss_conform(qss) == qtsass_conformers.scss_conform(qss)
+
+
+def test_scss_conform_radial_gradient_without_spread():
+    """Spread defaults to 'pad' (qtsass would prepend it to the whole source)."""
+    qss = "a { b: qradialgradient(cx: 0, cy: 0, radius: 1, stop: 0 red, stop: 1 blue); }"
+
+    assert scss_conform(qss) == (
+        "a { b: qradialgradient('pad', 0, 0, 1, 0, 0, (0 red, 1 blue)); }"
+    )
+
+
+def test_qt_conform():
+    """Negation in selectors is restored."""
+    assert qt_conform(scss_conform("QWidget:!hover {}")) == "QWidget:!hover {}"
+
+
+def test_transpile_large_stylesheet_same_as_qtsass(tmp_path: Path):
+    """Both conformer implementations compile a large stylesheet to the same qss."""
+    sass_file = tmp_path / "large.scss"
+    sass_file.write_text(generate_stylesheet(200))
+    (tmp_path / "_consts.scss").write_text((INPUT_TEST_DATA / "styles/_consts.scss").read_text())
+
+    result = transpile_sass(sass_file, tmp_path / "large.qss").read_text()
+    expected = transpile_sass(sass_file, tmp_path / "expected.qss", conformer="qtsass")
+
+    assert result == expected.read_text()
+    assert "qlineargradient(x1: 0.0, y1: 0.0, x2: 0.0, y2: 1.0, stop: 0.0" in result
+    assert ":!hover" in result
+
+
+def test_transpile_sass_conformers_same_result(tmp_path: Path):
+    """Both conformer implementations reproduce the expected test data."""
+    sass_file = INPUT_TEST_DATA / "styles/theme.scss"
+    expected = (EXPECTED_TEST_DATA / "theme.qss").read_text()
+
+    for conformer in ("qt-dev-helper", "qtsass"):
+        qss_file = transpile_sass(sass_file, tmp_path / f"{conformer}.qss", conformer=conformer)
+        assert qss_file.read_text(encoding="utf8") == expected
+
+
+@pytest.mark.slow
+def test_scss_conform_large_same_as_qtsass():
+    """Conforming a large (~15k lines) stylesheet gives the same result as qtsass."""
+    qss = generate_stylesheet(850)
+
+    assert scss_conform(qss) == qtsass_conformers.scss_conform(qss)
+
+
+@pytest.mark.slow
+def test_scss_conform_benchmark():
+    """Conforming a large (~15k lines) stylesheet is at least twice as fast as with qtsass.
+
+    It is typically more than ten times faster, so the bound holds on a loaded machine.
+    Both implementations are timed alternately and the fastest runs are compared,
+    so load on the machine affects both timings alike.
+    """
+    qss = generate_stylesheet(850)
+    qtsass_times = []
+    qt_dev_helper_times = []
+    for _ in range(5):
+        qtsass_times.append(timeit.timeit(lambda: qtsass_conformers.scss_conform(qss), number=1))
+        qt_dev_helper_times.append(timeit.timeit(lambda: scss_conform(qss), number=1))
+    qtsass_time = min(qtsass_times)
+    qt_dev_helper_time = min(qt_dev_helper_times)
+
+    assert qt_dev_helper_time < qtsass_time / 2, f"{qt_dev_helper_time=} {qtsass_time=}"
@@ -0,0 +1,175 @@
+"""Tests for ``qt_dev_helper.qss_minifier``."""
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qt_dev_helper.qss_minifier import QssRule
+from qt_dev_helper.qss_minifier import merge_duplicate_rules
+from qt_dev_helper.qss_minifier import minify_qss
+from qt_dev_helper.qss_minifier import parse_qss
+from qt_dev_helper.transpiler import transpile_sass
+from tests import EXPECTED_TEST_DATA
+from tests.test_qss_conformer import generate_stylesheet
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+QSS = """/* Header comment */
+QPushButton , QLabel > QFrame {
+  color: red;  /* inline comment */
+  background: qlineargradient(x1: 0.0, y1: 0.0, x2: 0.0, y2: 1.0, stop: 0.0 red, stop: 1.0 blue);
+}
+
+QWidget {}
+QLabel { border: none; font-family: "A  {b}",  'c;d'; }
+QPushButton , QLabel > QFrame { margin: 1px; }
+QFrame { color: blue }
+QLabel { color: green; }
+QPushButton:!hover { color: white }
+"""
+
+
+def test_parse_qss():
+    """Comments and whitespace are removed, while strings are kept."""
+    result = parse_qss(QSS)
+
+    assert result[:3] == [
+        QssRule(
+            "QPushButton,QLabel>QFrame",
+            [
+                ("color", "red"),
+                (
+                    "background",
+                    "qlineargradient(x1:0.0,y1:0.0,x2:0.0,y2:1.0,stop:0.0 red,stop:1.0 blue)",
+                ),
+            ],
+        ),
+        QssRule("QWidget", []),
+        QssRule("QLabel", [("border", "none"), ("font-family", "\"A  {b}\",'c;d'")]),
+    ]
+    assert parse_qss("@charset 'utf8';\na { b { c: d; } }") == ["@charset 'utf8';", "a{b{c: d;}}"]
+
+
+def test_merge_duplicate_rules():
+    """Rules are only merged if no rule in between declares the same property."""
+    result = merge_duplicate_rules(parse_qss(QSS))
+
+    assert [rule.selector for rule in result if isinstance(rule, QssRule)] == [
+        "QPushButton,QLabel>QFrame",
+        "QWidget",
+        "QLabel",
+        "QFrame",
+        "QLabel",
+        "QPushButton:!hover",
+    ]
+    assert result[0].declarations[-1] == ("margin", "1px")
+    assert merge_duplicate_rules([QssRule("a", [("b", "c")]), QssRule("a", [("b", "d")])]) == [
+        QssRule("a", [("b", "c"), ("b", "d")])
+    ]
+    shorthand_rules = [
+        QssRule("a", [("color", "red")]),
+        QssRule("b", [("font", "20px")]),
+        QssRule("a", [("font-size", "8px")]),
+    ]
+    assert merge_duplicate_rules(shorthand_rules) == shorthand_rules
+    assert merge_duplicate_rules(["a{b{}}", QssRule("a"), "c{d{}}", QssRule("a")]) == [
+        "a{b{}}",
+        QssRule("a"),
+        "c{d{}}",
+        QssRule("a"),
+    ]
+
+
+def test_minify_qss():
+    """Minified qss parses to the same rules, without empty rules."""
+    result = minify_qss(QSS)
+
+    assert "\n" not in result
+    assert "/*" not in result
+    assert result.startswith("QPushButton,QLabel>QFrame{color:red;background:qlineargradient(")
+    assert "QWidget{" not in result
+
+    not_merged = minify_qss(QSS, merge_duplicates=False)
+
+    assert parse_qss(not_merged) == [rule for rule in parse_qss(QSS) if rule != QssRule("QWidget")]
+    assert minify_qss(result) == result
+
+
+def test_transpile_sass_minify(tmp_path: Path):
+    """Minified test data parses to the same rules."""
+    dist_path = transpile_sass(
+        EXPECTED_TEST_DATA / "theme.qss", tmp_path / "theme.qss", minify=True
+    )
+
+    assert dist_path.read_text() == "*{background-color:#1b1e23;color:#dce1ec}"
+
+
+def render_with_stylesheet(qapp, stylesheet: str):
+    """Render a widget tree styled with ``stylesheet`` to an image."""
+    from PySide6.QtWidgets import QFrame
+    from PySide6.QtWidgets import QLabel
+    from PySide6.QtWidgets import QPushButton
+    from PySide6.QtWidgets import QVBoxLayout
+    from PySide6.QtWidgets import QWidget
+
+    qapp.setStyleSheet(stylesheet)
+    widget = QWidget()
+    layout = QVBoxLayout(widget)
+    for child in (QPushButton("button"), QLabel("label"), QFrame()):
+        layout.addWidget(child)
+    widget.resize(200, 200)
+    image = widget.grab().toImage()
+    qapp.setStyleSheet("")
+    return image
+
+
+def test_minify_qss_same_rendering(qapp):
+    """Widgets styled with the minified stylesheet look the same."""
+    expected = render_with_stylesheet(qapp, QSS)
+
+    assert render_with_stylesheet(qapp, minify_qss(QSS)) == expected
+    assert render_with_stylesheet(qapp, "") != expected
+
+
+@pytest.mark.parametrize(
+    "qss",
+    [
+        "QLabel { color: red; }\nQFrame { font: 20px; }\nQLabel { font-size: 8px; }",
+        "QLabel { color: red }\nQFrame { border: 4px solid red }\nQLabel { border-color: blue }",
+    ],
+)
+def test_minify_qss_shorthand_rendering(qapp, qss: str):
+    """Rules are not merged across rules setting the same property via a shorthand."""
+    assert render_with_stylesheet(qapp, minify_qss(qss)) == render_with_stylesheet(qapp, qss)
+
+
+@pytest.mark.slow
+def test_minify_qss_load_time_benchmark(qapp, tmp_path: Path):
+    """Applying the minified version of a large stylesheet is not slower."""
+    sass_file = tmp_path / "large.scss"
+    sass_file.write_text(generate_stylesheet(1000).replace("\nQ", "\n/* Comment */\nQ"))
+    (tmp_path / "_consts.scss").write_text("$bg-color: #1b1e23;\n$font-color: #dce1ec;\n")
+    qss = transpile_sass(sass_file, tmp_path / "large.qss").read_text()
+    minified = minify_qss(qss)
+
+    def load_time(stylesheet: str) -> float:
+        def apply_stylesheet():
+            qapp.setStyleSheet(stylesheet)
+            qapp.setStyleSheet("")
+
+        return timeit.timeit(apply_stylesheet, number=20)
+
+    # Single loads take well below a millisecond, so loads are timed in batches
+    # and alternately, so load on the machine affects both timings alike
+    minified_times = []
+    original_times = []
+    for _ in range(7):
+        minified_times.append(load_time(minified))
+        original_times.append(load_time(qss))
+
+    assert len(minified) < len(qss) * 0.8
+    assert min(minified_times) < min(original_times) * 1.1
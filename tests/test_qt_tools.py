@@ -13,6 +13,7 @@ from qt_dev_helper.qt_tools import QtToolNotFoundError
 from qt_dev_helper.qt_tools import call_qt_tool
 from qt_dev_helper.qt_tools import extend_qt_tool_path
 from qt_dev_helper.qt_tools import find_qt_tool
+from qt_dev_helper.qt_tools import run_qt_tool
 
 if TYPE_CHECKING:
     from _pytest.capture import CaptureFixture
@@ -96,3 +97,14 @@ def test_call_qt_tool_exception():
         call_qt_tool("uic", arguments=("--invalid-option",))
 
     assert "Unknown option 'invalid-option'." in str(exc_info.value)
+
+
+def test_run_qt_tool(capfd: CaptureFixture):
+    """Output of the tool is returned instead of printed."""
+    assert b"Qt User Interface Compiler version" in run_qt_tool("uic", arguments=("--help",))
+    assert "Qt User Interface Compiler" not in capfd.readouterr().out
+
+    with pytest.raises(QtToolExecutionError) as exc_info:
+        run_qt_tool("uic", arguments=("--invalid-option",))
+
+    assert "Unknown option 'invalid-option'." in str(exc_info.value)
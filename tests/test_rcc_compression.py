@@ -0,0 +1,104 @@
+"""Tests for ``qt_dev_helper.rcc_compression``."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qt_dev_helper.qrc import read_qrc
+from qt_dev_helper.rcc_compression import CompressionChoice
+from qt_dev_helper.rcc_compression import CompressionTuner
+from qt_dev_helper.rcc_compression import choose_compression
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+TEXT = b"QWidget { color: red; }\n" * 200
+
+
+@pytest.mark.parametrize(
+    ("samples", "expected"),
+    [
+        ([TEXT], CompressionChoice("zlib", 6)),
+        ([b"a" * 100], CompressionChoice("none")),
+        ([os.urandom(5000)], CompressionChoice("none")),
+        ([TEXT[:64], TEXT[:64]], CompressionChoice("zlib", 1)),
+    ],
+)
+def test_choose_compression(samples: list[bytes], expected: CompressionChoice):
+    """Only compressible content is compressed, with the lowest sufficient level."""
+    assert choose_compression(samples) == expected
+
+
+def test_compression_choice_qrc_attributes():
+    """Attributes overwrite the rcc compression arguments."""
+    assert CompressionChoice("none").qrc_attributes() == {"compression-algorithm": "none"}
+    assert CompressionChoice("zlib", 9).qrc_attributes() == {
+        "compression-algorithm": "zlib",
+        "compress": "9",
+        "threshold": "0",
+    }
+    assert str(CompressionChoice("zlib", 9)) == "zlib level 9"
+
+
+@pytest.fixture
+def qrc_file(tmp_path: Path) -> Path:
+    """Qrc file referencing compressible, incompressible and manually configured files."""
+    (tmp_path / "style.qss").write_bytes(TEXT)
+    (tmp_path / "noise.bin").write_bytes(os.urandom(5000))
+    (tmp_path / "manual.qss").write_bytes(TEXT)
+    qrc_file = tmp_path / "tuned.qrc"
+    qrc_file.write_text(
+        '<RCC><qresource prefix="tuned"><file>style.qss</file><file>noise.bin</file>'
+        '<file compress="1">manual.qss</file></qresource></RCC>'
+    )
+    return qrc_file
+
+
+def test_compression_tuner_file(tmp_path: Path, qrc_file: Path):
+    """The compression of each file is set by attributes and recorded."""
+    record_file = tmp_path / "record.json"
+    tuner = CompressionTuner(record_file)
+
+    tuned_entries = tuner.tune_qrc(qrc_file, tmp_path / "out/tuned.qrc")
+    tuner.save()
+
+    assert [(tuned.entry.alias, str(tuned.choice)) for tuned in tuned_entries] == [
+        ("style.qss", "zlib level 6"),
+        ("noise.bin", "none"),
+    ]
+    assert [entry.attributes for entry in read_qrc(tmp_path / "out/tuned.qrc")] == [
+        {"compression-algorithm": "zlib", "compress": "6", "threshold": "0"},
+        {"compression-algorithm": "none"},
+        {"compress": "1"},
+    ]
+    assert len(json.loads(record_file.read_text())) == 2
+
+    record_file.write_text(
+        json.dumps(
+            {
+                key: {"algorithm": "none", "level": None}
+                for key in json.loads(record_file.read_text())
+            }
+        )
+    )
+    recorded_entries = CompressionTuner(record_file).tune_qrc(qrc_file, tmp_path / "tuned.qrc")
+
+    assert [(tuned.recorded, str(tuned.choice)) for tuned in recorded_entries] == [
+        (True, "none"),
+        (True, "none"),
+    ]
+
+
+def test_compression_tuner_qrc(tmp_path: Path, qrc_file: Path):
+    """All tunable files of a qrc file get the same compression."""
+    tuner = CompressionTuner(mode="qrc")
+
+    tuned_entries = tuner.tune_qrc(qrc_file, tmp_path / "out/tuned.qrc")
+
+    assert {tuned.choice for tuned in tuned_entries} == {CompressionChoice("zlib", 1)}
+    assert {tuned.recorded for tuned in tuned_entries} == {False}
+    tuner.save()
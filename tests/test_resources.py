@@ -0,0 +1,233 @@
+"""Tests for ``qt_dev_helper.resources``."""
+
+from __future__ import annotations
+
+import importlib
+import runpy
+from typing import TYPE_CHECKING
+
+import pytest
+
+import qt_dev_helper.resources as resources_module
+from qt_dev_helper.cache import BuildCache
+from qt_dev_helper.resources import compile_resource_file
+from qt_dev_helper.resources import compile_resource_to_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.monkeypatch import MonkeyPatch
+
+    from qt_dev_helper.config import Config
+
+
+def test_compile_resource_to_bytes(dummy_config: Config):
+    """Generated code and binary resources are returned without writing files."""
+    qrc_file = dummy_config.base_path / "assets/test_resource.qrc"
+
+    assert compile_resource_to_bytes(qrc_file) == (
+        compile_resource_file(qrc_file, dummy_config.base_path / "resource_rc.py").read_bytes()
+    )
+    assert compile_resource_to_bytes(qrc_file, binary=True).startswith(b"qres")
+
+
+def test_tranpile_resource_file(dummy_config: Config):
+    """Create python or cpp header from ui file."""
+    tmp_path = dummy_config.base_path
+    qrc_file = tmp_path / "assets/test_resource.qrc"
+    result1 = compile_resource_file(qrc_file, tmp_path / "resource.py")
+
+    assert "qt_resource_data" in result1.read_text()
+    assert "qt_resource_name" in result1.read_text()
+    assert "qt_resource_struct" in result1.read_text()
+
+    result2 = compile_resource_file(qrc_file, tmp_path / "resource.h", generator="cpp")
+
+    assert "static const unsigned char qt_resource_data[]" in result2.read_text()
+    assert "static const unsigned char qt_resource_name[]" in result2.read_text()
+    assert "static const unsigned char qt_resource_struct[]" in result2.read_text()
+
+
+def test_compile_resource_file_binary(qapp, tmp_path: Path):
+    """Binary resources are registered by importing the generated loader module."""
+    qt_core = pytest.importorskip("PySide6.QtCore")
+    qrc_file = tmp_path / "binary_resource.qrc"
+    qrc_file.write_text(
+        '<RCC><qresource prefix="binary"><file>binary.txt</file></qresource></RCC>'
+    )
+    (tmp_path / "binary.txt").write_text("binary")
+    loader_file = compile_resource_file(qrc_file, tmp_path / "binary_resource_rc.py", binary=True)
+    rcc_file = tmp_path / "binary_resource_rc.rcc"
+
+    assert loader_file == tmp_path / "binary_resource_rc.py"
+    assert rcc_file.read_bytes().startswith(b"qres")
+
+    namespace = runpy.run_path(str(loader_file))
+
+    assert qt_core.QFile(":/binary/binary.txt").exists() is True
+
+    namespace["qCleanupResources"]()
+
+    assert qt_core.QFile(":/binary/binary.txt").exists() is False
+    assert compile_resource_file(
+        qrc_file,
+        tmp_path / "binary_resource.h",
+        generator="cpp",
+        binary=True,
+    ) == (tmp_path / "binary_resource.rcc")
+
+
+def test_compile_resource_file_binary_binding(
+    request: FixtureRequest, tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    """The binary resource loader imports the binding used by the code 'rcc' generates."""
+    resources_module.rcc_binding.cache_clear()
+    request.addfinalizer(resources_module.rcc_binding.cache_clear)
+    (tmp_path / "binary_resource.qrc").write_text("<RCC><qresource/></RCC>")
+
+    def run_qt_tool(*_, arguments: Sequence[str]) -> bytes:
+        if "--binary" in arguments:
+            return b"qres"
+        return b"# Resource object code\n\nfrom PyQt6 import QtCore\n"
+
+    monkeypatch.setattr(resources_module, "run_qt_tool", run_qt_tool)
+    loader_file = compile_resource_file(
+        tmp_path / "binary_resource.qrc", tmp_path / "binary_resource_rc.py", binary=True
+    )
+
+    assert "from PyQt6.QtCore import QResource\n" in loader_file.read_text()
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_compile_resource_file_lazy(qapp, tmp_path: Path, monkeypatch: MonkeyPatch, binary: bool):
+    """Resources of a prefix are only registered when they are requested."""
+    qt_core = pytest.importorskip("PySide6.QtCore")
+    qrc_file = tmp_path / "lazy.qrc"
+    qrc_file.write_text(
+        "<RCC>"
+        f'<qresource prefix="lazy_{binary}/a"><file>a.txt</file></qresource>'
+        f'<qresource prefix="lazy_{binary}/b"><file>b.txt</file></qresource>'
+        "</RCC>"
+    )
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    module_name = f"lazy_{binary}_rc"
+
+    registry_file = compile_resource_file(
+        qrc_file, tmp_path / f"{module_name}.py", binary=binary, lazy=True
+    )
+
+    assert registry_file == tmp_path / f"{module_name}.py"
+    assert (tmp_path / f"{module_name}_lazy_{binary}_a.py").is_file()
+    assert (tmp_path / f"{module_name}_lazy_{binary}_b.py").is_file()
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registry = importlib.import_module(module_name)
+
+    assert qt_core.QFile(f":/lazy_{binary}/a/a.txt").exists() is False
+
+    registry.ensure_registered(f"lazy_{binary}/a")
+
+    assert qt_core.QFile(f":/lazy_{binary}/a/a.txt").exists() is True
+    assert qt_core.QFile(f":/lazy_{binary}/b/b.txt").exists() is False
+
+    assert hasattr(getattr(registry, f"lazy_{binary}_b"), "qCleanupResources")
+    assert qt_core.QFile(f":/lazy_{binary}/b/b.txt").exists() is True
+
+    with pytest.raises(AttributeError):
+        registry.not_a_prefix  # noqa: B018
+
+    registry.qCleanupResources()
+
+    assert qt_core.QFile(f":/lazy_{binary}/a/a.txt").exists() is False
+    assert qt_core.QFile(f":/lazy_{binary}/b/b.txt").exists() is False
+
+    registry.ensure_registered(f"lazy_{binary}/a")
+
+    assert qt_core.QFile(f":/lazy_{binary}/a/a.txt").exists() is True
+
+    registry.qCleanupResources()
+    qrc_file.write_text(
+        f'<RCC><qresource prefix="lazy_{binary}/a"><file>a.txt</file></qresource></RCC>'
+    )
+    compile_resource_file(qrc_file, registry_file, binary=binary, lazy=True)
+
+    assert (tmp_path / f"{module_name}_lazy_{binary}_a.py").is_file()
+    assert not (tmp_path / f"{module_name}_lazy_{binary}_b.py").exists()
+    assert not (tmp_path / f"{module_name}_lazy_{binary}_b.rcc").exists()
+
+
+def test_compile_resource_file_sharded(qapp, tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Shards are compiled independently and imported by the aggregating module."""
+    qt_core = pytest.importorskip("PySide6.QtCore")
+    file_names = [f"{index}.txt" for index in range(6)]
+    qrc_file = tmp_path / "sharded.qrc"
+    qrc_file.write_text(
+        '<RCC><qresource prefix="sharded">'
+        + "".join(f"<file>{file_name}</file>" for file_name in file_names)
+        + "</qresource></RCC>"
+    )
+    for file_name in file_names:
+        (tmp_path / file_name).write_text(file_name)
+    cache = BuildCache(tmp_path / "cache")
+    output_path = tmp_path / "out/sharded_rc.py"
+
+    compile_resource_file(qrc_file, output_path, shards=3, shard_strategy="size", cache=cache)
+
+    assert sorted(path.name for path in output_path.parent.glob("*.py")) == [
+        "sharded_rc.py",
+        "sharded_rc_shard0.py",
+        "sharded_rc_shard1.py",
+        "sharded_rc_shard2.py",
+    ]
+
+    monkeypatch.syspath_prepend(str(output_path.parent))
+    importlib.import_module("sharded_rc")
+
+    for file_name in file_names:
+        assert qt_core.QFile(f":/sharded/{file_name}").exists() is True
+
+    rcc_calls = []
+
+    def run_qt_tool(*_, **kwargs) -> bytes:
+        rcc_calls.append(kwargs)
+        return b""
+
+    monkeypatch.setattr(resources_module, "run_qt_tool", run_qt_tool)
+    (tmp_path / "0.txt").write_text("1.txt")
+    compile_resource_file(qrc_file, output_path, shards=3, shard_strategy="size", cache=cache)
+
+    assert len(rcc_calls) == 1
+
+    compile_resource_file(qrc_file, output_path, shards=2, shard_strategy="size", cache=cache)
+
+    assert not (output_path.parent / "sharded_rc_shard2.py").exists()
+
+
+def test_compile_resource_file_sharded_binary_cache(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Binary data of cached shards are verified and restored like their loader modules."""
+    qrc_file = tmp_path / "sharded.qrc"
+    qrc_file.write_text('<RCC><qresource prefix="sharded"><file>0.txt</file></qresource></RCC>')
+    (tmp_path / "0.txt").write_text("0")
+    cache = BuildCache(tmp_path / "cache", store_outputs=True)
+    output_path = tmp_path / "out/sharded_rc.py"
+    rcc_file = output_path.parent / "sharded_rc_shard0.rcc"
+
+    compile_resource_file(qrc_file, output_path, binary=True, shards=2, cache=cache)
+    cache.save()
+    rcc_data = rcc_file.read_bytes()
+    rcc_file.write_bytes(b"stale")
+
+    rcc_calls = []
+
+    def run_qt_tool(*_, **kwargs) -> bytes:
+        rcc_calls.append(kwargs)
+        return b""
+
+    monkeypatch.setattr(resources_module, "run_qt_tool", run_qt_tool)
+    compile_resource_file(qrc_file, output_path, binary=True, shards=2, cache=cache)
+
+    assert rcc_calls == []
+    assert rcc_file.read_bytes() == rcc_data
@@ -0,0 +1,93 @@
+"""Tests for ``qt_dev_helper.streaming``."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+import sass
+
+from qt_dev_helper.streaming import aiter_build
+from qt_dev_helper.streaming import iter_build
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+
+    from qt_dev_helper.config import Config
+    from qt_dev_helper.transpiler import BuildRecord
+
+
+def test_iter_build(dummy_config: Config, capsys: CaptureFixture):
+    """A record is yielded for each output, up to date outputs are cache hits."""
+    dummy_config.uic_args = []
+    dummy_config.cache_folder = ".qt-dev-helper-cache"
+    outputs_folder = (dummy_config.base_path / "outputs").resolve()
+
+    records = list(iter_build(dummy_config))
+
+    assert [(record.output.resolve(), record.kind, record.status) for record in records] == [
+        (outputs_folder / "theme.qss", "qss", "built"),
+        (outputs_folder / "ui_files/test_resource_rc.py", "resource", "built"),
+        (outputs_folder / "ui_files/Ui_minimal.py", "ui", "built"),
+    ]
+    assert all(record.duration > 0 and record.cache_hit is False for record in records)
+    assert "Creating: Ui_minimal.py" in capsys.readouterr().out
+
+    records = list(iter_build(dummy_config))
+
+    assert [record.kind for record in records] == ["qss", "resource", "ui"]
+    assert [record.status for record in records] == ["up-to-date", "built", "up-to-date"]
+    assert [record.cache_hit for record in records] == [True, False, True]
+
+
+def test_iter_build_error(dummy_config: Config):
+    """Errors of the build are raised after the records of finished outputs."""
+    dummy_config.deactivate_resource_build()
+    dummy_config.deactivate_ui_build()
+    (dummy_config.base_path / "assets/styles/theme.scss").write_text("QWidget {")
+    records = iter_build(dummy_config, lambda *_: None)
+
+    with pytest.raises(sass.CompileError):
+        next(records)
+
+
+def test_aiter_build(dummy_config: Config):
+    """The async variant yields the same records without blocking the event loop."""
+    dummy_config.deactivate_resource_build()
+    dummy_config.deactivate_ui_build()
+
+    async def collect() -> list[BuildRecord]:
+        return [record async for record in aiter_build(dummy_config, lambda *_: None)]
+
+    records = asyncio.run(collect())
+
+    assert [(record.output.name, record.status) for record in records] == [("theme.qss", "built")]
+
+
+def test_aiter_build_stop_early(dummy_config: Config):
+    """Closing the iterator early waits for the build without blocking the event loop."""
+    dummy_config.uic_args = []
+
+    async def first_record() -> tuple[BuildRecord, int]:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        records = aiter_build(dummy_config, lambda *_: None)
+        ticker = asyncio.create_task(tick())
+        record = await records.__anext__()
+        ticks_before_close = ticks
+        await records.aclose()
+        ticker.cancel()
+        return record, ticks - ticks_before_close
+
+    record, ticks_while_closing = asyncio.run(first_record())
+
+    assert record.kind == "qss"
+    assert (dummy_config.base_path / "outputs/ui_files/Ui_minimal.py").is_file()
+    assert ticks_while_closing > 0
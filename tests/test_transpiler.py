@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 import os
 import re
 import shutil
@@ -13,23 +14,34 @@ import pytest
 import tomli
 import tomli_w
 
+import qt_dev_helper.transpiler as transpiler_module
+from qt_dev_helper.cache import BuildCache
+from qt_dev_helper.cache import read_output_fingerprint
 from qt_dev_helper.config import Config
 from qt_dev_helper.config import RccKwargs
 from qt_dev_helper.config import UicKwargs
+from qt_dev_helper.qt_tools import call_qt_tool
 from qt_dev_helper.transpiler import build_all_assets
 from qt_dev_helper.transpiler import build_resources
 from qt_dev_helper.transpiler import build_uis
-from qt_dev_helper.transpiler import compile_resource_file
+from qt_dev_helper.transpiler import collect_sass_partials
 from qt_dev_helper.transpiler import compile_ui_file
+from qt_dev_helper.transpiler import compile_ui_to_str
+from qt_dev_helper.transpiler import override_sass_variables
 from qt_dev_helper.transpiler import transpile_sass
+from qt_dev_helper.transpiler import transpile_sass_files
+from qt_dev_helper.transpiler import transpile_sass_to_str
+from qt_dev_helper.ui_files import UiIndex
 from tests import EXPECTED_TEST_DATA
 from tests import INPUT_TEST_DATA
 from tests import REPO_ROOT
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from typing import Literal
 
     from _pytest.capture import CaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
 
 COMMENT_BLANK_LINE_PATTERN = re.compile(r"(\n\s*|\s*[/]{2}.+?)\n")
 HEADER_PATTERN = re.compile(
@@ -64,6 +76,97 @@ def test_transpile_sass(tmp_path: Path, dummy_config: Config):
     assert out_file.read_text(encoding="utf8") == expected
 
 
+def test_collect_sass_partials(dummy_config: Config):
+    """Imported partials are collected once and conformed."""
+    styles_folder = dummy_config.base_path / "assets/styles"
+    (styles_folder / "nested").mkdir()
+    (styles_folder / "nested/_colors.scss").write_text("$accent: red;")
+    (styles_folder / "_consts.scss").write_text(
+        '$bg-color: #1b1e23;\n$font-color: #dce1ec;\n@import "nested/colors";\n'
+    )
+
+    result = collect_sass_partials(styles_folder / "theme.scss")
+
+    assert list(result) == [
+        (styles_folder / "_consts.scss").resolve().as_posix(),
+        (styles_folder / "nested/_colors.scss").resolve().as_posix(),
+    ]
+
+    (styles_folder / "_consts.scss").write_text("changed")
+    assert collect_sass_partials(styles_folder / "theme.scss", result) == result
+
+
+def test_transpile_sass_files(dummy_config: Config):
+    """Multiple entry points sharing partials are compiled in parallel."""
+    styles_folder = dummy_config.base_path / "assets/styles"
+    light_sass = styles_folder / "light.scss"
+    light_sass.write_text(
+        '@import "consts";\n\nQWidget {\n  background-color: $font-color;\n}\n'
+    )
+    style_paths = [
+        (styles_folder / "theme.scss", dummy_config.base_path / "outputs/theme.qss"),
+        (light_sass, dummy_config.base_path / "outputs/light.qss"),
+    ]
+
+    result = transpile_sass_files(style_paths)
+
+    assert result == [qss_file.resolve() for _, qss_file in style_paths]
+    assert result[0].read_text(encoding="utf8") == (EXPECTED_TEST_DATA / "theme.qss").read_text()
+    assert result[1].read_text(encoding="utf8") == "QWidget {\n  background-color: #dce1ec; }\n"
+
+    assert transpile_sass_files(style_paths[:1]) == result[:1]
+
+
+def test_override_sass_variables():
+    """Declarations of overridden variables are replaced."""
+    source = "$bg-color: #1b1e23;\n  $font-color : #dce1ec;\n$other: 1px;\n"
+    variables = {"bg-color": "white", "$font-color": "black"}
+
+    assert override_sass_variables(source, variables) == (
+        "$bg-color: white;\n  $font-color : black;\n$other: 1px;\n"
+    )
+    assert override_sass_variables(source, variables, declare=True).startswith(
+        "$bg-color: white;\n$font-color: black;\n$bg-color: white;"
+    )
+
+
+def test_transpile_sass_files_variants(dummy_config: Config, capsys: CaptureFixture):
+    """Variants are compiled with overridden variables and skipped if cached."""
+    base_path = dummy_config.base_path
+    cache = BuildCache(base_path / ".cache")
+    kwargs = {
+        "variants": {"light": {"bg-color": "#ffffff"}, "dark": {}},
+        "cache": cache,
+        "base_path": base_path,
+    }
+
+    result = transpile_sass_files(dummy_config.style_paths(), **kwargs)
+
+    assert result == [
+        (base_path / f"outputs/{file_name}").resolve()
+        for file_name in ("theme.qss", "theme_light.qss", "theme_dark.qss")
+    ]
+    expected = (EXPECTED_TEST_DATA / "theme.qss").read_text()
+    assert result[0].read_text(encoding="utf8") == expected
+    assert result[1].read_text(encoding="utf8") == expected.replace("#1b1e23", "#ffffff")
+    assert result[2].read_text(encoding="utf8") == expected
+
+    (base_path / "assets/styles/_consts.scss").write_text(
+        "$bg-color: #1b1e23;\n$font-color: #000000;\n"
+    )
+    transpile_sass_files(dummy_config.style_paths(), **{**kwargs, "variants": {"light": {}}})
+    transpile_sass_files(dummy_config.style_paths(), **{**kwargs, "variants": {"light": {}}})
+
+    stdout, _ = capsys.readouterr()
+    assert stdout.splitlines()[3:] == [
+        "Creating: outputs/theme.qss",
+        "Creating: outputs/theme_light.qss",
+        "Up to date: outputs/theme.qss",
+        "Up to date: outputs/theme_light.qss",
+    ]
+    assert "#000000" in result[1].read_text(encoding="utf8")
+
+
 def test_tranpile_ui_file(dummy_config: Config):
     """Create python or cpp header from ui file."""
     tmp_path = dummy_config.base_path
@@ -82,21 +185,36 @@ def test_tranpile_ui_file(dummy_config: Config):
     generated_files_equal(result3, EXPECTED_TEST_DATA / "Ui_minimal.h")
 
 
-def test_tranpile_resource_file(dummy_config: Config):
-    """Create python or cpp header from ui file."""
-    tmp_path = dummy_config.base_path
-    qrc_file = tmp_path / "assets/test_resource.qrc"
-    result1 = compile_resource_file(qrc_file, tmp_path / "resource.py")
+@pytest.mark.parametrize("output_name", ["Ui_minimal.h", "my-form.v2.h", "1form.hpp", None])
+def test_compile_ui_to_str(dummy_config: Config, output_name: str | None):
+    """Generated code is returned as 'uic' would write it to the output file."""
+    ui_file = dummy_config.base_path / "assets/ui_files/minimal.ui"
+    output_file = dummy_config.base_path / "Ui_minimal.py"
+    call_qt_tool(
+        "uic", arguments=[ui_file.as_posix(), "-g", "python", "-o", output_file.as_posix()]
+    )
+
+    assert compile_ui_to_str(ui_file, form_import=False) == output_file.read_text()
+
+    output_file = dummy_config.base_path / (output_name or "ui_minimal.h")
+    call_qt_tool("uic", arguments=[ui_file.as_posix(), "-g", "cpp", "-o", output_file.as_posix()])
+
+    assert compile_ui_to_str(ui_file, generator="cpp", output_name=output_name) == (
+        output_file.read_text()
+        if output_name is not None
+        else output_file.read_text().replace("UI_MINIMAL_H", "MINIMAL_H")
+    )
 
-    assert "qt_resource_data" in result1.read_text()
-    assert "qt_resource_name" in result1.read_text()
-    assert "qt_resource_struct" in result1.read_text()
 
-    result2 = compile_resource_file(qrc_file, tmp_path / "resource.h", generator="cpp")
+def test_transpile_sass_to_str(dummy_config: Config):
+    """Qss is returned without writing files."""
+    sass_file = dummy_config.base_path / "assets/styles/theme.scss"
 
-    assert "static const unsigned char qt_resource_data[]" in result2.read_text()
-    assert "static const unsigned char qt_resource_name[]" in result2.read_text()
-    assert "static const unsigned char qt_resource_struct[]" in result2.read_text()
+    assert transpile_sass_to_str(sass_file, minify=True) == (
+        transpile_sass(sass_file, dummy_config.base_path / "theme.qss", minify=True).read_text(
+            encoding="utf8"
+        )
+    )
 
 
 @pytest.mark.parametrize(
@@ -155,7 +273,156 @@ def test_build_uis(
     stdout, stderr = capsys.readouterr()
 
     assert stderr == ""
-    assert stdout == f"Creating: {expected_rel_out_path}\n\n"
+    assert stdout == f"Creating: {expected_rel_out_path}\n"
+
+
+@pytest.fixture
+def colliding_ui_folder(tmp_path: Path) -> Path:
+    """Ui files with the same name in different folders."""
+    for rel_path in ("b/minimal.ui", "a/minimal.ui", "other.ui"):
+        ui_file = tmp_path / "ui" / rel_path
+        ui_file.parent.mkdir(parents=True, exist_ok=True)
+        ui_file.write_text("<ui/>")
+    return tmp_path / "ui"
+
+
+@pytest.mark.parametrize(
+    ("collision_policy", "expected"),
+    [
+        ("suffix", ["Ui_minimal_a.py", "Ui_minimal_b.py", "Ui_other.py"]),
+        ("structure", ["a/Ui_minimal.py", "b/Ui_minimal.py", "Ui_other.py"]),
+    ],
+)
+def test_ui_output_paths_collisions(
+    colliding_ui_folder: Path,
+    collision_policy: Literal["suffix", "structure"],
+    expected: list[str],
+):
+    """Colliding output paths are resolved and all paths are sorted by input file."""
+    logs: list[str] = []
+
+    result = transpiler_module.ui_output_paths(
+        colliding_ui_folder,
+        colliding_ui_folder / "out",
+        collision_policy=collision_policy,
+        log_function=logs.append,
+    )
+
+    assert [ui_file.relative_to(colliding_ui_folder).as_posix() for ui_file, _ in result] == [
+        "a/minimal.ui",
+        "b/minimal.ui",
+        "other.ui",
+    ]
+    assert [
+        out_file.relative_to(colliding_ui_folder / "out").as_posix() for _, out_file in result
+    ] == expected
+    assert logs == [
+        (
+            f"Output collision resolved with {collision_policy!r}: "
+            "Ui_minimal.py <= a/minimal.ui, b/minimal.ui"
+        )
+    ]
+
+
+def test_ui_output_paths_collisions_overwrite(colliding_ui_folder: Path):
+    """By default only the last colliding file is compiled, like it overwrote the others."""
+    logs: list[str] = []
+
+    result = transpiler_module.ui_output_paths(
+        colliding_ui_folder, colliding_ui_folder / "out", log_function=logs.append
+    )
+
+    assert [
+        (
+            ui_file.relative_to(colliding_ui_folder).as_posix(),
+            out_file.relative_to(colliding_ui_folder / "out").as_posix(),
+        )
+        for ui_file, out_file in result
+    ] == [("b/minimal.ui", "Ui_minimal.py"), ("other.ui", "Ui_other.py")]
+    assert logs == [
+        (
+            "Warning: output collision, only the last file is compiled: "
+            "Ui_minimal.py <= a/minimal.ui, b/minimal.ui"
+        )
+    ]
+
+
+def test_build_uis_collision_error(colliding_ui_folder: Path, monkeypatch: MonkeyPatch):
+    """Nothing is compiled if outputs collide with the 'error' policy."""
+    monkeypatch.setattr(transpiler_module, "compile_ui_file", pytest.fail)
+
+    with pytest.raises(transpiler_module.OutputCollisionError) as error:
+        build_uis(colliding_ui_folder, colliding_ui_folder / "out", collision_policy="error")
+
+    assert "Ui_minimal.py <= a/minimal.ui, b/minimal.ui" in str(error.value)
+
+
+def test_write_ui_registry(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Form classes are imported from their modules on first access."""
+    package_folder = tmp_path / "registry_forms"
+    ui_modules = []
+    for ui_name, class_name, module_path in (
+        ("main.ui", "MainWindow", "Ui_main.py"),
+        ("nested.ui", "ns::Dialog", "nested/Ui_nested.py"),
+        ("form1.ui", "Form", "Ui_form1.py"),
+        ("form2.ui", "Form", "Ui_form2.py"),
+    ):
+        ui_file = tmp_path / ui_name
+        ui_file.write_text(f"<ui><class>{class_name}</class></ui>")
+        module_file = package_folder / module_path
+        module_file.parent.mkdir(parents=True, exist_ok=True)
+        form_class = f"Ui_{class_name.rpartition('::')[2]}"
+        module_file.write_text(f"class {form_class}:\n    pass\n")
+        ui_modules.append((ui_file, module_file))
+    logs: list[str] = []
+
+    assert transpiler_module.write_ui_registry(
+        ui_modules, package_folder / "__init__.py", log_function=logs.append
+    )
+    assert logs == [
+        "Ambiguous form class 'Ui_Form' not registered, defined in: form1.ui, form2.ui"
+    ]
+    assert not transpiler_module.write_ui_registry(
+        ui_modules, package_folder / "__init__.py", log_function=logs.append
+    )
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        registry = importlib.import_module("registry_forms")
+
+        assert registry.__all__ == ["Ui_Dialog", "Ui_MainWindow"]
+        assert "registry_forms.Ui_main" not in sys.modules
+        assert registry.Ui_MainWindow.__module__ == "registry_forms.Ui_main"
+        assert registry.Ui_Dialog.__module__ == "registry_forms.nested.Ui_nested"
+        assert "registry_forms.Ui_form1" not in sys.modules
+        with pytest.raises(AttributeError):
+            registry.Ui_Form  # noqa: B018
+    finally:
+        for module_name in list(sys.modules):
+            if module_name.startswith("registry_forms"):
+                del sys.modules[module_name]
+
+
+def test_build_uis_registry(dummy_config: Config, capsys: CaptureFixture):
+    """The registry is only written if it changed and never overwrites other files."""
+    ui_files_folder, generated_ui_code_folder = dummy_config.ui_folder_paths()
+    registry_file = generated_ui_code_folder / "__init__.py"
+
+    assert build_uis(ui_files_folder, generated_ui_code_folder, registry=True)[-1] == registry_file
+    assert "FORM_MODULES = {'Ui_MainWindow': 'Ui_minimal'}" in registry_file.read_text()
+    assert build_uis(ui_files_folder, generated_ui_code_folder, registry=True) == [
+        generated_ui_code_folder / "Ui_minimal.py"
+    ]
+
+    registry_file.write_text("# Hand written\n")
+    build_uis(ui_files_folder, generated_ui_code_folder, registry=True)
+
+    assert registry_file.read_text() == "# Hand written\n"
+    assert [line for line in capsys.readouterr().out.splitlines() if "__init__" in line] == [
+        "Creating: __init__.py",
+        "Up to date: __init__.py",
+        "Skipping: __init__.py is not a generated form registry",
+    ]
 
 
 @pytest.mark.parametrize(
@@ -192,7 +459,131 @@ def test_build_resources(
     stdout, stderr = capsys.readouterr()
 
     assert stderr == ""
-    assert stdout == f"Creating: {expected_rel_out_path}\n\n"
+    assert stdout == f"Creating: {expected_rel_out_path}\n"
+
+
+def test_build_resources_shared(
+    qapp, tmp_path: Path, capsys: CaptureFixture, monkeypatch: MonkeyPatch
+):
+    """Files referenced by multiple qrc files are embedded once in a shared module."""
+    qt_core = pytest.importorskip("PySide6.QtCore")
+    resource_folder = tmp_path / "resources"
+    output_folder = tmp_path / "out"
+    (resource_folder / "first").mkdir(parents=True)
+    (resource_folder / "second").mkdir()
+    blob = os.urandom(50_000)
+    (resource_folder / "first/blob.bin").write_bytes(blob)
+    (resource_folder / "second/blob.bin").write_bytes(blob)
+    (resource_folder / "first/unique.txt").write_text("unique")
+    (resource_folder / "first/first.qrc").write_text(
+        '<RCC><qresource prefix="shared_first">'
+        "<file>blob.bin</file><file>unique.txt</file></qresource></RCC>"
+    )
+    (resource_folder / "second/second.qrc").write_text(
+        '<RCC><qresource prefix="shared_second"><file>blob.bin</file></qresource></RCC>'
+    )
+
+    build_resources(resource_folder, output_folder)
+
+    assert "Duplicate resource" not in capsys.readouterr().out
+
+    result = build_resources(resource_folder, output_folder, deduplication="share")
+
+    assert sorted(path.name for path in result) == [
+        "first_rc.py",
+        "second_rc.py",
+        "shared_resources_rc.py",
+    ]
+    assert (output_folder / "first_rc.py").stat().st_size < len(blob)
+    assert "Duplicate resource (50000 bytes): " in capsys.readouterr().out
+
+    monkeypatch.syspath_prepend(str(output_folder))
+    importlib.import_module("first_rc")
+    importlib.import_module("second_rc")
+
+    for resource_path in (
+        ":/shared_first/blob.bin",
+        ":/shared_first/unique.txt",
+        ":/shared_second/blob.bin",
+    ):
+        assert qt_core.QFile(resource_path).exists() is True
+
+
+def test_build_resources_optimize_assets(
+    qapp, tmp_path: Path, capsys: CaptureFixture, monkeypatch: MonkeyPatch
+):
+    """Optimized assets are compiled and cached in the build cache folder."""
+    qt_core = pytest.importorskip("PySide6.QtCore")
+    resource_folder = tmp_path / "resources"
+    resource_folder.mkdir()
+    svg = '<svg xmlns="http://www.w3.org/2000/svg">\n  <!-- comment -->\n  <g/>\n</svg>\n'
+    (resource_folder / "icon.svg").write_text(svg)
+    (resource_folder / "optimized.qrc").write_text(
+        '<RCC><qresource prefix="optimized"><file>icon.svg</file></qresource></RCC>'
+    )
+    cache = BuildCache(tmp_path / "cache")
+
+    build_resources(resource_folder, tmp_path / "out", optimize_assets=True, cache=cache)
+
+    assert capsys.readouterr().out.splitlines()[:3] == [
+        "Optimized: icon.svg saved 24 bytes (32%)",
+        "Asset optimization saved 24 bytes in 1 files",
+        "Creating: optimized_rc.py",
+    ]
+    assert len(list((tmp_path / "cache/optimized_assets").iterdir())) == 1
+
+    monkeypatch.syspath_prepend(str(tmp_path / "out"))
+    importlib.import_module("optimized_rc")
+    resource_file = qt_core.QFile(":/optimized/icon.svg")
+
+    assert resource_file.open(qt_core.QIODevice.OpenModeFlag.ReadOnly) is True
+    assert bytes(resource_file.readAll()) == b'<svg xmlns="http://www.w3.org/2000/svg"><g/></svg>'
+
+    build_resources(resource_folder, tmp_path / "out", optimize_assets=True, cache=cache)
+
+    assert capsys.readouterr().out.splitlines()[0] == (
+        "Asset optimization saved 24 bytes in 1 files"
+    )
+
+
+def test_build_resources_compression_tuning(
+    qapp, tmp_path: Path, capsys: CaptureFixture, monkeypatch: MonkeyPatch
+):
+    """Compression is chosen per file, recorded and applied by rcc."""
+    qt_core = pytest.importorskip("PySide6.QtCore")
+    resource_folder = tmp_path / "resources"
+    resource_folder.mkdir()
+    text = "QWidget { color: red; }\n" * 200
+    (resource_folder / "style.qss").write_text(text)
+    (resource_folder / "noise.bin").write_bytes(os.urandom(5000))
+    (resource_folder / "tuned.qrc").write_text(
+        '<RCC><qresource prefix="tuned"><file>style.qss</file><file>noise.bin</file>'
+        "</qresource></RCC>"
+    )
+    cache = BuildCache(tmp_path / "cache")
+
+    build_resources(resource_folder, tmp_path / "out", compression_tuning="file", cache=cache)
+
+    assert capsys.readouterr().out.splitlines()[:3] == [
+        "Compression: tuned.qrc::/tuned/style.qss zlib level 6",
+        "Compression: tuned.qrc::/tuned/noise.bin none",
+        "Creating: tuned_rc.py",
+    ]
+    assert (tmp_path / "cache/rcc_compression.json").is_file()
+
+    monkeypatch.syspath_prepend(str(tmp_path / "out"))
+    importlib.import_module("tuned_rc")
+
+    assert qt_core.QResource(":/tuned/style.qss").compressionAlgorithm() == (
+        qt_core.QResource.Compression.ZlibCompression
+    )
+    assert qt_core.QResource(":/tuned/noise.bin").compressionAlgorithm() == (
+        qt_core.QResource.Compression.NoCompression
+    )
+
+    build_resources(resource_folder, tmp_path / "out", compression_tuning="file", cache=cache)
+
+    assert capsys.readouterr().out.splitlines()[0] == "Creating: tuned_rc.py"
 
 
 @pytest.mark.parametrize("use_path", [True, False])
@@ -211,12 +602,262 @@ def test_build_all_assets_(dummy_config: Config, capsys: CaptureFixture, use_pat
     assert stdout == "\n".join(
         (
             "Creating: outputs/theme.qss",
+            "Creating: test_resource_rc.py",
             "Creating: Ui_minimal.py\n",
-            "Creating: test_resource_rc.py\n\n",
         )
     )
 
 
+def test_build_all_assets_cached(dummy_config: Config, capsys: CaptureFixture):
+    """Unchanged styles are not rebuilt when caching is enabled."""
+    dummy_config.cache_folder = ".qt-dev-helper-cache"
+    dummy_config.deactivate_ui_build()
+    dummy_config.deactivate_resource_build()
+
+    build_all_assets(dummy_config)
+    result = build_all_assets(dummy_config)
+
+    assert result == [(dummy_config.base_path / "outputs/theme.qss").resolve()]
+    assert (dummy_config.base_path / ".qt-dev-helper-cache/build_cache.json").is_file()
+
+    stdout, _ = capsys.readouterr()
+
+    assert stdout.splitlines()[0] == "Creating: outputs/theme.qss"
+    assert stdout.splitlines()[3] == "Up to date: outputs/theme.qss"
+
+
+def test_build_all_assets_profiles(dummy_config: Config, capsys: CaptureFixture):
+    """Switching build profiles restores cached outputs instead of rebuilding them."""
+    dummy_config.update(
+        {
+            "cache_folder": ".qt-dev-helper-cache",
+            "profiles": {"dev": {}, "release": {"sass_output_style": "compressed"}},
+        }
+    )
+    dummy_config.deactivate_ui_build()
+    dummy_config.deactivate_resource_build()
+    qss_file = dummy_config.base_path / "outputs/theme.qss"
+
+    dummy_config.apply_profile("dev")
+    build_all_assets(dummy_config)
+    dev_qss = qss_file.read_text()
+    dummy_config.apply_profile("release")
+    build_all_assets(dummy_config)
+
+    assert qss_file.read_text() != dev_qss
+    assert "\n" not in qss_file.read_text().strip()
+
+    dummy_config.apply_profile("dev")
+    build_all_assets(dummy_config)
+
+    assert qss_file.read_text() == dev_qss
+    assert "Up to date: outputs/theme.qss" in capsys.readouterr().out.splitlines()
+
+
+def test_build_all_assets_profile_then_default(dummy_config: Config, capsys: CaptureFixture):
+    """Outputs of a profile build are rebuilt by a build without profile."""
+    dummy_config.update(
+        {
+            "cache_folder": ".qt-dev-helper-cache",
+            "profiles": {"release": {"sass_output_style": "compressed", "qss_minify": True}},
+        }
+    )
+    dummy_config.deactivate_ui_build()
+    dummy_config.deactivate_resource_build()
+    release_config = dummy_config.model_copy(deep=True)
+    release_config.apply_profile("release")
+    qss_file = dummy_config.base_path / "outputs/theme.qss"
+
+    build_all_assets(dummy_config)
+    default_qss = qss_file.read_text()
+    build_all_assets(release_config)
+
+    assert qss_file.read_text() != default_qss
+
+    capsys.readouterr()
+    build_all_assets(dummy_config)
+
+    assert qss_file.read_text() == default_qss
+    assert "Creating: outputs/theme.qss" in capsys.readouterr().out.splitlines()
+
+
+def test_build_all_assets_ui_index(dummy_config: Config):
+    """The metadata of built ui files are stored in the cache folder."""
+    dummy_config.uic_args = []
+    dummy_config.cache_folder = ".qt-dev-helper-cache"
+    dummy_config.deactivate_style_build()
+    dummy_config.deactivate_resource_build()
+
+    build_all_assets(dummy_config)
+
+    index_file = dummy_config.base_path / ".qt-dev-helper-cache/ui_index.json"
+    ui_file = dummy_config.base_path / "assets/ui_files/minimal.ui"
+
+    assert ui_file.resolve().as_posix() in index_file.read_text()
+    assert UiIndex(index_file).get(ui_file).resources == ["../test_resource.qrc"]
+
+
+def test_ui_dependency_edges(tmp_path: Path):
+    """Forms depend on the code of included resources and local custom widget headers."""
+    (tmp_path / "forms").mkdir()
+    ui_file = tmp_path / "forms/settings.ui"
+    ui_file.write_text(
+        "<ui><class>Settings</class>"
+        "<customwidgets>"
+        "<customwidget><class>Picker</class><header>picker.h</header></customwidget>"
+        "<customwidget><class>Preview</class><header>preview.h</header></customwidget>"
+        "<customwidget><class>Global</class><header location='global'>picker.h</header>"
+        "</customwidget></customwidgets>"
+        "<resources><include location='../icons.qrc'/><include location='other.qrc'/>"
+        "</resources></ui>"
+    )
+    (tmp_path / "forms/picker.py").write_text("")
+    out_file = tmp_path / "out/Ui_settings.py"
+
+    edges = transpiler_module.ui_dependency_edges(
+        [(ui_file, out_file)],
+        [(tmp_path / "icons.qrc", tmp_path / "out/icons_rc.py")],
+        UiIndex(),
+    )
+
+    assert edges == {
+        out_file: [
+            tmp_path / "out/icons_rc.py",
+            tmp_path / "forms/other.qrc",
+            tmp_path / "forms/picker.py",
+        ]
+    }
+
+
+def test_build_all_assets_ui_dependencies(dummy_config: Config, capsys: CaptureFixture):
+    """Forms are only rebuilt if they or the code of included resources changed."""
+    dummy_config.uic_args = []
+    dummy_config.cache_folder = ".qt-dev-helper-cache"
+    dummy_config.deactivate_style_build()
+
+    build_all_assets(dummy_config)
+    capsys.readouterr()
+    build_all_assets(dummy_config)
+
+    assert "Up to date: Ui_minimal.py" in capsys.readouterr().out.splitlines()
+
+    icon_file = dummy_config.base_path / "assets/icons/circle.svg"
+    icon_file.write_text(icon_file.read_text().replace("circle", "circle "))
+    build_all_assets(dummy_config)
+    logs = [line for line in capsys.readouterr().out.splitlines() if line]
+
+    assert logs[1:] == ["Creating: test_resource_rc.py", "Creating: Ui_minimal.py"]
+
+
+def test_build_all_assets_compile_bytecode(dummy_config: Config, capsys: CaptureFixture):
+    """Changed generated modules are compiled to bytecode after building."""
+    dummy_config.uic_args = []
+    dummy_config.compile_bytecode = True
+    dummy_config.deactivate_style_build()
+
+    build_all_assets(dummy_config)
+
+    pycache_folder = dummy_config.base_path / "outputs/ui_files/__pycache__"
+    assert sorted(path.name.split(".")[0] for path in pycache_folder.iterdir()) == [
+        "Ui_minimal",
+        "test_resource_rc",
+    ]
+    assert "Compiling bytecode: outputs/ui_files/Ui_minimal.py" in capsys.readouterr().out
+
+    dummy_config.deactivate_resource_build()
+    build_all_assets(dummy_config)
+
+    assert "Compiling bytecode" not in capsys.readouterr().out
+
+
+def test_build_all_assets_compile_bytecode_generated_only(dummy_config: Config):
+    """Hand-written modules in the generated code folder are not compiled."""
+    dummy_config.uic_args = []
+    dummy_config.compile_bytecode = True
+    dummy_config.deactivate_style_build()
+    dummy_config.update({"rcc_shards": 2})
+    generated_folder = dummy_config.base_path / "outputs/ui_files"
+    generated_folder.mkdir(parents=True, exist_ok=True)
+    (generated_folder / "handwritten.py").write_text("def broken(:\n")
+
+    build_all_assets(dummy_config)
+
+    pycache_folder = generated_folder / "__pycache__"
+    assert sorted(path.name.split(".")[0] for path in pycache_folder.iterdir()) == [
+        "Ui_minimal",
+        "test_resource_rc",
+        "test_resource_rc_shard0",
+    ]
+
+
+def test_build_all_assets_output_fingerprints(dummy_config: Config, capsys: CaptureFixture):
+    """Outputs with matching fingerprint header are skipped without a build cache."""
+    dummy_config.uic_args = []
+    dummy_config.output_fingerprints = True
+
+    build_all_assets(dummy_config)
+    capsys.readouterr()
+    outputs_folder = dummy_config.base_path / "outputs"
+
+    assert (outputs_folder / "theme.qss").read_text().startswith("/* qt-dev-helper fingerprint: ")
+    assert (outputs_folder / "ui_files/Ui_minimal.py").read_text().startswith("# qt-dev-helper")
+    assert read_output_fingerprint(outputs_folder / "ui_files/test_resource_rc.py") is not None
+
+    build_all_assets(dummy_config)
+    logs = [line for line in capsys.readouterr().out.splitlines() if line]
+
+    assert logs == [
+        "Up to date: outputs/theme.qss",
+        "Up to date: test_resource_rc.py",
+        "Up to date: Ui_minimal.py",
+    ]
+
+    ui_file = dummy_config.base_path / "assets/ui_files/minimal.ui"
+    ui_file.write_text(ui_file.read_text() + "\n")
+    build_all_assets(dummy_config)
+
+    assert "Creating: Ui_minimal.py" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("depfile_folder", "depfile_prefix"),
+    [(None, ""), ("deps", "deps/")],
+)
+def test_build_all_assets_depfiles(
+    dummy_config: Config, capsys: CaptureFixture, depfile_folder: str | None, depfile_prefix: str
+):
+    """A depfile listing all inputs is written for each output."""
+    dummy_config.uic_args = []
+    dummy_config.depfiles = True
+    dummy_config.depfile_folder = depfile_folder
+
+    build_all_assets(dummy_config)
+
+    assert {
+        path.relative_to(dummy_config.base_path).as_posix()
+        for path in dummy_config.base_path.rglob("*.d")
+    } == {
+        f"{depfile_prefix}outputs/theme.qss.d",
+        f"{depfile_prefix}outputs/ui_files/test_resource_rc.py.d",
+        f"{depfile_prefix}outputs/ui_files/Ui_minimal.py.d",
+    }
+    ui_depfile = dummy_config.base_path / f"{depfile_prefix}outputs/ui_files/Ui_minimal.py.d"
+    assert ui_depfile.read_text() == (
+        "outputs/ui_files/Ui_minimal.py: \\\n"
+        "  assets/ui_files/minimal.ui \\\n"
+        "  outputs/ui_files/test_resource_rc.py\n"
+        "\n"
+        "assets/ui_files/minimal.ui:\n"
+        "\n"
+        "outputs/ui_files/test_resource_rc.py:\n"
+    )
+    assert f"Creating: {depfile_prefix}outputs/theme.qss.d" in capsys.readouterr().out
+
+    build_all_assets(dummy_config)
+
+    assert ".d" not in capsys.readouterr().out
+
+
 def test_build_all_assets_no_config(tmp_path: Path, capsys: CaptureFixture):
     """No error if parts of the config are missing."""
     empty_config = Config(base_path=tmp_path)
@@ -230,8 +871,8 @@ def test_build_all_assets_no_config(tmp_path: Path, capsys: CaptureFixture):
     assert stdout == "\n".join(
         (
             "No style files to compile fund in config!",
-            "No ui folders fund in config!",
-            "No resource folders fund in config!\n",
+            "No resource folders fund in config!",
+            "No ui folders fund in config!\n",
         )
     )
 
@@ -0,0 +1,166 @@
+"""Tests for ``qt_dev_helper.ui_files``."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import qt_dev_helper.ui_files as ui_files_module
+from qt_dev_helper.ui_files import CustomWidget
+from qt_dev_helper.ui_files import UiIndex
+from qt_dev_helper.ui_files import UiMetadata
+from qt_dev_helper.ui_files import parse_ui_metadata
+from qt_dev_helper.ui_files import read_form_class
+from qt_dev_helper.ui_files import read_ui_metadata
+from tests import INPUT_TEST_DATA
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("<ui><class>Dialog</class><widget name='Other'/></ui>", "Ui_Dialog"),
+        ("<ui><class> app::Settings </class></ui>", "Ui_Settings"),
+        ("<ui><widget class='QWidget' name='Form'><class>Nested</class></widget></ui>", "Ui_Form"),
+        (
+            "<ui><customwidgets><customwidget><class>Custom</class></customwidget></customwidgets></ui>",
+            None,
+        ),
+        ("not a ui file", None),
+    ],
+)
+def test_read_form_class(tmp_path: Path, content: str, expected: str | None):
+    """The class name is read from the top level class element or widget."""
+    ui_file = tmp_path / "form.ui"
+    ui_file.write_text(content)
+
+    assert read_form_class(ui_file) == expected
+
+
+def test_read_form_class_test_data():
+    """Class name of the test data form."""
+    assert read_form_class(INPUT_TEST_DATA / "ui_files/minimal.ui") == "Ui_MainWindow"
+
+
+UI_CONTENT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>Settings</class>
+ <widget class="QDialog" name="Settings">
+  <property name="windowTitle">
+   <string>Settings</string>
+  </property>
+  <widget class="ColorPicker" name="picker">
+   <property name="toolTip">
+    <string comment="tooltip">Pick a color</string>
+   </property>
+   <property name="objectName">
+    <string notr="true">picker</string>
+   </property>
+  </widget>
+  <widget class="QLabel" name="label">
+   <property name="text">
+    <string>Settings</string>
+   </property>
+  </widget>
+ </widget>
+ <customwidgets>
+  <customwidget>
+   <class>ColorPicker</class>
+   <extends>QWidget</extends>
+   <header location="global">widgets/color_picker.h</header>
+  </customwidget>
+  <customwidget>
+   <class>Preview</class>
+   <extends>QFrame</extends>
+   <header>preview.h</header>
+  </customwidget>
+ </customwidgets>
+ <resources>
+  <include location="../test_resource.qrc"/>
+ </resources>
+</ui>
+"""
+
+
+def test_parse_ui_metadata():
+    """All metadata are collected in one pass."""
+    metadata = parse_ui_metadata(UI_CONTENT)
+
+    assert metadata == UiMetadata(
+        form_class="Ui_Settings",
+        custom_widgets=[
+            CustomWidget("ColorPicker", "QWidget", "widgets/color_picker.h", global_include=True),
+            CustomWidget("Preview", "QFrame", "preview.h"),
+        ],
+        resources=["../test_resource.qrc"],
+        translatable_strings=["Settings", "Pick a color"],
+    )
+    assert metadata.resource_files("assets/ui_files/settings.ui") == [
+        Path("assets/ui_files/../test_resource.qrc")
+    ]
+    assert parse_ui_metadata(b"not a ui file") == UiMetadata()
+
+
+def test_parse_ui_metadata_memory():
+    """Memory used while parsing does not grow with the number of widgets."""
+
+    def peak_memory(widget_count: int) -> int:
+        widgets = "".join(
+            f'<widget class="QLabel" name="label{index}"><property name="text">'
+            f'<string notr="true">{index}</string></property></widget>'
+            for index in range(widget_count)
+        )
+        content = (
+            '<ui version="4.0"><class>Form</class><widget class="QWidget" name="Form">'
+            f'<layout class="QVBoxLayout" name="layout"><item>{widgets}</item></layout>'
+            "</widget></ui>"
+        ).encode()
+        tracemalloc.start()
+        try:
+            assert parse_ui_metadata(content).form_class == "Ui_Form"
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    assert peak_memory(20_000) < 2 * peak_memory(1_000)
+
+
+def test_read_ui_metadata_test_data():
+    """The test data form includes the test resources."""
+    metadata = read_ui_metadata(INPUT_TEST_DATA / "ui_files/minimal.ui")
+
+    assert metadata.form_class == "Ui_MainWindow"
+    assert metadata.resources == ["../test_resource.qrc"]
+
+
+def test_ui_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Ui files are only parsed again if their content changed."""
+    ui_file = tmp_path / "settings.ui"
+    ui_file.write_bytes(UI_CONTENT)
+    index_file = tmp_path / "cache/ui_index.json"
+    parsed: list[bytes] = []
+
+    def mock_parse(content: bytes) -> UiMetadata:
+        parsed.append(content)
+        return parse_ui_metadata(content)
+
+    monkeypatch.setattr(ui_files_module, "parse_ui_metadata", mock_parse)
+
+    index = UiIndex(index_file)
+    index.get(ui_file)
+    index.save()
+
+    assert UiIndex(index_file).get(ui_file) == parse_ui_metadata(UI_CONTENT)
+    assert len(parsed) == 1
+
+    ui_file.write_bytes(UI_CONTENT.replace(b"Settings</class>", b"Options</class>"))
+
+    assert UiIndex(index_file).get(ui_file).form_class == "Ui_Options"
+    assert len(parsed) == 2
+
+    ui_file.unlink()
+    index.save()
+
+    assert json.loads(index_file.read_text()) == {}
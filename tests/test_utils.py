@@ -45,6 +45,7 @@ def test_find_matching_files(
     result = find_matching_files([tmp_path], "*.ui", recurse_folder=recurse_folder)
 
     assert len(result) == max_index - 1
+    assert result == tuple(sorted(result))
 
     for expected in nested_ui_folder[1:max_index]:
         assert expected.as_posix() in result